@@ -1 +1,17 @@
 RETRIES = 30
+CONNECTION_LIMIT = 100
+CONNECTION_LIMIT_PER_HOST = 8
+FETCH_CONCURRENCY = 8
+MAX_CONCURRENCY = 64
+DISCOVERY_CACHE_DIR = "~/.cache/badfish/discovery"
+DISCOVERY_CACHE_MAX_AGE = 24 * 60 * 60
+TOKEN_STORE_PATH = "~/.cache/badfish/sessions.json"
+# iDRAC closes sessions left idle for 30 minutes by default
+TOKEN_STORE_MAX_AGE = 30 * 60
+SESSION_LOCK_DIR = "~/.cache/badfish/locks"
+SESSION_SLOT_WAIT = 10 * 60
+SESSION_SLOT_POLL = 1.0
+# Attempts at opening a session while the BMC session table is full
+SESSION_LIMIT_ATTEMPTS = 8
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 32 * 1024 * 1024
@@ -0,0 +1,133 @@
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+class _Entry:
+    __slots__ = ("value", "stored", "expires", "size")
+
+    def __init__(self, value: Any, stored: float, expires: Optional[float], size: int):
+        self.value = value
+        self.stored = stored
+        self.expires = expires
+        self.size = size
+
+
+class ResponseCache:
+    """Cache of GET results keyed by URI, with per-entry TTLs.
+
+    Entries are stored under ``(uri, variant)`` so the same resource fetched in
+    different ways (raw response, parsed JSON, with or without token) can be
+    cached side by side and still be invalidated together by URI. Readers can
+    bound how old an entry they accept with ``max_age``; ``max_age=0`` always
+    misses, which is what pollers of volatile resources want.
+
+    The cache is bounded by number of entries and by their total size in
+    bytes, evicting the least recently used entries first.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        default_ttl: Optional[float] = None,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._size = 0
+        self._entries: "OrderedDict[Tuple[str, Hashable], _Entry]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Total size in bytes of the cached entries."""
+        return self._size
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+    def get(self, uri: str, variant: Hashable = None, max_age: Optional[float] = None) -> Tuple[bool, Any]:
+        """Return ``(True, value)`` for a usable entry, ``(False, None)`` otherwise."""
+        key = (uri, variant)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        now = time.monotonic()
+        if entry.expires is not None and now >= entry.expires:
+            self._remove(key)
+            self.misses += 1
+            return False, None
+        if max_age is not None and now - entry.stored >= max_age:
+            self.misses += 1
+            return False, None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return True, entry.value
+
+    def set(
+        self,
+        uri: str,
+        value: Any,
+        variant: Hashable = None,
+        ttl: Optional[float] = None,
+        size: Optional[int] = None,
+    ) -> None:
+        """Store ``value``; ``size`` defaults to its length for bytes and strings, 0 otherwise.
+
+        Values larger than the whole cache are not stored.
+        """
+        key = (uri, variant)
+        if size is None:
+            size = len(value) if isinstance(value, (bytes, str)) else 0
+        if key in self._entries:
+            self._remove(key)
+        if size > self.max_bytes:
+            return
+        now = time.monotonic()
+        ttl = self.default_ttl if ttl is None else ttl
+        self._entries[key] = _Entry(value, now, now + ttl if ttl is not None else None, size)
+        self._size += size
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: Tuple[str, Hashable]) -> None:
+        self._size -= self._entries.pop(key).size
+
+    def invalidate(self, uri: Optional[str] = None, prefix: Optional[str] = None) -> int:
+        """Drop the entries of ``uri`` and/or of every URI starting with ``prefix``.
+
+        Returns the number of entries removed.
+        """
+        stale = [
+            key
+            for key in self._entries
+            if (uri is not None and key[0] == uri) or (prefix is not None and key[0].startswith(prefix))
+        ]
+        for key in stale:
+            self._remove(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
@@ -0,0 +1,68 @@
+import json
+import os
+import tempfile
+import time
+from typing import Any, Dict, Optional
+from urllib.parse import quote
+
+from badfish.config import DISCOVERY_CACHE_MAX_AGE
+
+DISCOVERED = ("session_uri", "system_resource", "manager_resource", "vendor", "redfish_version")
+
+
+class DiscoveryCache:
+    """Redfish layout discovered on each host, kept on disk between runs.
+
+    Every run used to walk the service root, the sessions, Systems and
+    Managers collections and read the protocol features of the service root
+    before doing any work. Those never change for a given BMC short of a
+    firmware update, so once discovered they are written to one small JSON
+    file per host and reused while younger than ``max_age`` seconds.
+    Callers drop the entry of a host as soon as using it fails, so a stale
+    entry costs at most one failed run before it is discovered again.
+    """
+
+    def __init__(self, directory: str, max_age: float = DISCOVERY_CACHE_MAX_AGE):
+        self.directory = os.path.expanduser(directory)
+        self.max_age = max_age
+
+    def _path(self, host: str) -> str:
+        return os.path.join(self.directory, quote(host, safe="") + ".json")
+
+    def load(self, host: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Discovered values of ``host``, None when missing, unreadable or too old."""
+        now = time.time() if now is None else now
+        try:
+            with open(self._path(host), "r") as _file:
+                entry = json.load(_file)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or any(not entry.get(key) for key in DISCOVERED):
+            return None
+        if now - entry.get("discovered", 0) > self.max_age:
+            return None
+        values = {key: entry[key] for key in DISCOVERED}
+        if isinstance(entry.get("protocol_features"), dict):
+            values["protocol_features"] = entry["protocol_features"]
+        return values
+
+    def save(self, host: str, values: Dict[str, Any], now: Optional[float] = None) -> None:
+        entry = {key: values[key] for key in DISCOVERED + ("protocol_features",) if key in values}
+        entry["discovered"] = time.time() if now is None else now
+        os.makedirs(self.directory, exist_ok=True)
+        # Written aside and renamed so concurrent runs never read half a file
+        fd, path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as _file:
+                json.dump(entry, _file)
+            os.replace(path, self._path(host))
+        except OSError:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+    def invalidate(self, host: str) -> None:
+        try:
+            os.remove(self._path(host))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,214 @@
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, Mapping, Optional, Sequence, Set, Tuple
+
+import yaml
+
+from badfish.helpers.exceptions import BadfishException
+
+_VERSION_TOKENS = re.compile(r"\d+|[A-Za-z]+")
+
+
+def parse_version(version: Any) -> Tuple[Tuple[int, Any], ...]:
+    """Sortable key of a firmware version string.
+
+    Dell versions mix dotted numbers, dash separated builds and letter
+    releases (``2.19.1``, ``22.5.7-0``, ``A09``, ``1.0.4 (A00)``). They are
+    split into runs of digits and letters, numbers comparing numerically and
+    before letters, so ``2.10.0`` sorts after ``2.9.1`` and ``A10`` after ``A9``.
+    """
+    tokens = _VERSION_TOKENS.findall(str(version))
+    return tuple((0, int(token)) if token.isdigit() else (1, token.lower()) for token in tokens)
+
+
+def component_key(row: Mapping[str, Any]) -> str:
+    """Identity of a firmware component across hosts.
+
+    The ``SoftwareId`` when it has one, its ``Name`` otherwise since some
+    devices report ``SoftwareId`` 0.
+    """
+    software_id = str(row.get("SoftwareId", "")).strip()
+    if software_id and software_id != "0":
+        return software_id
+    return str(row.get("Name", row.get("Id", "")))
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, Any]]:
+    """Golden firmware from a YAML baseline, as its ``components`` and per-model ``models`` requirements.
+
+    Requirements map a component (``SoftwareId`` or ``Name``) to a version or
+    a constraint such as ``>=2.19.1``. Those under ``components`` apply to
+    every host and those under ``models`` only to hosts of that system model.
+    A plain mapping of components is taken as ``components``.
+    """
+    try:
+        with open(path, "r") as _file:
+            baseline = yaml.safe_load(_file)
+    except (IOError, yaml.YAMLError) as ex:
+        raise BadfishException(f"There was something wrong reading the firmware baseline {path}: {ex}")
+    if not isinstance(baseline, dict):
+        raise BadfishException(f"Firmware baseline {path} must map components to versions.")
+    if not set(baseline) & {"components", "models"}:
+        baseline = {"components": baseline}
+    components = baseline.get("components") or {}
+    models = baseline.get("models") or {}
+    if not isinstance(components, dict) or not isinstance(models, dict):
+        raise BadfishException(f"Firmware baseline {path} must map components to versions.")
+    if any(not isinstance(requirements or {}, dict) for requirements in models.values()):
+        raise BadfishException(f"Firmware baseline {path} must map components to versions.")
+    return {
+        "components": {str(component): str(version) for component, version in components.items()},
+        "models": {
+            str(model): {str(component): str(version) for component, version in (requirements or {}).items()}
+            for model, requirements in models.items()
+        },
+    }
+
+
+def compare_firmware(
+    inventories: Mapping[str, Sequence[Mapping[str, Any]]], baseline: Optional[Mapping[str, str]] = None
+) -> Dict[str, Dict[str, Any]]:
+    """Version distribution and outlier hosts of every firmware component.
+
+    Rows of all hosts are indexed by component in a single pass. The expected
+    version of a component is the requirement in ``baseline`` (the
+    ``components`` of :func:`load_baseline`) or, without it, the most common
+    one (the newest on ties). Devices sharing a component, such as disks or
+    NIC ports, are all checked: a host running anything else on any of them,
+    or not meeting the requirement, is an outlier with those versions, and
+    hosts without the component are listed as missing.
+    """
+    names: Dict[str, str] = {}
+    versions: Dict[str, Dict[str, Set[str]]] = {}
+    for host, rows in inventories.items():
+        for row in rows:
+            key = component_key(row)
+            names.setdefault(key, str(row.get("Name", key)))
+            versions.setdefault(key, {}).setdefault(host, set()).add(str(row.get("Version", "")))
+
+    baseline = baseline or {}
+    by_name = {name: key for key, name in names.items()}
+    requirements = {
+        by_name.get(component, component): Requirement.parse(requirement) for component, requirement in baseline.items()
+    }
+
+    comparison: Dict[str, Dict[str, Any]] = {}
+    for key in sorted(set(versions) | set(requirements), key=lambda k: names.get(k, k)):
+        host_versions = versions.get(key, {})
+        distribution = Counter(version for installed in host_versions.values() for version in installed)
+        requirement = requirements.get(key)
+        if requirement is not None:
+            expected = str(requirement)
+            satisfied = requirement.satisfied_by
+        else:
+            expected = max(distribution, key=lambda version: (distribution[version], parse_version(version)))
+            satisfied = expected.__eq__
+        outliers = {}
+        for host, installed in host_versions.items():
+            drifted = sorted((version for version in installed if not satisfied(version)), key=parse_version)
+            if drifted:
+                outliers[host] = ", ".join(drifted)
+        component: Dict[str, Any] = {
+            "Name": names.get(key, key),
+            "Expected": expected,
+            "Versions": dict(sorted(distribution.items(), key=lambda item: parse_version(item[0]), reverse=True)),
+        }
+        if outliers:
+            component["Outliers"] = outliers
+        missing = [host for host in inventories if host not in host_versions]
+        if missing:
+            component["Missing"] = missing
+        comparison[key] = component
+    return comparison
+
+
+_REQUIREMENT = re.compile(r"^(?P<op>>=|<=|==|!=|>|<|=)?\s*(?P<version>.+)$")
+
+
+@dataclass(frozen=True)
+class Requirement:
+    """Version constraint of a baseline component, such as ``2.19.1`` or ``>=2.19.1``."""
+
+    op: str
+    version: str
+    key: Tuple[Tuple[int, Any], ...]
+
+    @classmethod
+    def parse(cls, requirement: Any) -> "Requirement":
+        match = _REQUIREMENT.match(str(requirement).strip())
+        if not match:
+            raise BadfishException(f"Invalid firmware requirement: {requirement}")
+        op = match.group("op") or "=="
+        version = match.group("version").strip()
+        return cls("==" if op == "=" else op, version, parse_version(version))
+
+    def __str__(self) -> str:
+        return self.version if self.op == "==" else f"{self.op}{self.version}"
+
+    def satisfied_by(self, version: Any) -> bool:
+        installed = parse_version(version)
+        if self.op == "==":
+            return installed == self.key
+        if self.op == "!=":
+            return installed != self.key
+        if self.op == ">=":
+            return installed >= self.key
+        if self.op == "<=":
+            return installed <= self.key
+        if self.op == ">":
+            return installed > self.key
+        return installed < self.key
+
+
+class ComplianceIndex:
+    """Firmware baseline, as read by :func:`load_baseline`, compiled into per-model lookup tables.
+
+    Requirements are parsed once and the table of each model is merged on its
+    first use, so checking a host is a dictionary lookup per firmware row.
+    """
+
+    def __init__(self, components: Mapping[str, Requirement], models: Mapping[str, Mapping[str, Requirement]]):
+        self.components = dict(components)
+        self.models = {model: dict(requirements) for model, requirements in models.items()}
+        self._tables: Dict[Optional[str], Dict[str, Requirement]] = {}
+
+    @classmethod
+    def compile(cls, baseline: Mapping[str, Mapping[str, Any]]) -> "ComplianceIndex":
+        components = {key: Requirement.parse(value) for key, value in baseline.get("components", {}).items()}
+        models = {
+            model: {key: Requirement.parse(value) for key, value in requirements.items()}
+            for model, requirements in baseline.get("models", {}).items()
+        }
+        return cls(components, models)
+
+    def table(self, model: Optional[str] = None) -> Dict[str, Requirement]:
+        """Requirements applying to ``model``, the per-model ones overriding the common ones."""
+        table = self._tables.get(model)
+        if table is None:
+            table = self._tables[model] = {**self.components, **self.models.get(model or "", {})}
+        return table
+
+    def check(self, rows: Sequence[Mapping[str, Any]], model: Optional[str] = None) -> Dict[str, Any]:
+        """Compliance of a host's firmware rows: whether it passes, its drift and missing components."""
+        table = self.table(model)
+        seen = set()
+        drift: Dict[str, Dict[str, str]] = {}
+        for row in rows:
+            for key in {component_key(row), str(row.get("Name", ""))}:
+                requirement = table.get(key)
+                if requirement is None:
+                    continue
+                seen.add(key)
+                version = str(row.get("Version", ""))
+                if not requirement.satisfied_by(version):
+                    drift[key] = {"Required": str(requirement), "Installed": version}
+        missing = [key for key in table if key not in seen]
+        result: Dict[str, Any] = {"Compliant": not drift and not missing}
+        if model:
+            result["Model"] = model
+        if drift:
+            result["Drift"] = drift
+        if missing:
+            result["Missing"] = missing
+        return result
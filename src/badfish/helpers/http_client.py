@@ -1,29 +1,239 @@
 import asyncio
+import functools
 import json
 import ssl
-from typing import Any, Dict, Optional
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Sequence, Tuple
 
 import aiohttp
 
-from async_lru import alru_cache
+from badfish.config import CACHE_MAX_BYTES, CACHE_MAX_ENTRIES, CONNECTION_LIMIT_PER_HOST, SESSION_LIMIT_ATTEMPTS
+from badfish.helpers.cache import ResponseCache
 from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.limiter import AdaptiveLimiter
+from badfish.helpers.retry import TRANSPORT_ATTEMPTS, RetryPolicy
+from badfish.helpers.slots import SessionSlots
+
+# Redfish and iDRAC message IDs of a session refused because the session table is full
+SESSION_LIMIT_MESSAGES = ("SessionLimitExceeded", "RAC0218")
+
+
+def create_connector(limit: int = 100, limit_per_host: int = 0, ttl_dns_cache: int = 300) -> aiohttp.TCPConnector:
+    """Build a TCP connector meant to be shared by every HTTPClient in a run.
+
+    Args:
+        limit: Maximum number of simultaneous connections across all hosts (0 means unlimited)
+        limit_per_host: Maximum number of simultaneous connections to a single BMC (0 means unlimited)
+        ttl_dns_cache: Seconds resolved addresses are kept in the shared DNS cache
+
+    Returns:
+        A TCPConnector that must be closed by the caller once the run is over
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        use_dns_cache=True,
+        ttl_dns_cache=ttl_dns_cache,
+    )
+
+
+RESPONSE_HEADERS = ("Location", "X-Auth-Token", "ETag", "Retry-After")
+BODYLESS_STATUSES = (204, 304)
+EXPAND_QUERY = "$expand=.($levels=1)"
+
+
+def add_query(uri: str, query: str) -> str:
+    return "%s%s%s" % (uri, "&" if "?" in uri else "?", query)
+
+
+def select_fields(data: Any, fields: Sequence[str]) -> Any:
+    """Keep only ``fields`` of a JSON document, the way ``$select`` trims it on the BMC.
+
+    Nested properties are given as paths such as ``Attributes/BootMode``; the
+    ``@odata`` annotations of the document are always kept.
+    """
+    if not isinstance(data, dict):
+        return data
+    selected = {key: value for key, value in data.items() if key.startswith("@odata.")}
+    for path in fields:
+        *parents, name = path.split("/")
+        source, target = data, selected
+        for parent in parents:
+            source = source.get(parent)
+            if not isinstance(source, dict):
+                break
+            target = target.setdefault(parent, {})
+        else:
+            if name in source:
+                target[name] = source[name]
+    return selected
+
+
+@dataclass(frozen=True)
+class Response:
+    """Immutable snapshot of a BMC response.
+
+    Holds the status, the headers badfish uses and the raw body, so it can
+    be cached and shared once the underlying connection is released. The
+    body is decoded by :meth:`text` and :meth:`json`, the JSON document being
+    parsed on first use and memoized; treat it as read-only.
+    """
+
+    status: int
+    headers: Mapping[str, str] = field(default_factory=dict)
+    body: bytes = b""
+
+    @classmethod
+    async def read(cls, response: aiohttp.ClientResponse) -> "Response":
+        status = response.status
+        headers = {}
+        for name in RESPONSE_HEADERS:
+            value = response.headers.get(name)
+            if value is not None:
+                headers[name] = value
+        body = await response.read() if status not in BODYLESS_STATUSES else b""
+        return cls(status, MappingProxyType(headers), body)
+
+    def text(self) -> str:
+        """Body decoded as UTF-8, dropping invalid bytes."""
+        return self.body.decode("utf-8", "ignore")
+
+    def json(self) -> Any:
+        """Parsed JSON body.
+
+        Raises:
+            ValueError: If the body is not valid JSON
+        """
+        try:
+            return self.__dict__["_json"]
+        except KeyError:
+            data = json.loads(self.text().strip())
+            object.__setattr__(self, "_json", data)
+            return data
+
+
+def session_limit_reached(response: Response) -> bool:
+    """Whether a failed session creation was refused because the BMC has no free session left."""
+    if response.status in (200, 201):
+        return False
+    try:
+        data = response.json()
+    except ValueError:
+        return False
+    error = data.get("error") if isinstance(data, dict) else None
+    if not isinstance(error, dict):
+        return False
+    for info in error.get("@Message.ExtendedInfo") or []:
+        message_id = str(info.get("MessageId", "")) if isinstance(info, dict) else ""
+        if message_id.endswith(SESSION_LIMIT_MESSAGES):
+            return True
+    return "maximum number of user sessions" in str(error.get("message", "")).lower()
+
+
+@functools.lru_cache(maxsize=None)
+def get_ssl_context(insecure: bool = False, ca_bundle: Optional[str] = None) -> ssl.SSLContext:
+    """Build the SSL context shared by every request of the run.
+
+    The context is built once per combination of arguments and reused by all
+    clients, so certificate stores are loaded a single time.
+
+    Args:
+        insecure: Skip certificate and hostname verification
+        ca_bundle: Optional path to a PEM file with the CAs to trust instead of the system store
+
+    Returns:
+        The shared SSLContext
+
+    Raises:
+        BadfishException: If the CA bundle cannot be loaded
+    """
+    try:
+        context = ssl.create_default_context(cafile=ca_bundle)
+    except (OSError, ssl.SSLError) as ex:
+        raise BadfishException(f"Couldn't load CA bundle {ca_bundle}: {ex}")
+    if insecure:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
 
 
 class HTTPClient:
 
-    def __init__(self, host: str, username: str, password: str, logger, retries: int = 15, insecure: bool = False):
+    def __init__(
+        self,
+        host: str,
+        username: str,
+        password: str,
+        logger,
+        retries: int = 15,
+        insecure: bool = False,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        ca_bundle: Optional[str] = None,
+        cache_max_entries: int = CACHE_MAX_ENTRIES,
+        cache_max_bytes: int = CACHE_MAX_BYTES,
+    ):
         self.host = host
         self.username = username
         self.password = password
         self.logger = logger
         self.retries = retries
         self.insecure = insecure
+        self.ssl_context = get_ssl_context(insecure, ca_bundle)
         self.host_uri = f"https://{host}"
         self.redfish_uri = "/redfish/v1"
         self.root_uri = f"{self.host_uri}{self.redfish_uri}"
-        self.semaphore = asyncio.Semaphore(50)
+        # The window never grows past the connections the pool can open to one BMC
+        pool = [limit for limit in (connector.limit_per_host, connector.limit) if limit] if connector else []
+        self.limiter = AdaptiveLimiter(host, logger, maximum=min(pool, default=CONNECTION_LIMIT_PER_HOST))
+        self.retry_policy = RetryPolicy(logger, attempts=retries)
         self.token = None
+        # Whether the BMC answered a request made with the token without rejecting it
+        self.token_accepted = False
         self.session_id = None
+        self.connector = connector
+        self._session: Optional[aiohttp.ClientSession] = None
+        self.cache = ResponseCache(cache_max_entries, cache_max_bytes)
+        self._etags = ResponseCache(cache_max_entries, cache_max_bytes)
+        self._features: Optional[Dict[str, Any]] = None
+        self._inflight: Dict[Tuple[str, bool, bool], asyncio.Future] = {}
+        # Called to open a new session when the BMC rejects the token, returning whether it could
+        self.reauthenticate: Optional[Callable[[], Awaitable[bool]]] = None
+        self._reauth_lock = asyncio.Lock()
+        # Waits between attempts at opening a session while the BMC session table is full
+        self.session_policy = RetryPolicy(logger, attempts=SESSION_LIMIT_ATTEMPTS, base_delay=2.0)
+        self.session_slots: Optional[SessionSlots] = None
+        self._slot: Optional[int] = None
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the pooled keep-alive session, creating it on first use.
+
+        A single session (and its connector) is kept for the lifetime of the
+        client so consecutive requests to the BMC reuse open TCP/TLS
+        connections instead of handshaking on every call. When a shared
+        connector was given, the session borrows it and leaves closing it to
+        its owner.
+        """
+        if self._session is None or self._session.closed:
+            if self.connector is not None:
+                self._session = aiohttp.ClientSession(connector=self.connector, connector_owner=False)
+            else:
+                self._session = aiohttp.ClientSession()
+        return self._session
+
+    async def close(self) -> None:
+        """Close the pooled session and release its connections.
+
+        A shared connector is left open since other clients may still use it,
+        and the session slot held, if any, is released.
+        """
+        if self._slot is not None:
+            slot, self._slot = self._slot, None
+            self.session_slots.release(slot)
+        session, self._session = self._session, None
+        if session is not None and not session.closed:
+            await session.close()
+            self.logger.debug(f"{self.host}: response cache {self.cache.stats()}")
 
     def _handle_ssl_error(self, ex: Exception) -> None:
         """Handle SSL certificate verification errors by logging and raising exception.
@@ -44,10 +254,9 @@ class HTTPClient:
             "  3. For testing only, use the --insecure flag to skip verification (not recommended for production)"
         )
 
-    async def error_handler(self, response: aiohttp.ClientResponse, message: Optional[str] = None) -> None:
+    async def error_handler(self, response: Response, message: Optional[str] = None) -> None:
         try:
-            raw = await response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = response.json()
         except ValueError:
             raise BadfishException("Error reading response from host.")
 
@@ -65,45 +274,218 @@ class HTTPClient:
         else:
             raise BadfishException(detail_message)
 
-    @alru_cache(maxsize=64)
-    async def get_request(self, uri: str, _continue: bool = False, _get_token: bool = False):
-        return await self.get_raw(uri, _continue, _get_token)
+    async def get_request(
+        self,
+        uri: str,
+        _continue: bool = False,
+        _get_token: bool = False,
+        max_age: Optional[float] = None,
+        ttl: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Optional[Response]:
+        """GET ``uri`` through the response cache.
+
+        ``max_age`` bounds how old a cached response may be (0 always refetches),
+        ``ttl`` how long the fetched one stays cached. ``fields`` asks the BMC
+        for just those properties when it supports ``$select``. Concurrent
+        requests for the same resource share a single GET.
+        """
+        if fields and await self.supports_select():
+            uri = add_query(uri, "$select=%s" % ",".join(fields))
+        hit, response = self.cache.get(uri, _get_token, max_age)
+        if hit:
+            return response
+        key = (uri, _continue, _get_token)
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        pending = self._inflight[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await self.get_raw(uri, _continue, _get_token)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except BaseException as ex:
+            pending.set_exception(ex)
+            # Only waiters that joined this GET should see its failure
+            pending.exception()
+            raise
+        finally:
+            del self._inflight[key]
+        # Errors are left out so later reads retry them instead of getting them back
+        if response is not None and 200 <= response.status < 300:
+            self.cache.set(uri, response, _get_token, ttl, len(response.body))
+        pending.set_result(response)
+        return response
+
+    async def get_json(
+        self,
+        uri: str,
+        _continue: bool = False,
+        _get_token: bool = False,
+        max_age: Optional[float] = None,
+        ttl: Optional[float] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """Parsed body of ``uri``, or None when it can't be fetched or parsed.
 
-    @alru_cache(maxsize=64)
-    async def get_json(self, uri: str, _continue: bool = False, _get_token: bool = False):
-        response = await self.get_raw(uri, _continue, _get_token)
+        With ``fields`` the document only holds those properties, trimmed by
+        the BMC through ``$select`` or locally when it doesn't support it.
+        """
+        response = await self.get_request(uri, _continue, _get_token, max_age, ttl, fields)
         if not response:
             return None
 
-        # Parse JSON from response
         try:
-            raw = await response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
-            return data
-        except (json.JSONDecodeError, AttributeError) as e:
+            data = response.json()
+        except ValueError as e:
             self.logger.debug(f"Failed to parse JSON response: {e}")
             return None
+        return select_fields(data, fields) if fields else data
+
+    def use_protocol_features(self, features: Dict[str, Any]) -> None:
+        """Take ``features`` as the ProtocolFeaturesSupported of the host instead of fetching them."""
+        self._features = dict(features)
+
+    async def protocol_features(self) -> Dict[str, Any]:
+        """ProtocolFeaturesSupported of the service root, fetched once per client."""
+        if self._features is None:
+            root = await self.get_json(self.root_uri, _continue=True)
+            features = root.get("ProtocolFeaturesSupported") if isinstance(root, dict) else None
+            self._features = features if isinstance(features, dict) else {}
+            self.logger.debug(f"Protocol features supported by {self.host}: {self._features}")
+        return self._features
+
+    async def supports_expand(self) -> bool:
+        """Whether the service root advertises ``$expand`` of subordinate resources one level deep."""
+        expand = (await self.protocol_features()).get("ExpandQuery")
+        return isinstance(expand, dict) and bool(expand.get("NoLinks") and expand.get("Levels"))
+
+    async def supports_select(self) -> bool:
+        return (await self.protocol_features()).get("SelectQuery") is True
+
+    async def expand_uri(self, uri: str) -> str:
+        """``uri`` of a collection, asking for its members inline when the BMC supports it."""
+        if not await self.supports_expand():
+            return uri
+        return add_query(uri, EXPAND_QUERY)
+
+    async def _renew_token(self, rejected: Optional[str]) -> bool:
+        """Open a new session after ``rejected`` was refused, once for all the requests that were using it."""
+        async with self._reauth_lock:
+            if self.token != rejected:
+                return bool(self.token)
+            self.logger.debug(f"Session token rejected by {self.host}, authenticating again.")
+            return await self.reauthenticate()
+
+    async def _retrying(self, send, idempotent: bool = True, authenticated: bool = True) -> Response:
+        """Await ``send()`` retrying transient failures according to the retry policy.
+
+        Connection errors are retried for every method as long as they are
+        safe to resend, throttling statuses only for idempotent requests;
+        anything else is left to the caller. A request rejected with 401
+        while using a session token is sent once more after authenticating
+        again, when the client knows how to.
+        """
+        self.retry_policy.budget.deposit()
+        attempt = 0
+        reauthenticated = False
+        while True:
+            token = self.token
+            try:
+                _response = await send()
+            except Exception as ex:
+                if self.retry_policy.retryable_error(ex, idempotent) and await self.retry_policy.wait(
+                    attempt, attempts=TRANSPORT_ATTEMPTS
+                ):
+                    self.logger.debug(f"Transient error talking to {self.host}: {ex}")
+                    attempt += 1
+                    continue
+                raise
+            if (
+                idempotent
+                and self.retry_policy.retryable(_response.status)
+                and await self.retry_policy.wait(attempt, _response, attempts=TRANSPORT_ATTEMPTS)
+            ):
+                attempt += 1
+                continue
+            if (
+                _response.status == 401
+                and authenticated
+                and token
+                and self.reauthenticate
+                and not reauthenticated
+                and await self._renew_token(token)
+            ):
+                reauthenticated = True
+                continue
+            if token and _response.status != 401:
+                self.token_accepted = True
+            return _response
+
+    def invalidate(self, uri: str) -> None:
+        """Forget what was read of ``uri`` and the resources below it, whatever their query string."""
+        path = uri.split("?", 1)[0]
+        for cache in (self.cache, self._etags):
+            cache.invalidate(uri=path, prefix=path + "?")
+            cache.invalidate(prefix=path + "/")
+
+    def remember(self, uri: str, etag: str, body: str) -> None:
+        """Seed a representation of ``uri`` downloaded earlier so its next GET is conditional."""
+        _body = body.encode("utf-8")
+        self._etags.set(uri, Response(200, MappingProxyType({"ETag": etag}), _body), size=len(_body))
+
+    def _conditional_headers(self, uri: str) -> Dict[str, str]:
+        """Headers turning a GET of an already downloaded resource into a conditional one."""
+        hit, cached = self._etags.get(uri)
+        return {"If-None-Match": cached.headers["ETag"]} if hit else {}
+
+    def _revalidate(self, uri: str, _response: Response) -> Response:
+        """Serve the stored body on 304 Not Modified and remember the ETag of fresh responses."""
+        if _response.status == 304:
+            hit, cached = self._etags.get(uri)
+            if hit:
+                self.logger.debug(f"{uri} not modified, using cached body.")
+                return cached
+        if _response.status == 200 and _response.headers.get("ETag"):
+            self._etags.set(uri, _response, size=len(_response.body))
+        else:
+            self._etags.invalidate(uri=uri)
+        return _response
+
+    async def get_raw(self, uri: str, _continue: bool = False, _get_token: bool = False) -> Optional[Response]:
+        async def _send():
+            async with self.limiter.request() as sample:
+                session = self._get_session()
+                headers = self._conditional_headers(uri)
+                if not _get_token:
+                    if self.token:
+                        headers["X-Auth-Token"] = self.token
+                    async with session.get(
+                        uri,
+                        headers=headers,
+                        ssl=self.ssl_context,
+                        timeout=60,
+                    ) as _response:
+                        response = await Response.read(_response)
+                else:
+                    async with session.get(
+                        uri,
+                        headers=headers,
+                        auth=aiohttp.BasicAuth(self.username, self.password),
+                        ssl=self.ssl_context,
+                        timeout=60,
+                    ) as _response:
+                        response = await Response.read(_response)
+                sample.record(response.status)
+                return self._revalidate(uri, response)
 
-    async def get_raw(self, uri: str, _continue: bool = False, _get_token: bool = False):
         try:
-            async with self.semaphore:
-                async with aiohttp.ClientSession() as session:
-                    if not _get_token:
-                        async with session.get(
-                            uri,
-                            headers={"X-Auth-Token": self.token} if self.token else {},
-                            ssl=False if self.insecure else True,
-                            timeout=60,
-                        ) as _response:
-                            await _response.read()
-                    else:
-                        async with session.get(
-                            uri,
-                            auth=aiohttp.BasicAuth(self.username, self.password),
-                            ssl=False if self.insecure else True,
-                            timeout=60,
-                        ) as _response:
-                            await _response.read()
+            _response = await self._retrying(_send, authenticated=not _get_token)
+            if _response.status == 304:
+                # The stored body was evicted, so its ETag is dropped and the resource is fetched whole
+                self.logger.debug(f"{uri} not modified but no longer stored, fetching it again.")
+                _response = await self._retrying(_send, authenticated=not _get_token)
         except (ssl.SSLError, aiohttp.ClientConnectorCertificateError, aiohttp.ClientSSLError) as ex:
             if _continue:
                 return
@@ -124,43 +506,55 @@ class HTTPClient:
         payload: Dict[str, Any],
         headers: Dict[str, str],
         _get_token: bool = False,
-    ):
+    ) -> Response:
+        self.invalidate(uri)
+
+        async def _send():
+            async with self.limiter.request() as sample:
+                session = self._get_session()
+                if not _get_token and self.token:
+                    headers.update({"X-Auth-Token": self.token})
+                async with session.post(
+                    uri,
+                    data=json.dumps(payload),
+                    headers=headers,
+                    ssl=self.ssl_context,
+                ) as _response:
+                    response = await Response.read(_response)
+                    sample.record(response.status)
+                    return response
+
         try:
-            async with self.semaphore:
-                async with aiohttp.ClientSession() as session:
-                    if not _get_token and self.token:
-                        headers.update({"X-Auth-Token": self.token})
-                    async with session.post(
-                        uri,
-                        data=json.dumps(payload),
-                        headers=headers,
-                        ssl=False if self.insecure else True,
-                    ) as _response:
-                        if _response.status != 204:
-                            await _response.read()
-                        else:
-                            return _response
+            _response = await self._retrying(_send, idempotent=False, authenticated=not _get_token)
         except (ssl.SSLError, aiohttp.ClientConnectorCertificateError, aiohttp.ClientSSLError) as ex:
             self._handle_ssl_error(ex)
         except (Exception, TimeoutError):
             raise BadfishException("Failed to communicate with server.")
         return _response
 
-    async def patch_request(self, uri: str, payload: Dict[str, Any], headers: Dict[str, str], _continue: bool = False):
+    async def patch_request(
+        self, uri: str, payload: Dict[str, Any], headers: Dict[str, str], _continue: bool = False
+    ) -> Optional[Response]:
+        self.invalidate(uri)
+
+        async def _send():
+            async with self.limiter.request() as sample:
+                session = self._get_session()
+                if self.token:
+                    headers.update({"X-Auth-Token": self.token})
+                async with session.patch(
+                    uri,
+                    data=json.dumps(payload),
+                    headers=headers,
+                    ssl=self.ssl_context,
+                ) as _response:
+                    response = await Response.read(_response)
+                    self.logger.debug(response.text())
+                    sample.record(response.status)
+                    return response
+
         try:
-            async with self.semaphore:
-                async with aiohttp.ClientSession() as session:
-                    if self.token:
-                        headers.update({"X-Auth-Token": self.token})
-                    async with session.patch(
-                        uri,
-                        data=json.dumps(payload),
-                        headers=headers,
-                        ssl=False if self.insecure else True,
-                    ) as _response:
-                        raw_data = await _response.read()
-                        self.logger.debug(raw_data)
-                        return _response
+            return await self._retrying(_send, idempotent=False)
         except (ssl.SSLError, aiohttp.ClientConnectorCertificateError, aiohttp.ClientSSLError) as ex:
             if _continue:
                 return None
@@ -172,25 +566,53 @@ class HTTPClient:
                 self.logger.debug(ex)
                 raise BadfishException("Failed to communicate with server.")
 
-    async def delete_request(self, uri: str, headers: Dict[str, str]):
+    async def delete_request(self, uri: str, headers: Dict[str, str]) -> Response:
+        self.invalidate(uri)
+
+        async def _send():
+            async with self.limiter.request() as sample:
+                session = self._get_session()
+                if self.token:
+                    headers.update({"X-Auth-Token": self.token})
+                async with session.delete(
+                    uri,
+                    headers=headers,
+                    ssl=self.ssl_context,
+                ) as _response:
+                    response = await Response.read(_response)
+                    self.logger.debug(response.text())
+                    sample.record(response.status)
+                    return response
+
         try:
-            async with self.semaphore:
-                async with aiohttp.ClientSession() as session:
-                    if self.token:
-                        headers.update({"X-Auth-Token": self.token})
-                    async with session.delete(
-                        uri,
-                        headers=headers,
-                        ssl=False if self.insecure else True,
-                    ) as _response:
-                        raw_data = await _response.read()
-                        self.logger.debug(raw_data)
-                        return _response
+            # A rejected token means the session is gone already, there is nothing to authenticate again for
+            return await self._retrying(_send, idempotent=False, authenticated=False)
         except (ssl.SSLError, aiohttp.ClientConnectorCertificateError, aiohttp.ClientSSLError) as ex:
             self._handle_ssl_error(ex)
         except (Exception, TimeoutError):
             raise BadfishException("Failed to communicate with server.")
 
+    async def create_session(self, uri: str, payload: Dict[str, Any], headers: Dict[str, str]) -> Response:
+        """POST a new session to ``uri``, queueing for a free session slot when capped.
+
+        A BMC whose session table is full refuses new sessions until one is
+        closed or times out, so the request is sent again with backoff for a
+        while instead of failing the run outright.
+        """
+        if self.session_slots and self._slot is None:
+            self._slot = await self.session_slots.acquire(self.host, self.logger)
+        attempt = 0
+        while True:
+            _response = await self.post_request(uri, payload, headers, _get_token=True)
+            if not session_limit_reached(_response):
+                return _response
+            self.logger.debug(f"{self.host} has no free session left, waiting for one to close.")
+            if not await self.session_policy.wait(attempt, _response):
+                raise BadfishException(
+                    f"{self.host} reached its maximum number of sessions, try again once some are closed"
+                )
+            attempt += 1
+
     async def find_session_uri(self):
         _response = await self.get_request(self.root_uri, _get_token=True)
 
@@ -200,8 +622,7 @@ class HTTPClient:
         if status not in [200, 201]:
             raise BadfishException(f"Failed to communicate with {self.host}")
 
-        raw = await _response.text("utf-8", "ignore")
-        data = json.loads(raw.strip())
+        data = _response.json()
 
         redfish_version = int(data["RedfishVersion"].replace(".", ""))
         session_uri = None
@@ -222,10 +643,7 @@ class HTTPClient:
         headers = {"content-type": "application/json"}
         session_uri = await self.find_session_uri()
         _uri = "%s%s" % (self.host_uri, session_uri)
-        _response = await self.post_request(_uri, payload, headers, _get_token=True)
-
-        # Mock shifting value on value access and not on call.
-        await _response.text("utf-8", "ignore")
+        _response = await self.create_session(_uri, payload, headers)
 
         status = _response.status
         if status == 401:
@@ -260,6 +678,7 @@ class HTTPClient:
             finally:
                 self.session_id = None
                 self.token = None
+                await self.close()
         except Exception:
             self.session_id = None
             self.token = None
@@ -0,0 +1,116 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+import aiohttp
+
+from badfish.config import CONNECTION_LIMIT_PER_HOST
+
+OVERLOAD_STATUSES = (429, 503)
+OVERLOAD_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionResetError)
+
+
+class _Sample:
+    __slots__ = ("overloaded",)
+
+    def __init__(self):
+        self.overloaded = False
+
+    def record(self, status) -> None:
+        """Flag the request as overloading the BMC if it answered with a throttling status."""
+        if status in OVERLOAD_STATUSES:
+            self.overloaded = True
+
+
+class AdaptiveLimiter:
+    """Additive-increase/multiplicative-decrease concurrency limit for a single BMC.
+
+    The limiter starts with a small number of concurrent requests and grows it by
+    roughly one slot per window of requests answered at a latency close to the
+    observed baseline. A throttling status (429/503), a dropped connection, a
+    timeout or a latency spike halves the limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        logger,
+        initial: int = 2,
+        minimum: int = 1,
+        maximum: int = CONNECTION_LIMIT_PER_HOST,
+        latency_factor: float = 2.0,
+        smoothing: float = 0.2,
+    ):
+        self.name = name
+        self.logger = logger
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_factor = latency_factor
+        self.smoothing = smoothing
+        self._limit = float(max(minimum, min(initial, maximum)))
+        self._in_flight = 0
+        self._baseline: Optional[float] = None
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    @asynccontextmanager
+    async def request(self):
+        """Hold a request slot for the duration of the block.
+
+        Yields a sample on which the caller records the response status so
+        throttling answers are taken into account; connection errors and
+        timeouts raised inside the block are detected automatically.
+        """
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+        sample = _Sample()
+        start = time.monotonic()
+        try:
+            yield sample
+        except OVERLOAD_ERRORS:
+            sample.overloaded = True
+            raise
+        finally:
+            latency = time.monotonic() - start
+            async with self._condition:
+                self._in_flight -= 1
+                self._update(latency, sample.overloaded)
+                self._condition.notify_all()
+
+    def _update(self, latency: float, overloaded: bool) -> None:
+        if overloaded:
+            reason = "BMC overloaded"
+        else:
+            spike = self._baseline is not None and latency > self._baseline * self.latency_factor
+            reason = "latency spike (%.2fs, baseline %.2fs)" % (latency, self._baseline) if spike else ""
+            # Spikes still feed the baseline so a BMC that is permanently slower is eventually accepted.
+            if self._baseline is None:
+                self._baseline = latency
+            else:
+                self._baseline = (1 - self.smoothing) * self._baseline + self.smoothing * latency
+            if not spike:
+                self._set_limit(min(float(self.maximum), self._limit + 1 / self._limit), "latency stable")
+                return
+
+        # Requests failing together report the same congestion event, decrease once per round trip.
+        now = time.monotonic()
+        if self._baseline is not None and now - self._last_decrease < self._baseline:
+            return
+        self._last_decrease = now
+        self._set_limit(max(float(self.minimum), self._limit / 2), reason)
+
+    def _set_limit(self, value: float, reason: str) -> None:
+        previous = self.limit
+        self._limit = value
+        if self.limit != previous:
+            self.logger.debug(f"{self.name}: concurrency limit {previous} -> {self.limit} ({reason})")
@@ -29,16 +29,28 @@ class NoAliasDumper(yaml.SafeDumper):
         return True
 
 
+SEPARATOR = "*" * 48
+
+
 class BadfishHandler(StreamHandler):
-    def __init__(self, format_flag=False):
+    def __init__(self, format_flag=False, stream_format=None):
         StreamHandler.__init__(self)
         self.messages = {}
         self.formatted_msg = []
         self.output_dict = dict()
         self.host = None
         self.format_flag = format_flag
+        # With a stream format ("normal", "json" or "yaml") the records of each
+        # host are written out as soon as the host completes instead of at exit
+        self.stream_format = stream_format
+        self.blocks = {}
+        self.errors = {}
 
     def emit(self, record):
+        if self.stream_format:
+            self.emit_streaming(record)
+            return
+
         if not self.format_flag:
             self.formatted_msg.append(self.formatter.format(record))
             return
@@ -46,7 +58,7 @@ class BadfishHandler(StreamHandler):
         if getattr(record, "is_table", False):
             return
 
-        if record.levelno == INFO and record.msg != "*" * 48:
+        if record.levelno == INFO and record.msg != SEPARATOR:
             if record.name not in self.messages:
                 self.messages.update({record.name: record.msg + "\n"})
             else:
@@ -54,107 +66,94 @@ class BadfishHandler(StreamHandler):
         elif record.levelno == ERROR:
             self.output_dict = {"error": True, "error_msg": record.msg}
 
+    @staticmethod
+    def load_message(message):
+        # Try to parse as is first
+        try:
+            return yaml.safe_load(message)
+        except yaml.YAMLError:
+            # If parsing fails, try to format the value as a quoted string
+            lines = message.strip().split("\n")
+            formatted_lines = []
+            for line in lines:
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    value = value.strip()
+                    # If value contains spaces or special characters, wrap in quotes
+                    if " " in value or any(c in value for c in "{}[](),:#"):
+                        value = f'"{value}"'
+                    formatted_lines.append(f"{key}: {value}")
+                else:
+                    formatted_lines.append(line)
+            formatted_message = "\n".join(formatted_lines)
+            return yaml.safe_load(formatted_message)
+
     def parse(self):
         try:
             if self.host:
                 host_name = self.host.strip().split(".")[0]
-                # Ensure the message is properly formatted as YAML by wrapping values in quotes
-                message = self.messages[host_name]
-                # Try to parse as is first
-                try:
-                    new_dict = yaml.safe_load(message)
-                except yaml.YAMLError:
-                    # If parsing fails, try to format the value as a quoted string
-                    lines = message.strip().split("\n")
-                    formatted_lines = []
-                    for line in lines:
-                        if ":" in line:
-                            key, value = line.split(":", 1)
-                            value = value.strip()
-                            # If value contains spaces or special characters, wrap in quotes
-                            if " " in value or any(c in value for c in "{}[](),:#"):
-                                value = f'"{value}"'
-                            formatted_lines.append(f"{key}: {value}")
-                        else:
-                            formatted_lines.append(line)
-                    formatted_message = "\n".join(formatted_lines)
-                    new_dict = yaml.safe_load(formatted_message)
-
+                new_dict = self.load_message(self.messages[host_name])
                 self.output_dict.update({self.host: new_dict.copy()})
                 self.host = None
             else:
-                message = self.messages["badfish.helpers.logger"]
-                # Apply the same formatting logic for non-host messages
-                try:
-                    new_dict = yaml.safe_load(message)
-                except yaml.YAMLError:
-                    lines = message.strip().split("\n")
-                    formatted_lines = []
-                    for line in lines:
-                        if ":" in line:
-                            key, value = line.split(":", 1)
-                            value = value.strip()
-                            if " " in value or any(c in value for c in "{}[](),:#"):
-                                value = f'"{value}"'
-                            formatted_lines.append(f"{key}: {value}")
-                        else:
-                            formatted_lines.append(line)
-                    formatted_message = "\n".join(formatted_lines)
-                    new_dict = yaml.safe_load(formatted_message)
-
+                new_dict = self.load_message(self.messages["badfish.helpers.logger"])
                 self.output_dict.update(new_dict.copy())
         except yaml.YAMLError:
             self.output_dict = {"unsupported_command": True}
 
-    def diff(self):
-        try:
-            if self.output_dict["error"]:
-                return f"ERROR - {self.output_dict['error_msg']}"
-        except KeyError:
-            host_first, host_second, *_ = self.output_dict.keys()
-            first, second, *_ = self.output_dict.values()
-            diff_dict = {host_first: {}, host_second: {}}
-            for i in first:
-                for j in second:
-                    if (
-                        first[i]["SoftwareId"] == second[j]["SoftwareId"]
-                        and first[i]["Version"] != second[j]["Version"]
-                        and first[i]["SoftwareId"] != 0
-                    ):
-                        diff_dict[host_first].update(
-                            {
-                                i: {
-                                    "Version": first[i]["Version"],
-                                    "Name": first[i]["Name"],
-                                }
-                            }
-                        )
-                        diff_dict[host_second].update(
-                            {
-                                j: {
-                                    "Version": second[j]["Version"],
-                                    "Name": second[j]["Name"],
-                                }
-                            }
-                        )
-
-            if diff_dict[host_first] == {}:
-                return "{}"
-            output = ""
-            formatted = json.dumps(diff_dict[host_first], indent=4, sort_keys=False, default=str)
-            len_first = (max(len(line) for line in formatted.splitlines())) + 10
-            output += f"{host_first}:".ljust(len_first)
-            output += f"{host_second}:\n"
-            for i, j in zip(diff_dict[host_first], diff_dict[host_second]):
-                output += f"{i}".ljust(len_first)
-                output += f"{j}\n"
-                output += f"\t- Name: {(diff_dict[host_first][i])['Name']}".ljust(len_first)
-                output += f"\t- Name: {(diff_dict[host_second][j])['Name']}\n"
-                output += f"\t- Version: {(diff_dict[host_first][i])['Version']}".ljust(len_first)
-                output += f"\t- Version: {(diff_dict[host_second][j])['Version']}\n"
-            return output
+    def emit_streaming(self, record):
+        host = getattr(record, "host_complete", None)
+        if host is not None:
+            self.flush_host(record, host, getattr(record, "host_result", False))
+        elif self.stream_format == "normal":
+            self.blocks.setdefault(record.name, []).append(self.format(record))
+        elif getattr(record, "is_table", False):
+            return
+        elif record.levelno == INFO and record.msg != SEPARATOR:
+            self.messages[record.name] = self.messages.get(record.name, "") + record.msg + "\n"
+        elif record.levelno == ERROR:
+            self.errors[record.name] = record.msg
+
+    def flush_host(self, record, host, result):
+        """Write out and forget everything buffered for the host logging ``record``, its completion marker."""
+        if self.stream_format == "normal":
+            block = self.blocks.pop(record.name, []) + [self.format(record)]
+            self.stream.write("\n".join(block) + "\n")
+        else:
+            message = self.messages.pop(record.name, None)
+            error = self.errors.pop(record.name, None)
+            # Callers that already hold the document of the host pass it along with the marker
+            document = getattr(record, "host_document", None)
+            if document is None and not result:
+                document = {"error": True, "error_msg": str(error)} if error else {"error": True}
+            elif document is None:
+                try:
+                    document = self.load_message(message) if message else {}
+                except yaml.YAMLError:
+                    document = {"unsupported_command": True}
+            if self.stream_format == "json":
+                self.stream.write(json.dumps({host: document}, sort_keys=False, default=str) + "\n")
+            else:
+                self.stream.write(
+                    yaml.dump(
+                        {host: document},
+                        sort_keys=False,
+                        indent=4,
+                        default_flow_style=False,
+                        explicit_start=True,
+                        Dumper=NoAliasDumper,
+                    )
+                )
+        self.flush()
 
     def output(self, output_type, host_order=None):
+        if self.stream_format:
+            # Hosts were already written out, only what was logged outside of them is left
+            if self.stream_format == "normal":
+                return "\n".join(line for block in self.blocks.values() for line in block)
+            if not self.errors:
+                return ""
+            self.output_dict = {"error": True, "error_msg": list(self.errors.values())[-1]}
         if output_type == "json":
             return json.dumps(self.output_dict, indent=4, sort_keys=False, default=str)
         elif output_type == "yaml":
@@ -230,7 +229,7 @@ class BadfishFormatter(Formatter):
 
 
 class BadfishLogger:
-    def __init__(self, verbose=False, multi_host=False, log_file=None, output=None, console=None):
+    def __init__(self, verbose=False, multi_host=False, log_file=None, output=None, console=None, stream=False):
         self.log_level = DEBUG if verbose else INFO
         self.multi_host = multi_host
         self.log_file = log_file
@@ -242,7 +241,9 @@ class BadfishLogger:
         use_color = bool(console and console.is_terminal and not console.no_color)
         console_formatter = BadfishFormatter(_format_str, use_color=use_color)
 
-        self.badfish_handler = BadfishHandler(True if output else False)
+        self.badfish_handler = BadfishHandler(
+            True if output else False, stream_format=(output or "normal") if stream else None
+        )
         self.badfish_handler.setFormatter(console_formatter)
         self.badfish_handler.setLevel(INFO)
 
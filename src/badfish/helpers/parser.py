@@ -1,7 +1,16 @@
 import argparse
 
 from badfish import __version__
-from badfish.config import RETRIES
+from badfish.config import (
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    DISCOVERY_CACHE_DIR,
+    FETCH_CONCURRENCY,
+    MAX_CONCURRENCY,
+    RETRIES,
+    SESSION_LOCK_DIR,
+    TOKEN_STORE_PATH,
+)
 
 
 def create_parser():
@@ -32,9 +41,74 @@ def create_parser():
     )
     parser.add_argument(
         "--host-list",
-        help="Path to a plain text file with a list of hosts",
+        help="Path to a plain text file with a list of hosts, each optionally followed by a group name",
         default=None,
     )
+    parser.add_argument(
+        "--stream",
+        help="Write the output of each host of a --host-list run as soon as it completes "
+        "(JSON Lines with --output json)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--connection-limit",
+        help="Maximum number of simultaneous connections across all hosts in a --host-list run (0 for no limit)",
+        type=int,
+        default=CONNECTION_LIMIT,
+    )
+    parser.add_argument(
+        "--connection-limit-per-host",
+        help="Maximum number of simultaneous connections to a single host in a --host-list run (0 for no limit)",
+        type=int,
+        default=CONNECTION_LIMIT_PER_HOST,
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        help="Maximum number of hosts handled at the same time in a --host-list run (0 for no limit)",
+        type=int,
+        default=MAX_CONCURRENCY,
+    )
+    parser.add_argument(
+        "--group-limit",
+        help="Maximum number of hosts of the same --host-list group handled at the same time (0 for no limit)",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--discovery-cache",
+        help=f"Reuse the Redfish resources discovered on each host from this directory (default {DISCOVERY_CACHE_DIR})",
+        nargs="?",
+        const=DISCOVERY_CACHE_DIR,
+        default=None,
+        metavar="DIR",
+    )
+    parser.add_argument(
+        "--token-store",
+        help=f"Keep session tokens in this file to reuse them in later runs (default {TOKEN_STORE_PATH})",
+        nargs="?",
+        const=TOKEN_STORE_PATH,
+        default=None,
+        metavar="PATH",
+    )
+    parser.add_argument(
+        "--max-sessions",
+        help="Maximum number of sessions badfish opens at the same time on each host, "
+        "shared by every badfish process on this machine (0 for no limit, not allowed with --token-store)",
+        type=int,
+        default=0,
+    )
+    parser.add_argument(
+        "--session-lock-dir",
+        help=f"Directory of the lock files coordinating --max-sessions (default {SESSION_LOCK_DIR})",
+        default=SESSION_LOCK_DIR,
+        metavar="DIR",
+    )
+    parser.add_argument(
+        "--fetch-concurrency",
+        help="Maximum number of collection members fetched at the same time from a single host",
+        type=int,
+        default=FETCH_CONCURRENCY,
+    )
     parser.add_argument("--pxe", help="Set next boot to one-shot boot PXE", action="store_true")
     parser.add_argument("--boot-to", help="Set next boot to one-shot boot to a specific device")
     parser.add_argument(
@@ -96,9 +170,25 @@ def create_parser():
     )
     parser.add_argument(
         "--delta",
-        help="Address of the other host between which the delta should be made",
+        help="Address of another host to compare the firmware inventory with",
         default="",
     )
+    parser.add_argument(
+        "--compare-firmware",
+        help="Compare the firmware of all the given hosts, per component, with each other or with a baseline",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--firmware-compliance",
+        help="Check the firmware of the given hosts against --firmware-baseline, reporting pass/fail and drift per host",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--firmware-baseline",
+        help="Path to a YAML file mapping firmware components (SoftwareId or Name) to their golden version, "
+        "for every host or per system model",
+        default=None,
+    )
     parser.add_argument(
         "--clear-jobs",
         help="Clear any scheduled jobs from the queue",
@@ -138,6 +228,34 @@ def create_parser():
         help="List 'Serial Number'/'Service Tag'",
         action="store_true",
     )
+    parser.add_argument(
+        "--inventory",
+        help="List processors, memory, GPUs, interfaces, serial and firmware in a single pass",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--inventory-db",
+        help="Path to a SQLite file where --inventory results are stored and --query reads them from",
+        default=None,
+    )
+    parser.add_argument(
+        "--query",
+        help="List the stored hosts whose latest inventory matches every filter, e.g. 'Firmware/*BIOS*/Version<2.19'",
+        nargs="*",
+        metavar="FILTER",
+        default=None,
+    )
+    parser.add_argument(
+        "--count-by",
+        help="Count the stored hosts by the value at an inventory path, e.g. 'Processors/Summary/Model'",
+        default=None,
+    )
+    parser.add_argument(
+        "--max-age",
+        help="With --query or --count-by, collect again the inventory of hosts stored more than this many seconds ago",
+        type=float,
+        default=None,
+    )
     parser.add_argument(
         "--check-virtual-media",
         help="Check for mounted iso images",
@@ -245,6 +363,11 @@ def create_parser():
         help="Disable SSL/TLS certificate verification (insecure, use only for testing)",
         action="store_true",
     )
+    parser.add_argument(
+        "--ca-bundle",
+        help="Path to a PEM file with the CA certificates used to verify the BMC certificates",
+        default=None,
+    )
     parser.add_argument(
         "--get-scp-targets",
         help="Get allowable target values to export or import with iDRAC SCP. Choices=['Export', 'Import']",
@@ -293,4 +416,8 @@ def create_parser():
 def parse_arguments(argv=None):
     """Parse command line arguments using the configured parser."""
     parser = create_parser()
-    return vars(parser.parse_args(argv))
+    args = parser.parse_args(argv)
+    # Stored sessions stay open after the run, where no lock file can count them
+    if args.token_store and args.max_sessions > 0:
+        parser.error("--token-store keeps sessions open between runs and cannot be combined with --max-sessions")
+    return vars(args)
@@ -0,0 +1,127 @@
+import asyncio
+import random
+import ssl
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+import aiohttp
+
+RETRY_STATUSES = (429, 502, 503, 504)
+TRANSIENT_ERRORS = (aiohttp.ClientConnectionError, asyncio.TimeoutError, ConnectionResetError)
+SSL_ERRORS = (ssl.SSLError, aiohttp.ClientSSLError)
+TRANSPORT_ATTEMPTS = 3
+
+
+class RetryBudget:
+    """Caps retries to a fraction of the requests sent to a BMC.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, on
+    top of a fixed reserve of ``minimum`` retries. Once a BMC keeps failing the
+    budget runs dry and callers give up instead of piling more load on it.
+    """
+
+    def __init__(self, ratio: float = 0.2, minimum: int = 10):
+        self.ratio = ratio
+        self.minimum = minimum
+        self.requests = 0
+        self.retries = 0
+
+    @property
+    def balance(self) -> float:
+        return self.minimum + self.requests * self.ratio - self.retries
+
+    def deposit(self) -> None:
+        self.requests += 1
+
+    def withdraw(self) -> bool:
+        if self.balance < 1:
+            return False
+        self.retries += 1
+        return True
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request to a BMC is sent again.
+
+    Retries are spaced by exponential backoff with full jitter unless the BMC
+    asked for a specific delay through ``Retry-After``, and are drawn from a
+    shared ``RetryBudget``.
+    """
+
+    def __init__(
+        self,
+        logger,
+        attempts: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_retry_after: float = 120.0,
+        statuses=RETRY_STATUSES,
+        budget: Optional[RetryBudget] = None,
+    ):
+        self.logger = logger
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.statuses = statuses
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def retryable(self, status) -> bool:
+        return status in self.statuses
+
+    @staticmethod
+    def retryable_error(ex: BaseException, idempotent: bool = True) -> bool:
+        """Whether a transport error is worth retrying.
+
+        Certificate failures never are. Requests that may have side effects
+        are only retried when the connection could not be established, since
+        the BMC never saw them.
+        """
+        if isinstance(ex, SSL_ERRORS):
+            return False
+        if not idempotent:
+            return isinstance(ex, aiohttp.ClientConnectorError)
+        return isinstance(ex, TRANSIENT_ERRORS)
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2**attempt))
+
+    def retry_after(self, response) -> Optional[float]:
+        """Seconds requested by the ``Retry-After`` header, if any."""
+        headers = getattr(response, "headers", None)
+        value = headers.get("Retry-After") if headers is not None else None
+        if not isinstance(value, str):
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+    def delay(self, attempt: int, response=None) -> float:
+        requested = self.retry_after(response) if response is not None else None
+        if requested is not None:
+            return min(requested, self.max_retry_after)
+        return self.backoff(attempt)
+
+    async def wait(self, attempt: int, response=None, attempts: Optional[int] = None) -> bool:
+        """Sleep before retry number ``attempt + 1``.
+
+        Returns False without sleeping when the attempts or the budget are
+        exhausted, in which case the caller should give up.
+        """
+        if attempt + 1 >= (attempts if attempts is not None else self.attempts):
+            return False
+        if not self.budget.withdraw():
+            self.logger.debug("Retry budget exhausted, not retrying.")
+            return False
+        delay = self.delay(attempt, response)
+        self.logger.debug("Retrying in %.1f seconds (attempt %d)." % (delay, attempt + 2))
+        await asyncio.sleep(delay)
+        return True
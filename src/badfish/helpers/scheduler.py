@@ -0,0 +1,67 @@
+import asyncio
+from collections import Counter
+from typing import Any, AsyncIterator, Awaitable, Callable, Hashable, List, Optional, Sequence, Tuple
+
+
+async def run_bounded(
+    jobs: Sequence[Callable[[], Awaitable[Any]]],
+    max_concurrency: int = 0,
+    groups: Optional[Sequence[Optional[Hashable]]] = None,
+    group_limit: int = 0,
+) -> AsyncIterator[Tuple[int, Any]]:
+    """Run ``jobs`` from a work queue, yielding ``(index, result)`` as each one completes.
+
+    At most ``max_concurrency`` jobs run at once and at most ``group_limit``
+    of those belong to the same group, ``groups`` giving the group of each job
+    (``None`` for no group). Jobs start in the order given: whenever a slot is
+    free the first queued job whose group has room is started, so a busy group
+    never holds back the others. A job is only called when it starts, and
+    exceptions are yielded as results like ``asyncio.gather`` does with
+    ``return_exceptions``. Jobs completing together are yielded in list
+    order. ``0`` lifts either limit.
+    """
+    groups = groups or [None] * len(jobs)
+    queued: List[int] = list(range(len(jobs)))
+    running = {}
+    active: Counter = Counter()
+
+    def has_room(index: int) -> bool:
+        group = groups[index]
+        return group is None or group_limit <= 0 or active[group] < group_limit
+
+    try:
+        while queued or running:
+            position = 0
+            while position < len(queued) and (max_concurrency <= 0 or len(running) < max_concurrency):
+                index = queued[position]
+                if not has_room(index):
+                    position += 1
+                    continue
+                del queued[position]
+                active[groups[index]] += 1
+                running[asyncio.ensure_future(jobs[index]())] = index
+
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in sorted(done, key=running.get):
+                index = running.pop(task)
+                active[groups[index]] -= 1
+                if task.cancelled():
+                    yield index, asyncio.CancelledError()
+                else:
+                    yield index, task.exception() or task.result()
+    finally:
+        for task in running:
+            task.cancel()
+
+
+async def gather_bounded(
+    jobs: Sequence[Callable[[], Awaitable[Any]]],
+    max_concurrency: int = 0,
+    groups: Optional[Sequence[Optional[Hashable]]] = None,
+    group_limit: int = 0,
+) -> List[Any]:
+    """Results of :func:`run_bounded` in the order of ``jobs``."""
+    results: List[Any] = [None] * len(jobs)
+    async for index, result in run_bounded(jobs, max_concurrency, groups, group_limit):
+        results[index] = result
+    return results
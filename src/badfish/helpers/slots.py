@@ -0,0 +1,62 @@
+import asyncio
+import fcntl
+import os
+from typing import Optional
+from urllib.parse import quote
+
+from badfish.config import SESSION_SLOT_POLL, SESSION_SLOT_WAIT
+from badfish.helpers.exceptions import BadfishException
+
+
+class SessionSlots:
+    """Per-host cap on the badfish sessions open at once, shared by every badfish process on this machine.
+
+    Each host gets ``limit`` lock files in ``directory`` and opening a session
+    takes an exclusive ``flock`` on a free one, held until the session is
+    closed. The kernel drops the lock of a process however it exits, so a run
+    that crashed never keeps a slot. When every slot of a host is taken the
+    caller polls for one every ``poll`` seconds, giving up after ``wait``.
+    """
+
+    def __init__(self, directory: str, limit: int, wait: float = SESSION_SLOT_WAIT, poll: float = SESSION_SLOT_POLL):
+        self.directory = os.path.expanduser(directory)
+        self.limit = max(1, limit)
+        self.wait = wait
+        self.poll = poll
+
+    def _path(self, host: str, slot: int) -> str:
+        return os.path.join(self.directory, f"{quote(host, safe='')}.{slot}.lock")
+
+    def try_acquire(self, host: str) -> Optional[int]:
+        """Lock a free slot of ``host`` without waiting, returning its file descriptor or None."""
+        os.makedirs(self.directory, exist_ok=True)
+        for slot in range(self.limit):
+            fd = os.open(self._path(host, slot), os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            return fd
+        return None
+
+    async def acquire(self, host: str, logger=None) -> int:
+        """Lock a slot of ``host``, waiting for one to be released when all of them are taken."""
+        fd = self.try_acquire(host)
+        polls = int(self.wait / self.poll) if self.poll > 0 else 0
+        if fd is None and logger:
+            logger.debug(f"All {self.limit} session slots of {host} are taken, waiting for one.")
+        while fd is None:
+            if polls <= 0:
+                raise BadfishException(f"Timed out waiting for a free session slot on {host}")
+            polls -= 1
+            await asyncio.sleep(self.poll)
+            fd = self.try_acquire(host)
+        return fd
+
+    @staticmethod
+    def release(fd: int) -> None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
@@ -0,0 +1,205 @@
+import json
+import os
+import re
+import sqlite3
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.firmware import parse_version
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS inventory (
+    host TEXT NOT NULL,
+    collected REAL NOT NULL,
+    document TEXT NOT NULL,
+    PRIMARY KEY (host, collected)
+);
+CREATE TABLE IF NOT EXISTS facts (
+    host TEXT NOT NULL,
+    path TEXT NOT NULL,
+    value TEXT
+);
+CREATE INDEX IF NOT EXISTS facts_path ON facts (path);
+CREATE INDEX IF NOT EXISTS facts_host ON facts (host);
+CREATE TABLE IF NOT EXISTS members (
+    host TEXT NOT NULL,
+    uri TEXT NOT NULL,
+    etag TEXT NOT NULL,
+    document TEXT NOT NULL,
+    PRIMARY KEY (host, uri)
+);
+"""
+
+_FILTER = re.compile(r"^(?P<path>[^=!<>~]+?)\s*(?P<op>==|=|!=|<=|>=|<|>|~)\s*(?P<value>.*)$")
+_VERSION = re.compile(r"^\d+(\.\d+)*$")
+
+
+def flatten(document: Any, prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """``(path, value)`` pairs of the scalars of a document, paths joined by ``/`` like ``$select``."""
+    if isinstance(document, dict):
+        for key, value in document.items():
+            yield from flatten(value, f"{prefix}/{key}" if prefix else str(key))
+    elif isinstance(document, list):
+        for index, value in enumerate(document):
+            yield from flatten(value, f"{prefix}/{index}" if prefix else str(index))
+    else:
+        yield prefix, document if isinstance(document, str) else json.dumps(document)
+
+
+def _comparable(value: str):
+    if _VERSION.match(value):
+        return parse_version(value)
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+@dataclass(frozen=True)
+class Filter:
+    """Condition on the facts of a host, such as ``Firmware/*BIOS*/Version<2.19``.
+
+    ``path`` is a glob over fact paths. Values compare as dotted versions or
+    numbers when both sides look like one, as strings otherwise; ``~`` is a
+    case insensitive substring match.
+    """
+
+    path: str
+    op: str
+    value: str
+
+    @classmethod
+    def parse(cls, expression: str) -> "Filter":
+        match = _FILTER.match(expression.strip())
+        if not match:
+            raise BadfishException(f"Invalid query filter: {expression}")
+        op = match.group("op")
+        return cls(match.group("path").strip(), "=" if op == "==" else op, match.group("value").strip())
+
+    def matches(self, value: Optional[str]) -> bool:
+        if value is None:
+            return False
+        if self.op == "~":
+            return self.value.lower() in value.lower()
+        left, right = _comparable(value), _comparable(self.value)
+        if type(left) is not type(right):
+            left, right = value, self.value
+        if self.op == "=":
+            return left == right
+        if self.op == "!=":
+            return left != right
+        if self.op == "<":
+            return left < right
+        if self.op == "<=":
+            return left <= right
+        if self.op == ">":
+            return left > right
+        return left >= right
+
+
+class InventoryStore:
+    """SQLite store of the inventories collected from each host.
+
+    Every collection is kept in ``inventory`` keyed by host and collection
+    time, while ``facts`` holds the flattened latest inventory of each host so
+    fleet-wide filters and aggregations are answered without reaching any BMC.
+    ``members`` keeps the collection members downloaded from each host with
+    their ETag, so the next collection only downloads the ones that changed.
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(self.path)
+        self._db.executescript(SCHEMA)
+
+    def __enter__(self) -> "InventoryStore":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._db.close()
+
+    def save(self, host: str, document: Dict[str, Any], collected: Optional[float] = None) -> None:
+        collected = time.time() if collected is None else collected
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO inventory (host, collected, document) VALUES (?, ?, ?)",
+                (host, collected, json.dumps(document)),
+            )
+            self._db.execute("DELETE FROM facts WHERE host = ?", (host,))
+            self._db.executemany(
+                "INSERT INTO facts (host, path, value) VALUES (?, ?, ?)",
+                ((host, path, value) for path, value in flatten(document)),
+            )
+
+    def members(self, host: str) -> Dict[str, Tuple[str, str]]:
+        """ETag and body of the collection members last downloaded from ``host``, by URI."""
+        rows = self._db.execute("SELECT uri, etag, document FROM members WHERE host = ?", (host,))
+        return {uri: (etag, document) for uri, etag, document in rows}
+
+    def save_members(self, host: str, members: Dict[str, Tuple[str, str]]) -> None:
+        """Replace the stored collection members of ``host``."""
+        with self._db:
+            self._db.execute("DELETE FROM members WHERE host = ?", (host,))
+            self._db.executemany(
+                "INSERT INTO members (host, uri, etag, document) VALUES (?, ?, ?, ?)",
+                ((host, uri, etag, document) for uri, (etag, document) in members.items()),
+            )
+
+    def latest(self, host: str) -> Optional[Tuple[float, Dict[str, Any]]]:
+        """Collection time and document of the most recent inventory of ``host``."""
+        row = self._db.execute(
+            "SELECT collected, document FROM inventory WHERE host = ? ORDER BY collected DESC LIMIT 1", (host,)
+        ).fetchone()
+        return (row[0], json.loads(row[1])) if row else None
+
+    def collected(self) -> Dict[str, float]:
+        """Time of the most recent collection of every stored host."""
+        return dict(self._db.execute("SELECT host, MAX(collected) FROM inventory GROUP BY host ORDER BY host"))
+
+    def stale(self, hosts: Iterable[str], max_age: float, now: Optional[float] = None) -> List[str]:
+        """``hosts`` never collected or collected more than ``max_age`` seconds ago."""
+        now = time.time() if now is None else now
+        collected = self.collected()
+        return [host for host in hosts if host not in collected or now - collected[host] > max_age]
+
+    def _facts(self, path: str, hosts: Optional[Iterable[str]] = None) -> List[Tuple[str, str, str]]:
+        sql = "SELECT host, path, value FROM facts WHERE path GLOB ?"
+        params: List[Any] = [path]
+        if hosts is not None:
+            # One JSON parameter whatever the size of the fleet, SQLite caps the number of bound ones
+            sql += " AND host IN (SELECT value FROM json_each(?))"
+            params.append(json.dumps(list(hosts)))
+        return self._db.execute(sql + " ORDER BY host, rowid", params).fetchall()
+
+    def query(self, filters: Iterable[Filter] = ()) -> Dict[str, Dict[str, str]]:
+        """Hosts whose latest inventory satisfies every filter, with the facts that matched."""
+        matched: Optional[Dict[str, Dict[str, str]]] = None
+        for _filter in filters:
+            hits: Dict[str, Dict[str, str]] = {}
+            for host, path, value in self._facts(_filter.path, matched):
+                if _filter.matches(value):
+                    hits.setdefault(host, {})[path] = value
+            if matched is None:
+                matched = hits
+            else:
+                matched = {host: {**matched[host], **hits[host]} for host in matched if host in hits}
+            if not matched:
+                return {}
+        if matched is None:
+            return {host: {} for host in self.collected()}
+        return dict(sorted(matched.items()))
+
+    def count_by(self, path: str, hosts: Optional[Iterable[str]] = None) -> Dict[str, int]:
+        """Number of hosts having each value at the facts matching ``path``."""
+        counts: Dict[str, set] = {}
+        for host, _, value in self._facts(path, hosts):
+            counts.setdefault(value, set()).add(host)
+        return {value: len(counted) for value, counted in sorted(counts.items(), key=lambda item: -len(item[1]))}
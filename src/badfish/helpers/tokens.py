@@ -0,0 +1,104 @@
+import fcntl
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from badfish.config import TOKEN_STORE_MAX_AGE
+
+
+class TokenStore:
+    """Session tokens kept between runs in a single file readable only by its owner.
+
+    Opening a session is one of the slowest iDRAC operations and a BMC only
+    allows a handful of them at once, so instead of opening and deleting one
+    on every run the session of each host is left open and its token stored
+    here, keyed by host and username. A stored token is trusted until the BMC
+    answers 401 with it, or until it has not been used for ``max_age``
+    seconds; an expired entry is kept so its session can still be deleted.
+
+    Updates hold an exclusive ``flock`` on a lock file next to the store, so
+    concurrent runs never lose each other's tokens.
+    """
+
+    def __init__(self, path: str, max_age: float = TOKEN_STORE_MAX_AGE):
+        self.path = os.path.expanduser(path)
+        self.max_age = max_age
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r") as _file:
+                sessions = json.load(_file)
+        except (OSError, ValueError):
+            return {}
+        return sessions if isinstance(sessions, dict) else {}
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(self.path + ".lock", os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            os.close(fd)
+
+    def _write(self, sessions: Dict[str, Dict[str, Any]]) -> None:
+        directory = os.path.dirname(self.path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # mkstemp creates the file with 0600 and the rename keeps it
+        fd, path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as _file:
+                json.dump(sessions, _file)
+            os.replace(path, self.path)
+        except OSError:
+            if os.path.exists(path):
+                os.remove(path)
+            raise
+
+    def get(self, host: str, username: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Token and session location stored for ``username`` on ``host``, None when missing or too old."""
+        now = time.time() if now is None else now
+        session = self._read().get(host)
+        if not isinstance(session, dict) or session.get("username") != username or not session.get("token"):
+            return None
+        if now - session.get("saved", 0) > self.max_age:
+            return None
+        return session
+
+    def stale(self, host: str, username: str, now: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Entry stored for ``username`` on ``host`` that is too old to be reused, None otherwise."""
+        now = time.time() if now is None else now
+        session = self._read().get(host)
+        if not isinstance(session, dict) or session.get("username") != username or not session.get("token"):
+            return None
+        return session if now - session.get("saved", 0) > self.max_age else None
+
+    def touch(self, host: str, token: str, now: Optional[float] = None) -> None:
+        """Mark the stored ``token`` of ``host`` as just used, keeping it from expiring."""
+        with self._locked():
+            sessions = self._read()
+            session = sessions.get(host)
+            if isinstance(session, dict) and session.get("token") == token:
+                session["saved"] = time.time() if now is None else now
+                self._write(sessions)
+
+    def put(self, host: str, username: str, token: str, location: Optional[str], now: Optional[float] = None) -> None:
+        with self._locked():
+            sessions = self._read()
+            sessions[host] = {
+                "username": username,
+                "token": token,
+                "location": location,
+                "saved": time.time() if now is None else now,
+            }
+            self._write(sessions)
+
+    def drop(self, host: str) -> None:
+        with self._locked():
+            sessions = self._read()
+            if sessions.pop(host, None) is not None:
+                self._write(sessions)
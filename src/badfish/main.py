@@ -10,7 +10,6 @@ import sys
 import time
 import warnings
 import yaml
-import tempfile
 from urllib.parse import urlparse
 
 from io import StringIO
@@ -18,22 +17,79 @@ from io import StringIO
 from rich.console import Console
 from rich.table import Table
 
+from badfish.config import (
+    CONNECTION_LIMIT,
+    CONNECTION_LIMIT_PER_HOST,
+    FETCH_CONCURRENCY,
+    MAX_CONCURRENCY,
+    SESSION_LOCK_DIR,
+)
 from badfish.helpers import get_now
 from badfish.helpers.parser import parse_arguments
-from badfish.helpers.logger import BadfishLogger
-from badfish.helpers.http_client import HTTPClient
+from badfish.helpers.logger import SEPARATOR, BadfishLogger
+from badfish.helpers.http_client import HTTPClient, create_connector
+from badfish.helpers.discovery import DISCOVERED, DiscoveryCache
 from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.firmware import ComplianceIndex, compare_firmware, load_baseline
 from badfish.helpers.progress import polling_progress
+from badfish.helpers.scheduler import gather_bounded, run_bounded
+from badfish.helpers.slots import SessionSlots
+from badfish.helpers.store import Filter, InventoryStore
+from badfish.helpers.tokens import TokenStore
 
 from logging import (
     DEBUG,
     INFO,
+    WARNING,
     getLogger,
 )
 
 warnings.filterwarnings("ignore")
 
 RETRIES = 15
+JOB_STATUS_FIELDS = ("Id", "Name", "Message", "PercentComplete")
+# Resources the commands working on only one of them need, anything else is discovered on first use
+COMMAND_RESOURCES = {
+    "power_state": ("system",),
+    "power_on": ("system",),
+    "power_off": ("system",),
+    "power_cycle": ("system",),
+    "reboot_only": ("system",),
+    "get_power_consumed": ("system",),
+    "clear_jobs": ("manager",),
+    "check_job": ("manager",),
+    "ls_jobs": ("manager",),
+    "racreset": ("manager",),
+    "bmc_reset": ("manager",),
+}
+
+
+def log_document(logger, document):
+    """Log a structured document as YAML, one line per record, so formatted output can parse it back."""
+    for line in yaml.dump(document, sort_keys=False, default_flow_style=False, Dumper=yaml.SafeDumper).splitlines():
+        logger.info(line)
+
+
+def needs(*resources):
+    """Declare the Redfish resources ("system", "manager") a Badfish operation uses, discovered before it runs."""
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, **kwargs):
+            await self.discover(*resources)
+            return await method(self, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def command_resources(_args):
+    """Resources to discover up front for the command in ``_args``, None for all of them."""
+    commands = [command for command in COMMAND_RESOURCES if _args.get(command)]
+    if len(commands) != 1:
+        return None
+    return COMMAND_RESOURCES[commands[0]]
 
 
 async def badfish_factory(
@@ -46,6 +102,13 @@ async def badfish_factory(
     _insecure=False,
     _console=None,
     _progress_disabled=False,
+    _connector=None,
+    _ca_bundle=None,
+    _fetch_concurrency=FETCH_CONCURRENCY,
+    _discovery_cache=None,
+    _token_store=None,
+    _resources=None,
+    _session_slots=None,
 ):
     if not _logger:
         bfl = BadfishLogger()
@@ -61,8 +124,18 @@ async def badfish_factory(
         _insecure,
         _console,
         _progress_disabled,
+        _connector,
+        _ca_bundle,
+        _fetch_concurrency,
+        _discovery_cache,
+        _token_store,
+        _session_slots,
     )
-    await badfish.init()
+    try:
+        await badfish.init(_resources)
+    except BaseException:
+        await badfish.http_client.close()
+        raise
     return badfish
 
 
@@ -78,6 +151,12 @@ class Badfish:
         _insecure=False,
         _console=None,
         _progress_disabled=False,
+        _connector=None,
+        _ca_bundle=None,
+        _fetch_concurrency=FETCH_CONCURRENCY,
+        _discovery_cache=None,
+        _token_store=None,
+        _session_slots=None,
     ):
         self.host = _host
         self.username = _username
@@ -87,11 +166,13 @@ class Badfish:
         self.redfish_uri = "/redfish/v1"
         self.root_uri = "%s%s" % (self.host_uri, self.redfish_uri)
         self.logger = _logger
-        self.semaphore = asyncio.Semaphore(50)
         self.loop = _loop
         if not self.loop:
             self.loop = asyncio.get_event_loop()
-        self.http_client = HTTPClient(_host, _username, _password, _logger, _retries, _insecure)
+        self.http_client = HTTPClient(_host, _username, _password, _logger, _retries, _insecure, _connector, _ca_bundle)
+        self.fetch_slots = asyncio.Semaphore(max(1, _fetch_concurrency))
+        self.member_etags = {}
+        self._known_members = {}
         self.system_resource = None
         self.manager_resource = None
         self.bios_uri = None
@@ -100,6 +181,14 @@ class Badfish:
         self.session_id = None
         self.token = None
         self.vendor = None
+        self.redfish_version = None
+        self._service_root = None
+        self._discovering = {}
+        self.discovery_cache = _discovery_cache
+        self.discovered_from_cache = False
+        self.token_store = _token_store
+        self.http_client.reauthenticate = self.renew_session
+        self.http_client.session_slots = _session_slots
         self.console = _console if _console is not None else Console()
         self._progress_disabled = _progress_disabled
         # Tables are useful only in the same conditions as progress bars: TTY,
@@ -124,22 +213,141 @@ class Badfish:
             self.logger.debug(f"Exiting context with exception: {exc_type.__name__}: {exc_val}")
         return False
 
-    async def init(self):
+    async def init(self, resources=None):
+        """Open a session and discover ``resources``, by default both the system and the manager.
+
+        Operations discover any other resource they need on first use.
+        """
+        if self.discovery_cache and await self.init_from_cache():
+            return
         self.session_uri = await self.find_session_uri()
-        self.token = await self.validate_credentials()
-        try:
+        self.token = await self.open_session()
+        # With a discovery cache the whole layout is discovered once, so later runs skip all of it
+        if resources is not None and not self.discovery_cache:
+            await self.discover(*resources)
+            return
+        # Both walks only depend on the service root, which they share
+        system_error, manager_error = await asyncio.gather(
+            self.discover("system"), self.discover("manager"), return_exceptions=True
+        )
+        if isinstance(system_error, BadfishException):
+            self.logger.warning(
+                f"Could not find system resource: {system_error}. Some operations may not be available."
+            )
+        elif isinstance(system_error, BaseException):
+            raise system_error
+        if isinstance(manager_error, BaseException):
+            raise manager_error
+
+    async def discover(self, *resources):
+        """Discover the ``resources`` not known yet, at the same time and only once however many callers ask."""
+        steps = []
+        for resource in resources:
+            if getattr(self, f"{resource}_resource") is not None:
+                continue
+            step = self._discovering.get(resource)
+            # A finished step left the resource unknown, so it failed and is tried again
+            if step is None or step.done():
+                step = self._discovering[resource] = asyncio.ensure_future(self._discover(resource))
+            steps.append(asyncio.shield(step))
+        if steps:
+            await asyncio.gather(*steps)
+            await self.save_discovery()
+
+    async def _discover(self, resource):
+        if resource == "system":
             self.system_resource = await self.find_systems_resource()
             self.bios_uri = "%s/Bios/Settings" % self.system_resource[len(self.redfish_uri) :]
-        except BadfishException as e:
-            self.logger.warning(f"Could not find system resource: {e}. Some operations may not be available.")
-            self.system_resource = None
+        else:
+            self.manager_resource = await self.find_managers_resource()
+
+    async def save_discovery(self):
+        """Write the discovery of the host to the discovery cache once both resources are known."""
+        if not self.discovery_cache or self.discovered_from_cache:
+            return
+        if not self.system_resource or not self.manager_resource:
+            return
+        discovered = {key: getattr(self, key) for key in DISCOVERED}
+        discovered["protocol_features"] = await self.http_client.protocol_features()
+        try:
+            self.discovery_cache.save(self.host, discovered)
+        except OSError as ex:
+            self.logger.debug(f"Could not cache the discovery of {self.host}: {ex}")
+
+    async def init_from_cache(self):
+        """Skip discovery with the cached values of the host, only opening a session with them.
+
+        When the session cannot be opened the entry is dropped and False is
+        returned so discovery runs as usual.
+        """
+        cached = self.discovery_cache.load(self.host)
+        if not cached:
+            return False
+        features = cached.pop("protocol_features", None)
+        for key, value in cached.items():
+            setattr(self, key, value)
+        self.bios_uri = "%s/Bios/Settings" % self.system_resource[len(self.redfish_uri) :]
+        try:
+            self.token = await self.open_session()
+        except BadfishException as ex:
+            self.logger.debug(f"Cached discovery of {self.host} is no longer valid: {ex}")
+            self.discovery_cache.invalidate(self.host)
+            for key in DISCOVERED:
+                setattr(self, key, None)
             self.bios_uri = None
-        self.manager_resource = await self.find_managers_resource()
+            return False
+        if features is not None:
+            self.http_client.use_protocol_features(features)
+        self.discovered_from_cache = True
+        return True
+
+    async def open_session(self):
+        """Token of a session on the host, the stored one when a token store has it or a new one."""
+        if self.token_store:
+            stored = self.token_store.get(self.host, self.username)
+            if stored:
+                self.logger.debug(f"Reusing stored session of {self.host}.")
+                self.token = self.http_client.token = stored["token"]
+                self.session_id = stored["location"]
+                return self.token
+            stale = self.token_store.stale(self.host, self.username)
+            if stale:
+                await self.close_stale_session(stale)
+        token = await self.validate_credentials()
+        if self.token_store and token:
+            self.token_store.put(self.host, self.username, token, self.session_id)
+        return token
+
+    async def close_stale_session(self, stale):
+        """Delete the session of an expired token store entry before it is replaced, in case the BMC kept it."""
+        if not stale.get("location"):
+            return
+        headers = {"content-type": "application/json", "X-Auth-Token": stale["token"]}
+        try:
+            response = await self.delete_request("%s%s" % (self.host_uri, stale["location"]), headers)
+        except BadfishException as ex:
+            self.logger.debug(f"Could not delete the stale session of {self.host}: {ex}")
+            return
+        self.logger.debug(f"Deleting the stale session of {self.host} returned {response.status}.")
+
+    async def renew_session(self):
+        """Open a new session after the BMC rejected the token, returning whether it could."""
+        if self.token_store:
+            self.token_store.drop(self.host)
+        if not self.session_uri:
+            return False
+        try:
+            self.token = await self.validate_credentials()
+        except BadfishException as ex:
+            self.logger.debug(f"Could not authenticate again to {self.host}: {ex}")
+            return False
+        if self.token_store and self.token:
+            self.token_store.put(self.host, self.username, self.token, self.session_id)
+        return bool(self.token)
 
     async def error_handler(self, _response, message=None):
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
         except ValueError:
             raise BadfishException("Error reading response from host.")
 
@@ -220,6 +428,7 @@ class Badfish:
         sriov_mode = await self.get_bios_attribute(attribute)
         return sriov_mode
 
+    @needs("system")
     async def get_bios_attributes_registry(self):
         self.logger.debug("Getting BIOS attribute registry.")
         _uri = "%s%s/Bios/BiosRegistry" % (self.host_uri, self.system_resource)
@@ -245,10 +454,11 @@ class Badfish:
                 return True
         raise BadfishException(f"Unable to locate the Bios attribute: {attribute}")
 
-    async def get_bios_attributes(self):
+    @needs("system")
+    async def get_bios_attributes(self, fields=None):
         self.logger.debug("Getting BIOS attributes.")
         _uri = "%s%s/Bios" % (self.host_uri, self.system_resource)
-        data = await self.http_client.get_json(_uri)
+        data = await self.http_client.get_json(_uri, fields=fields)
 
         if not data:
             self.logger.error("Operation not supported by vendor.")
@@ -257,7 +467,7 @@ class Badfish:
         return data
 
     async def get_bios_attribute(self, attribute):
-        data = await self.get_bios_attributes()
+        data = await self.get_bios_attributes(fields=[f"Attributes/{attribute}"])
         try:
             bios_attribute = data["Attributes"][attribute]
             return bios_attribute
@@ -267,6 +477,9 @@ class Badfish:
 
     async def set_bios_attribute(self, attributes):
         data = await self.get_bios_attributes_registry()
+        # Current values of every attribute to set, in a single GET
+        current = await self.get_bios_attributes(fields=[f"Attributes/{attribute}" for attribute in attributes])
+        current = (current.get("Attributes") or {}) if current else {}
         accepted = False
         for entry in data["RegistryEntries"]["Attributes"]:
             entries = [low_entry.lower() for low_entry in entry.values() if isinstance(low_entry, str)]
@@ -285,7 +498,9 @@ class Badfish:
                             if not accepted:
                                 _warnings.append(f"List of accepted values for '{attribute}': {accepted_values}")
 
-                attribute_value = await self.get_bios_attribute(attribute)
+                attribute_value = current.get(attribute)
+                if attribute_value is None:
+                    self.logger.warning("Could not retrieve Bios Attributes.")
                 if attribute_value:
                     if value.lower() == attribute_value.lower():
                         self.logger.warning(f"Attribute value for {attribute} is already in that state. IGNORING.")
@@ -309,6 +524,7 @@ class Badfish:
         await self.patch_bios(_payload, insist=False)
         await self.reboot_server()
 
+    @needs("system")
     async def get_boot_devices(self):
         if not self.boot_devices:
             _boot_seq = await self.get_boot_seq()
@@ -316,14 +532,13 @@ class Badfish:
             _response = await self.get_request(_uri)
 
             if _response and _response.status == 404:
-                self.logger.debug(await _response.text())
+                self.logger.debug(_response.text())
                 raise BadfishException("Boot order modification is not supported by this host.")
 
             if not _response:
                 raise BadfishException("Boot order modification is not supported by this host.")
 
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
             if "Attributes" in data:
                 try:
                     self.boot_devices = data["Attributes"][_boot_seq]
@@ -338,17 +553,19 @@ class Badfish:
                 self.logger.debug(data)
                 raise BadfishException("Boot order modification is not supported by this host.")
 
+    @needs("manager")
     async def get_job_queue(self):
         self.logger.debug("Getting job queue.")
         _url = "%s%s/Jobs" % (self.host_uri, self.manager_resource)
-        _response = await self.get_request(_url)
+        _response = await self.get_request(_url, max_age=0)
 
-        data = await _response.text("utf-8", "ignore")
+        data = _response.text()
         job_queue = re.findall(r"[JR]ID_.+?\d+", data)
         jobs = [job.strip("}").strip('"').strip("'") for job in job_queue]
         return jobs
 
     async def get_reset_types(self, manager=False, bmc=False):
+        await self.discover("manager" if manager else "system")
         if manager:
             resource = self.manager_resource
             endpoint = "#Manager.Reset"
@@ -361,8 +578,7 @@ class Badfish:
         _response = await self.get_request(_url)
         reset_types = []
         if _response:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
             if "Actions" not in data:
                 self.logger.warning("Actions resource not found")
             else:
@@ -427,10 +643,10 @@ class Badfish:
         if response.status == 401:
             raise BadfishException(f"Failed to authenticate. Verify your credentials for {self.host}")
 
-        raw = await response.text("utf-8", "ignore")
-        data = json.loads(raw.strip())
+        data = response.json()
         try:
-            redfish_version = int(data["RedfishVersion"].replace(".", ""))
+            self.redfish_version = data["RedfishVersion"]
+            redfish_version = int(self.redfish_version.replace(".", ""))
         except KeyError:
             raise BadfishException("Was unable to get Redfish Version. Please verify credentials/host.")
         session_uri = None
@@ -451,9 +667,7 @@ class Badfish:
         headers = {"content-type": "application/json"}
         _uri = "%s%s" % (self.host_uri, self.session_uri)
 
-        _response = await self.http_client.post_request(_uri, payload, headers, _get_token=True)
-
-        await _response.text("utf-8", "ignore")
+        _response = await self.http_client.create_session(_uri, payload, headers)
 
         status = _response.status
         if status == 401:
@@ -471,6 +685,7 @@ class Badfish:
 
         return token
 
+    @needs("system")
     async def get_interfaces_endpoints(self):
         _uri = "%s%s/EthernetInterfaces" % (self.host_uri, self.system_resource)
         data = await self.http_client.get_json(_uri)
@@ -496,13 +711,22 @@ class Badfish:
 
         return data
 
-    async def find_systems_resource(self):
+    async def get_service_root(self):
+        """Service root document, fetched once for all the concurrent discovery steps that need it."""
+        if self._service_root is None or (self._service_root.done() and self._service_root.exception()):
+            self._service_root = asyncio.ensure_future(self._fetch_service_root())
+        return await asyncio.shield(self._service_root)
+
+    async def _fetch_service_root(self):
         response = await self.http_client.get_request(self.root_uri)
         if not response:
             raise BadfishException("Failed to communicate with server.")
+        data = response.json()
+        self.vendor = "Dell" if data.get("Oem") and "Dell" in data["Oem"] else "Supermicro"
+        return data
 
-        raw = await response.text("utf-8", "ignore")
-        data = json.loads(raw.strip())
+    async def find_systems_resource(self):
+        data = await self.get_service_root()
         if "Systems" not in data:
             raise BadfishException("Systems resource not found")
 
@@ -511,8 +735,7 @@ class Badfish:
         if not systems_response:
             raise BadfishException("Authorization Error: verify credentials.")
 
-        raw = await systems_response.text("utf-8", "ignore")
-        systems_data = json.loads(raw.strip())
+        systems_data = systems_response.json()
 
         if systems_data.get("Members"):
             for member in systems_data["Members"]:
@@ -523,14 +746,7 @@ class Badfish:
             raise BadfishException("ComputerSystem's Members array is either empty or missing")
 
     async def find_managers_resource(self):
-        response = await self.http_client.get_request(self.root_uri)
-        if not response:
-            raise BadfishException("Failed to communicate with server.")
-
-        raw = await response.text("utf-8", "ignore")
-        data = json.loads(raw.strip())
-        self.vendor = "Dell" if data.get("Oem") and "Dell" in data["Oem"] else "Supermicro"
-
+        data = await self.get_service_root()
         if "Managers" not in data:
             raise BadfishException("Managers resource not found")
 
@@ -538,8 +754,7 @@ class Badfish:
         managers_response = await self.http_client.get_request(self.host_uri + managers)
         managers_data = None
         if managers_response:
-            raw = await managers_response.text("utf-8", "ignore")
-            managers_data = json.loads(raw.strip())
+            managers_data = managers_response.json()
         if managers_data and managers_data.get("Members"):
             for member in managers_data["Members"]:
                 managers_service = member["@odata.id"]
@@ -549,8 +764,8 @@ class Badfish:
             raise BadfishException("Manager's Members array is either empty or missing")
 
     # HTTP client wrapper methods
-    async def get_request(self, uri, _continue=False, _get_token=False):
-        return await self.http_client.get_request(uri, _continue, _get_token)
+    async def get_request(self, uri, _continue=False, _get_token=False, max_age=None, fields=None):
+        return await self.http_client.get_request(uri, _continue, _get_token, max_age=max_age, fields=fields)
 
     async def post_request(self, uri, payload, headers, _get_token=False):
         return await self.http_client.post_request(uri, payload, headers, _get_token)
@@ -561,11 +776,72 @@ class Badfish:
     async def delete_request(self, uri, headers):
         return await self.http_client.delete_request(uri, headers)
 
+    async def get_collection(self, uri):
+        # With members from an earlier run only the listing is needed, to fetch just the changed ones
+        _uri = uri if self._known_members else await self.http_client.expand_uri(uri)
+        async with self.fetch_slots:
+            return await self.get_request(_uri)
+
+    def load_members(self, members):
+        """Seed collection members downloaded by an earlier run, given as ``{uri: (etag, body)}``.
+
+        Members whose ``@odata.etag`` in the collection listing still matches
+        are not fetched again, and the others are fetched with a conditional
+        GET so unchanged ones come back as 304 without a body.
+        """
+        for uri, (etag, body) in members.items():
+            self._known_members[uri] = (etag, body)
+            self.http_client.remember(uri, etag, body)
+
+    async def get_collection_member(self, member, _continue=False):
+        """Resource of a collection member, either expanded inline or fetched from its @odata.id.
+
+        The ETag and body of fetched members, and of expanded ones carrying an
+        ``@odata.etag``, are kept in ``member_etags``.
+        """
+        if set(member) - {"@odata.id", "@odata.etag"}:
+            if member.get("@odata.id") and member.get("@odata.etag"):
+                _uri = "%s%s" % (self.host_uri, member["@odata.id"])
+                self.member_etags[_uri] = (member["@odata.etag"], json.dumps(member))
+            return member
+        _uri = "%s%s" % (self.host_uri, member["@odata.id"])
+        known = self._known_members.get(_uri)
+        if known and member.get("@odata.etag") == known[0]:
+            self.member_etags[_uri] = known
+            return json.loads(known[1])
+        async with self.fetch_slots:
+            _response = await self.get_request(_uri, _continue)
+        if _response is None:
+            return None
+        data = _response.json()
+        etag = _response.headers.get("ETag") or (data.get("@odata.etag") if isinstance(data, dict) else None)
+        if etag:
+            self.member_etags[_uri] = (etag, _response.text())
+        return data
+
+    async def get_collection_members(self, data, member_filter=None, _continue=False):
+        """Resources of the members of a collection, in collection order.
+
+        Members that are not expanded inline are fetched concurrently, holding one
+        of the host's ``fetch_slots`` each. With ``_continue`` the members that
+        could not be fetched are skipped.
+        """
+        members = [
+            member for member in data.get("Members") or [] if not member_filter or member_filter(member["@odata.id"])
+        ]
+        resources = await asyncio.gather(*(self.get_collection_member(member, _continue) for member in members))
+        return [resource for resource in resources if resource is not None]
+
+    @needs("system")
     async def get_power_state(self):
         _uri = "%s%s" % (self.host_uri, self.system_resource)
         self.logger.debug("url: %s" % _uri)
 
-        data = await self.http_client.get_json(_uri, _continue=True)
+        _response = await self.http_client.get_request(_uri, _continue=True, max_age=0, fields=["PowerState"])
+        try:
+            data = _response.json() if _response else None
+        except ValueError:
+            data = None
         if not data:
             self.logger.debug("Couldn't get power state. Retrying.")
             return "Down"
@@ -577,6 +853,7 @@ class Badfish:
 
         return data["PowerState"]
 
+    @needs("system")
     async def set_power_state(self, state):
         if state.lower() not in ["on", "off"]:
             raise BadfishException("Power state not valid. 'on' or 'off' only accepted.")
@@ -584,15 +861,14 @@ class Badfish:
         _uri = "%s%s" % (self.host_uri, self.system_resource)
         self.logger.debug("url: %s" % _uri)
 
-        _response = await self.get_request(_uri, _continue=True)
+        _response = await self.get_request(_uri, _continue=True, max_age=0)
         if not _response and state.lower() == "off":
             self.logger.warning("Power state appears to be already set to 'off'.")
             return
 
         status = _response.status
         if status == 200:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
         else:
             raise BadfishException("Couldn't get power state.")
 
@@ -608,16 +884,16 @@ class Badfish:
 
         return data["PowerState"]
 
+    @needs("system")
     async def get_power_consumed_watts(self):
         _uri = "%s%s/Chassis/%s/Power" % (self.host_uri, self.redfish_uri, self.system_resource.split("/")[-1])
-        _response = await self.get_request(_uri)
+        _response = await self.get_request(_uri, max_age=0)
 
         if _response.status == 404:
             self.logger.error("Operation not supported by vendor.")
             return False
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
         except ValueError:
             raise BadfishException("Power value outside operating range.")
         try:
@@ -627,6 +903,7 @@ class Badfish:
         self.logger.info(f"Current watts consumed: {cwc}")
         return
 
+    @needs("system")
     async def change_boot(self, host_type, interfaces_path, pxe=False):
         if interfaces_path:
             if not os.path.exists(interfaces_path):
@@ -697,6 +974,7 @@ class Badfish:
         else:
             self.logger.warning("No changes were made since the boot order already matches the requested.")
 
+    @needs("system")
     async def patch_boot_seq(self, ordered_devices):
         _boot_seq = await self.get_boot_seq()
         boot_sources_uri = "%s/BootSources/Settings" % self.system_resource
@@ -705,15 +983,17 @@ class Badfish:
         headers = {"content-type": "application/json"}
         response = None
         _status_code = 400
+        retry_policy = self.http_client.retry_policy
 
-        for _ in range(self.retries):
-            if _status_code != 200:
-                response = await self.patch_request(url, payload, headers, True)
-                if response:
-                    raw = await response.text("utf-8", "ignore")
-                    self.logger.debug(raw)
-                    _status_code = response.status
-            else:
+        for attempt in range(self.retries):
+            response = await self.patch_request(url, payload, headers, True)
+            if response:
+                raw = response.text()
+                self.logger.debug(raw)
+                _status_code = response.status
+                if _status_code == 200 or not retry_policy.retryable(_status_code):
+                    break
+            if not await retry_policy.wait(attempt, response):
                 break
 
         if _status_code == 200:
@@ -724,6 +1004,7 @@ class Badfish:
             if response:
                 await self.error_handler(response)
 
+    @needs("system")
     async def set_next_boot_pxe(self):
         _url = "%s%s" % (self.host_uri, self.system_resource)
         _payload = {
@@ -753,6 +1034,7 @@ class Badfish:
 
         return True
 
+    @needs("system")
     async def check_supported_network_interfaces(self, endpoint):
         _url = "%s%s/%s" % (self.host_uri, self.system_resource, endpoint)
         _response = await self.get_request(_url)
@@ -777,6 +1059,7 @@ class Badfish:
                 message="Job queue not cleared, there was something wrong with your request.",
             )
 
+    @needs("manager")
     async def delete_job_queue_force(self):
         _url = "%s%s/Jobs" % (self.host_uri, self.manager_resource)
         _headers = {"content-type": "application/json"}
@@ -790,6 +1073,7 @@ class Badfish:
             raise BadfishException("There was something wrong clearing the job queue.")
         return _response
 
+    @needs("manager")
     async def clear_job_list(self, _job_queue):
         _url = "%s%s/Jobs" % (self.host_uri, self.manager_resource)
         _headers = {"content-type": "application/json"}
@@ -849,20 +1133,21 @@ class Badfish:
             self.logger.debug("%s job ID successfully created" % job_id)
         return job_id
 
+    @needs("manager")
     async def create_bios_config_job(self, uri):
         _url = "%s%s/Jobs" % (self.host_uri, self.manager_resource)
         _payload = {"TargetSettingsURI": "%s%s" % (self.redfish_uri, uri)}
         _headers = {"content-type": "application/json"}
         return await self.create_job(_url, _payload, _headers)
 
+    @needs("manager")
     async def check_schedule_job_status(self, job_id):
         _url = f"{self.host_uri}{self.manager_resource}/Jobs/{job_id}"
-        _response = await self.get_request(_url)
+        _response = await self.get_request(_url, max_age=0)
 
         if _response:
             status_code = _response.status
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
 
             if status_code == 200:
                 await asyncio.sleep(10)
@@ -880,6 +1165,7 @@ class Badfish:
             self.logger.error("Command failed to check job status")
             return False
 
+    @needs("manager")
     async def check_job_status(self, job_id):
         with polling_progress(self.console, self.retries, "Status", disable=self._progress_disabled) as (
             progress,
@@ -887,12 +1173,10 @@ class Badfish:
         ):
             for count in range(self.retries):
                 _url = f"{self.host_uri}{self.manager_resource}/Jobs/{job_id}"
-                self.http_client.get_request.cache_clear()
-                _response = await self.get_request(_url)
+                _response = await self.get_request(_url, max_age=0, fields=JOB_STATUS_FIELDS)
 
                 status_code = _response.status
-                raw = await _response.text("utf-8", "ignore")
-                data = json.loads(raw.strip())
+                data = _response.json()
                 if status_code != 200:
                     self.logger.error(f"Command failed to check job status, return code is {status_code}")
                     self.logger.debug(f"Extended Info Message: {data}")
@@ -951,6 +1235,7 @@ class Badfish:
                 self.logger.error(f"Failed to find a job ID in headers of the response: {e}")
             return None
 
+    @needs("manager")
     async def _verify_job_scheduled(self, job_id, context="configuration"):
         """
         Verify that a job has been scheduled and is not already failed.
@@ -971,10 +1256,9 @@ class Badfish:
         # Check job status to ensure it's scheduled properly
         job_url = f"{self.host_uri}{self.manager_resource}/Jobs/{job_id}"
         try:
-            job_response = await self.get_request(job_url)
+            job_response = await self.get_request(job_url, max_age=0)
             if job_response.status == 200:
-                job_raw = await job_response.text("utf-8", "ignore")
-                job_data = json.loads(job_raw.strip())
+                job_data = job_response.json()
                 job_state = job_data.get("JobState", "Unknown")
                 job_message = job_data.get("Message", "No message")
                 self.logger.info(f"Job {job_id} status: {job_state} - {job_message}")
@@ -1061,6 +1345,7 @@ class Badfish:
             self.logger.error("Could not verify final attribute value.")
             return False
 
+    @needs("system")
     async def send_reset(self, reset_type):
         _url = "%s%s/Actions/ComputerSystem.Reset" % (
             self.host_uri,
@@ -1115,6 +1400,7 @@ class Badfish:
             await self.send_reset("On")
         return True
 
+    @needs("manager")
     async def reset_idrac(self, wait=False):
         if self.vendor != "Dell":
             self.logger.warning("Vendor isn't a Dell, if you are trying this on a Supermicro, use --bmc-reset instead.")
@@ -1138,7 +1424,7 @@ class Badfish:
         if status_code in [200, 204]:
             self.logger.info("Status code %s returned for POST command to reset iDRAC." % status_code)
         else:
-            data = await _response.text("utf-8", "ignore")
+            data = _response.text()
             raise BadfishException("Status code %s returned, error is: \n%s." % (status_code, data))
 
         if wait:
@@ -1153,6 +1439,7 @@ class Badfish:
             self.logger.info("iDRAC will now reset and be back online within a few minutes.")
             return True
 
+    @needs("manager")
     async def reset_bmc(self):
         if self.vendor != "Supermicro":
             self.logger.warning("Vendor isn't a Supermicro, if you are trying this on a Dell, use --racreset instead.")
@@ -1176,12 +1463,13 @@ class Badfish:
         if status_code == 200:
             self.logger.info("Status code %s returned for POST command to reset BMC." % status_code)
         else:
-            data = await _response.text("utf-8", "ignore")
+            data = _response.text()
             raise BadfishException("Status code %s returned, error is: \n%s." % (status_code, data))
 
         self.logger.info("BMC will now reset and be back online within a few minutes.")
         return True
 
+    @needs("system")
     async def reset_bios(self):
         self.logger.debug("Running BIOS reset.")
         _url = "%s%s/Bios/Actions/Bios.ResetBios/" % (
@@ -1199,12 +1487,13 @@ class Badfish:
         if status_code in [200, 204]:
             self.logger.info("Status code %s returned for POST command to reset BIOS." % status_code)
         else:
-            data = await _response.text("utf-8", "ignore")
+            data = _response.text()
             raise BadfishException("Status code %s returned, error is: \n%s." % (status_code, data))
 
         self.logger.info("BIOS will now reset and be back online within a few minutes.")
         return True
 
+    @needs("system")
     async def boot_to(self, device, skip_job=False):
         device_check = await self.check_device(device)
         if device_check:
@@ -1271,12 +1560,14 @@ class Badfish:
         await self.patch_bios(_payload)
         await self.reboot_server()
 
+    @needs("system")
     async def patch_bios(self, payload, insist=True):
         _url = "%s%s" % (self.root_uri, self.bios_uri)
         _headers = {"content-type": "application/json"}
         _first_reset = False
         payload_patch = {"@Redfish.SettingsApplyTime": {"ApplyTime": "OnReset"}}
         payload_patch.update(payload)
+        retry_policy = self.http_client.retry_policy
         for i in range(self.retries):
             _response = await self.patch_request(_url, payload_patch, _headers)
             status_code = _response.status
@@ -1285,7 +1576,7 @@ class Badfish:
                 break
             else:
                 self.logger.error("Command failed, error code is: %s." % status_code)
-                if status_code == 503 and i - 1 != self.retries:
+                if retry_policy.retryable(status_code) and await retry_policy.wait(i, _response):
                     self.logger.info("Retrying to send one time boot.")
                     continue
                 elif status_code == 400 and insist:
@@ -1361,15 +1652,13 @@ class Badfish:
 
         return desired_state
 
-    async def poll_until_ready(self, check_func, description, sleep_interval=5, clear_cache=False):
+    async def poll_until_ready(self, check_func, description, sleep_interval=5):
         self.logger.info("Polling for %s" % description)
         with polling_progress(self.console, self.retries, "Host state", disable=self._progress_disabled) as (
             progress,
             task_id,
         ):
             for count in range(self.retries):
-                if clear_cache:
-                    self.http_client.get_request.cache_clear()
                 ready = await check_func()
                 if ready:
                     progress.update(task_id, completed=self.retries, state="Ready")
@@ -1382,48 +1671,42 @@ class Badfish:
 
     async def wait_for_idrac_ready(self):
         async def check_idrac_responsive():
-            response = await self.get_request(self.root_uri, _continue=True)
+            response = await self.get_request(self.root_uri, _continue=True, max_age=0)
             return response and response.status == 200
 
         self.logger.info("Waiting for iDRAC to be ready after reset (this may take a few minutes)...")
         await asyncio.sleep(10)
-        return await self.poll_until_ready(check_idrac_responsive, "iDRAC", sleep_interval=10, clear_cache=True)
-
-    async def get_firmware_inventory(self):
-        self.logger.debug("Getting firmware inventory for all devices supported by iDRAC.")
+        return await self.poll_until_ready(check_idrac_responsive, "iDRAC", sleep_interval=10)
 
+    async def get_firmware_devices(self):
+        """Installed firmware of the devices supported by the BMC, without OData and OEM properties."""
         _url = "%s/UpdateService/FirmwareInventory/" % self.root_uri
-        _response = await self.get_request(_url)
+        _response = await self.get_collection(_url)
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
         except ValueError:
             raise BadfishException("Not able to access Firmware inventory.")
-        installed_devices = []
         if "error" in data:
             self.logger.debug(data["error"])
             raise BadfishException("Not able to access Firmware inventory.")
-        for device in data["Members"]:
-            a = device["@odata.id"]
-            a = a.replace("/redfish/v1/UpdateService/FirmwareInventory/", "")
-            if "Installed" in a:
-                installed_devices.append(a)
+
+        def installed(member_uri):
+            return "Installed" in member_uri.replace("/redfish/v1/UpdateService/FirmwareInventory/", "")
+
+        devices = await self.get_collection_members(data, installed, _continue=True)
 
         _SKIP = {"odata", "Description", "Oem"}
         rows = []
-        for device in installed_devices:
-            self.logger.debug("Getting device info for %s" % device)
-            _uri = "%s/UpdateService/FirmwareInventory/%s" % (self.root_uri, device)
+        for device in devices:
+            row = {k: v for k, v in device.items() if not any(s in k for s in _SKIP)}
+            rows.append(row)
+        return rows
 
-            _response = await self.get_request(_uri, _continue=True)
-            if not _response:
-                continue
+    async def get_firmware_inventory(self):
+        self.logger.debug("Getting firmware inventory for all devices supported by iDRAC.")
 
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
-            row = {k: v for k, v in data.items() if not any(s in k for s in _SKIP)}
-            rows.append(row)
+        rows = await self.get_firmware_devices()
 
         if rows:
             if self._use_tables:
@@ -1457,6 +1740,7 @@ class Badfish:
 
         return interfaces[0]
 
+    @needs("system")
     async def toggle_boot_device(self, device):
         if not self.boot_devices:
             await self.get_boot_devices()
@@ -1482,6 +1766,7 @@ class Badfish:
         await self.reboot_server(graceful=False)
         return True
 
+    @needs("manager")
     async def get_virtual_media_config(self):
         vm_path = "/"
         if self.vendor == "Supermicro":
@@ -1492,8 +1777,7 @@ class Badfish:
         _uri = "%s%s%s" % (self.host_uri, self.manager_resource, vm_path)
         _response = await self.get_request(_uri)
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
         except ValueError:
             raise BadfishException("Not able to access virtual media resource.")
 
@@ -1536,8 +1820,7 @@ class Badfish:
             _uri = "%s%s" % (self.host_uri, vm)
             _response = await self.get_request(_uri)
             try:
-                raw = await _response.text("utf-8", "ignore")
-                _data = json.loads(raw.strip())
+                _data = _response.json()
                 self.logger.info(f"{_data.get('Id')}:")
                 self.logger.info(f"    Name: {_data.get('Name')}")
                 self.logger.info(f"    ImageName: {_data.get('ImageName')}")
@@ -1619,6 +1902,7 @@ class Badfish:
                 raise BadfishException("There was something wrong trying to unmount virtual media.")
         return True
 
+    @needs("system")
     async def boot_to_virtual_media(self):
         og_log = self.logger
         self.logger = getLogger("Temp")
@@ -1635,8 +1919,7 @@ class Badfish:
 
             _response = await self.get_request(_uri)
             try:
-                raw = await _response.text("utf-8", "ignore")
-                _data = json.loads(raw.strip())
+                _data = _response.json()
                 allowable_boot_targets = _data.get("Boot").get("BootSourceOverrideTarget@Redfish.AllowableValues")
             except ValueError:
                 raise BadfishException("There was something wrong trying to boot to virtual media.")
@@ -1665,7 +1948,6 @@ class Badfish:
     async def check_os_deployment_support(self):
         _uri = "%s/redfish/v1/Dell/Systems/System.Embedded.1/DellOSDeploymentService" % self.host_uri
         _response = await self.get_request(_uri)
-        await _response.text("utf-8", "ignore")
         if _response.status != 200:
             self.logger.error(
                 "iDRAC version installed doesn't support DellOSDeploymentService needed for this feature."
@@ -1683,8 +1965,7 @@ class Badfish:
         _headers = {"Content-Type": "application/json"}
         _response = await self.post_request(_uri, payload={}, headers=_headers)
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
             if _response.status == 200:
                 self.logger.info("Current ISO attach status: %s" % data.get("ISOAttachStatus"))
                 if data.get("ISOAttachStatus") == "Attached":
@@ -1722,9 +2003,8 @@ class Badfish:
             self.logger.info("Command for booting to remote ISO was successful, job was created.")
             try:
                 task_path = _response.headers.get("Location")
-                response = await self.get_request(f"{self.host_uri}{task_path}")
-                raw = await response.text("utf-8", "ignore")
-                data = json.loads(raw.strip())
+                response = await self.get_request(f"{self.host_uri}{task_path}", max_age=0)
+                data = response.json()
                 if data.get("TaskStatus") == "OK":
                     self.logger.info("OSDeployment task status is OK.")
                 else:
@@ -1753,107 +2033,91 @@ class Badfish:
             self.logger.error("Command failed to detach remote mounted ISO.")
         return False
 
+    @needs("system")
     async def get_network_adapters(self):
         _url = "%s%s/NetworkAdapters" % (self.host_uri, self.system_resource)
         _response = await self.get_request(_url)
         try:
-            raw = await _response.text("utf-8", "ignore")
-            na_data = json.loads(raw.strip())
+            na_data = _response.json()
 
             root_nics = []
             if na_data.get("Members"):
                 for member in na_data["Members"]:
                     root_nics.append(member["@odata.id"])
 
+            adapters = await asyncio.gather(*(self.get_network_adapter(nic) for nic in root_nics))
+
             data = {}
-            for nic in root_nics:
-                net_ports_url = "%s%s/NetworkPorts" % (self.host_uri, nic)
-                rn_response = await self.get_request(net_ports_url)
-                rn_raw = await rn_response.text("utf-8", "ignore")
-                rn_data = json.loads(rn_raw.strip())
-
-                nic_ports = []
-                if rn_data.get("Members"):
-                    for member in rn_data["Members"]:
-                        nic_ports.append(member["@odata.id"])
-
-                net_df_url = "%s%s/NetworkDeviceFunctions" % (self.host_uri, nic)
-                ndf_response = await self.get_request(net_df_url)
-                ndf_raw = await ndf_response.text("utf-8", "ignore")
-                ndf_data = json.loads(ndf_raw.strip())
-
-                ndf_members = []
-                if ndf_data.get("Members"):
-                    for member in ndf_data["Members"]:
-                        ndf_members.append(member["@odata.id"])
-
-                for i, nic_port in enumerate(nic_ports):
-                    np_url = "%s%s" % (self.host_uri, nic_port)
-                    np_response = await self.get_request(np_url)
-                    np_raw = await np_response.text("utf-8", "ignore")
-                    np_data = json.loads(np_raw.strip())
-
-                    interface = nic_port.split("/")[-1]
-
-                    fields = [
-                        "Id",
-                        "LinkStatus",
-                        "SupportedLinkCapabilities",
-                    ]
-                    values = {}
-                    for field in fields:
-                        value = np_data.get(field)
-                        if value:
-                            values[field] = value
-
-                    ndf_url = "%s%s" % (self.host_uri, ndf_members[i])
-                    ndf_response = await self.get_request(ndf_url)
-                    ndf_raw = await ndf_response.text("utf-8", "ignore")
-                    ndf_data = json.loads(ndf_raw.strip())
-                    oem = ndf_data.get("Oem")
-                    ethernet = ndf_data.get("Ethernet")
-                    if ethernet:
-                        mac_address = ethernet.get("MACAddress")
-                        if mac_address:
-                            values["MACAddress"] = mac_address
-                    if oem:
-                        dell = oem.get("Dell")
-                        if dell:
-                            dell_nic = dell.get("DellNIC")
-                            vendor = dell_nic.get("VendorName")
-                            if dell_nic.get("VendorName"):
-                                values["Vendor"] = vendor
-
-                    data.update({interface: values})
+            for adapter in adapters:
+                data.update(adapter)
 
         except (ValueError, AttributeError):
             raise BadfishException("There was something wrong getting network interfaces")
 
         return data
 
+    async def get_network_adapter(self, nic):
+        """Interfaces of a single network adapter, walking its ports and device functions concurrently."""
+        net_ports_url = "%s%s/NetworkPorts" % (self.host_uri, nic)
+        net_df_url = "%s%s/NetworkDeviceFunctions" % (self.host_uri, nic)
+        rn_response, ndf_response = await asyncio.gather(
+            self.get_collection(net_ports_url), self.get_collection(net_df_url)
+        )
+        nic_ports = rn_response.json().get("Members") or []
+        ndf_members = ndf_response.json().get("Members") or []
+
+        interfaces = await asyncio.gather(
+            *(self.get_network_interface(nic_port, ndf_members[i]) for i, nic_port in enumerate(nic_ports))
+        )
+        return dict(interfaces)
+
+    async def get_network_interface(self, nic_port, ndf_member):
+        np_data, ndf_data = await asyncio.gather(
+            self.get_collection_member(nic_port), self.get_collection_member(ndf_member)
+        )
+
+        interface = nic_port["@odata.id"].split("/")[-1]
+
+        fields = [
+            "Id",
+            "LinkStatus",
+            "SupportedLinkCapabilities",
+        ]
+        values = {}
+        for field in fields:
+            value = np_data.get(field)
+            if value:
+                values[field] = value
+
+        oem = ndf_data.get("Oem")
+        ethernet = ndf_data.get("Ethernet")
+        if ethernet:
+            mac_address = ethernet.get("MACAddress")
+            if mac_address:
+                values["MACAddress"] = mac_address
+        if oem:
+            dell = oem.get("Dell")
+            if dell:
+                dell_nic = dell.get("DellNIC")
+                vendor = dell_nic.get("VendorName")
+                if dell_nic.get("VendorName"):
+                    values["Vendor"] = vendor
+
+        return interface, values
+
+    @needs("system")
     async def get_ethernet_interfaces(self):
         _url = "%s%s/EthernetInterfaces" % (self.host_uri, self.system_resource)
-        _response = await self.get_request(_url)
+        _response = await self.get_collection(_url)
 
         if _response.status == 404:
             raise BadfishException("Server does not support this functionality")
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            ei_data = json.loads(raw.strip())
-
-            interfaces = []
-            if ei_data.get("Members"):
-                for member in ei_data["Members"]:
-                    interfaces.append(member["@odata.id"])
+            ei_data = _response.json()
 
             data = {}
-            for interface in interfaces:
-                interface_url = "%s%s" % (self.host_uri, interface)
-                int_response = await self.get_request(interface_url)
-                int_raw = await int_response.text("utf-8", "ignore")
-                int_data = json.loads(int_raw.strip())
-
+            for int_data in await self.get_collection_members(ei_data):
                 int_name = int_data.get("Id")
                 fields = [
                     "Name",
@@ -1876,19 +2140,26 @@ class Badfish:
 
         return data
 
-    async def list_interfaces(self):
+    async def get_interfaces(self):
+        """Network interfaces from NetworkAdapters, or EthernetInterfaces when not available.
+
+        Returns None when the server exposes neither.
+        """
         na_supported = await self.check_supported_network_interfaces("NetworkAdapters")
         if na_supported:
             self.logger.debug("Getting Network Adapters")
-            data = await self.get_network_adapters()
-        else:
-            ei_supported = await self.check_supported_network_interfaces("EthernetInterfaces")
-            if ei_supported:
-                self.logger.debug("Getting Ethernet interfaces")
-                data = await self.get_ethernet_interfaces()
-            else:
-                self.logger.error("Server does not support this functionality")
-                return False
+            return await self.get_network_adapters()
+        ei_supported = await self.check_supported_network_interfaces("EthernetInterfaces")
+        if ei_supported:
+            self.logger.debug("Getting Ethernet interfaces")
+            return await self.get_ethernet_interfaces()
+        return None
+
+    async def list_interfaces(self):
+        data = await self.get_interfaces()
+        if data is None:
+            self.logger.error("Server does not support this functionality")
+            return False
 
         if self._use_tables:
             cols = {}
@@ -1935,13 +2206,13 @@ class Badfish:
                         self.logger.info(f"    {key}: {value}")
         return True
 
+    @needs("system")
     async def get_processor_summary(self):
         _url = "%s%s" % (self.host_uri, self.system_resource)
         _response = await self.get_request(_url)
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
 
             proc_data = data.get("ProcessorSummary")
 
@@ -1965,30 +2236,19 @@ class Badfish:
 
         return values
 
+    @needs("system")
     async def get_processor_details(self):
         _url = "%s%s/Processors" % (self.host_uri, self.system_resource)
-        _response = await self.get_request(_url)
+        _response = await self.get_collection(_url)
 
         if _response.status == 404:
             raise BadfishException("Server does not support this functionality")
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
-
-            processors = []
-            if data.get("Members"):
-                for member in data["Members"]:
-                    if "CPU" in member["@odata.id"]:
-                        processors.append(member["@odata.id"])
+            data = _response.json()
 
             proc_details = {}
-            for processor in processors:
-                processor_url = "%s%s" % (self.host_uri, processor)
-                proc_response = await self.get_request(processor_url)
-                proc_raw = await proc_response.text("utf-8", "ignore")
-                proc_data = json.loads(proc_raw.strip())
-
+            for proc_data in await self.get_collection_members(data, lambda member_uri: "CPU" in member_uri):
                 proc_name = proc_data.get("Id")
                 fields = [
                     "Name",
@@ -2014,36 +2274,27 @@ class Badfish:
 
         return proc_details
 
+    @needs("system")
     async def get_gpu_data(self):
         _url = "%s%s/Processors" % (self.host_uri, self.system_resource)
-        _response = await self.get_request(_url)
+        _response = await self.get_collection(_url)
 
         if _response.status == 404:
             raise BadfishException("GPU endpoint not available on host.")
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
 
         except (ValueError, AttributeError):
             raise BadfishException("There was something wrong getting GPU data")
         return data
 
     async def get_gpu_responses(self, data):
-        gpu_responses = []
-        gpu_endpoints = []
+        def is_gpu(member_uri):
+            return "Video" in member_uri or "ProcAccelerator" in member_uri
+
         try:
-            if data.get("Members"):
-                for member in data["Members"]:
-                    if "Video" in member["@odata.id"] or "ProcAccelerator" in member["@odata.id"]:
-                        gpu_endpoints.append(member["@odata.id"])
-
-            for gpu in gpu_endpoints:
-                gpu_url = "%s%s" % (self.host_uri, gpu)
-                gpu_response = await self.get_request(gpu_url)
-                gpu_raw = await gpu_response.text("utf-8", "ignore")
-                gpu_data = json.loads(gpu_raw.strip())
-                gpu_responses.append(gpu_data)
+            gpu_responses = await self.get_collection_members(data, is_gpu)
 
         except (ValueError, AttributeError):  # pragma: no cover
             raise BadfishException("There was something wrong getting host GPU details")
@@ -2091,13 +2342,13 @@ class Badfish:
 
         return gpu_details
 
+    @needs("system")
     async def get_memory_summary(self):
         _url = "%s%s" % (self.host_uri, self.system_resource)
         _response = await self.get_request(_url)
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
 
             proc_data = data.get("MemorySummary")
 
@@ -2120,29 +2371,19 @@ class Badfish:
 
         return values
 
+    @needs("system")
     async def get_memory_details(self):
         _url = "%s%s/Memory" % (self.host_uri, self.system_resource)
-        _response = await self.get_request(_url)
+        _response = await self.get_collection(_url)
 
         if _response.status == 404:
             raise BadfishException("Server does not support this functionality")
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
-
-            memories = []
-            if data.get("Members"):
-                for member in data["Members"]:
-                    memories.append(member["@odata.id"])
+            data = _response.json()
 
             mem_details = {}
-            for memory in memories:
-                memory_url = "%s%s" % (self.host_uri, memory)
-                mem_response = await self.get_request(memory_url)
-                mem_raw = await mem_response.text("utf-8", "ignore")
-                mem_data = json.loads(mem_raw.strip())
-
+            for mem_data in await self.get_collection_members(data):
                 mem_name = mem_data.get("Name")
                 fields = [
                     "CapacityMiB",
@@ -2165,6 +2406,15 @@ class Badfish:
 
         return mem_details
 
+    @needs("system")
+    async def get_system_model(self):
+        _uri = "%s%s" % (self.host_uri, self.system_resource)
+        _response = await self.get_request(_uri)
+        try:
+            return _response.json().get("Model")
+        except (ValueError, AttributeError):
+            return None
+
     async def get_serial_summary(self):
         _uri = "%s%s" % (self.host_uri, self.redfish_uri)
         _response = await self.get_request(_uri)
@@ -2173,8 +2423,7 @@ class Badfish:
             raise BadfishException("Server does not support this functionality")
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
             service_data = data.get("Oem").get("Dell")
 
             if not service_data:
@@ -2184,8 +2433,7 @@ class Badfish:
                 if _response.status in [400, 404]:
                     raise BadfishException("Server does not support this functionality")
 
-                serial_raw = await serial_response.text("utf-8", "ignore")
-                serial_data = json.loads(serial_raw.strip())
+                serial_data = serial_response.json()
                 serial_number_data = serial_data.get("SerialNumber")
 
                 if not serial_number_data:
@@ -2316,6 +2564,62 @@ class Badfish:
 
         return True
 
+    async def get_inventory(self):
+        """Hardware inventory of the host gathered in a single pass.
+
+        Sections are collected concurrently and documents they have in common,
+        like the ComputerSystem or its Processors collection, are fetched only
+        once. Sections the server does not support are left out.
+        """
+
+        async def serial():
+            data = await self.get_serial_summary()
+            return data.get("ServiceTag") if isinstance(data, dict) else data
+
+        async def processors():
+            summary, details = await asyncio.gather(self.get_processor_summary(), self.get_processor_details())
+            return {"Summary": summary, "Details": details}
+
+        async def memory():
+            summary, details = await asyncio.gather(self.get_memory_summary(), self.get_memory_details())
+            return {"Summary": summary, "Details": details}
+
+        async def gpu():
+            gpu_responses = await self.get_gpu_responses(await self.get_gpu_data())
+            return {
+                "Summary": await self.get_gpu_summary(gpu_responses),
+                "Details": await self.get_gpu_details(gpu_responses),
+            }
+
+        async def firmware():
+            return {row.get("Id", ""): row for row in await self.get_firmware_devices()}
+
+        sections = {
+            "Serial": serial(),
+            "Processors": processors(),
+            "Memory": memory(),
+            "GPU": gpu(),
+            "Interfaces": self.get_interfaces(),
+            "Firmware": firmware(),
+        }
+        results = await asyncio.gather(*sections.values(), return_exceptions=True)
+
+        inventory = {}
+        for section, result in zip(sections, results):
+            if isinstance(result, BadfishException):
+                self.logger.warning(f"{section} inventory not available: {result}")
+            elif isinstance(result, BaseException):
+                raise result
+            elif result is not None:
+                inventory[section] = result
+        return inventory
+
+    async def list_inventory(self):
+        inventory = await self.get_inventory()
+        log_document(self.logger, inventory)
+        return inventory
+
+    @needs("system")
     async def change_bios_password(self, old_password, new_password):
         _url = "%s%s/Bios/Actions/Bios.ChangePassword" % (
             self.host_uri,
@@ -2361,6 +2665,7 @@ class Badfish:
             return False
         await self.change_bios_password(old_password, "")
 
+    @needs("manager")
     async def get_screenshot(self):
         _uri = self.host_uri + self.redfish_uri + "/Dell" + self.manager_resource[11:]
         _url = "%s/DellLCService/Actions/DellLCService.ExportServerScreenShot" % _uri
@@ -2381,8 +2686,7 @@ class Badfish:
                 return None
 
         try:
-            raw = await _response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = _response.json()
         except ValueError:
             raise BadfishException("Error reading response from host.")
 
@@ -2399,6 +2703,13 @@ class Badfish:
         return True
 
     async def delete_session(self):
+        if self.token_store and self.token:
+            # Left open for later runs, only the connections are released
+            self.logger.debug(f"Keeping session of {self.host} for reuse.")
+            if self.http_client.token_accepted:
+                self.token_store.touch(self.host, self.token)
+            await self.http_client.close()
+            return
         try:
             try:
                 if not self.session_id:
@@ -2421,16 +2732,17 @@ class Badfish:
             finally:
                 self.session_id = None
                 self.token = None
+                await self.http_client.close()
         except Exception:
             self.session_id = None
             self.token = None
 
+    @needs("manager")
     async def get_scp_targets(self, op):
         uri = "%s%s" % (self.host_uri, self.manager_resource)
         response = await self.get_request(uri)
         try:
-            raw = await response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = response.json()
             _ = response.status
             filtered_data = [
                 val for key, val in data.get("Actions").get("Oem").items() if key.endswith(f"{op}SystemConfiguration")
@@ -2451,6 +2763,7 @@ class Badfish:
             raise BadfishException(f"There was something wrong trying to get targets for SCP {op}.")
         return False
 
+    @needs("manager")
     async def export_scp(self, file_path, targets="ALL", include_read_only=False):
         uri = "%s%s/Actions/Oem/EID_674_Manager.ExportSystemConfiguration" % (self.host_uri, self.manager_resource)
         headers = {"Content-Type": "application/json"}
@@ -2480,9 +2793,8 @@ class Badfish:
 
         # Try to fetch the result directly from Jobs endpoint
         uri = "%s%s/Jobs/%s" % (self.host_uri, self.manager_resource, job_id)
-        response = await self.get_request(uri)
-        raw = await response.text("utf-8", "ignore")
-        data = json.loads(raw.strip())
+        response = await self.get_request(uri, max_age=0)
+        data = response.json()
 
         # Check if job failed
         if data.get("JobState") in ["Failed", "CompletedWithErrors"]:
@@ -2495,9 +2807,8 @@ class Badfish:
             # Try the Tasks endpoint as fallback
             self.logger.debug("SystemConfiguration not in Jobs response, trying Tasks endpoint")
             uri = "%s/redfish/v1/TaskService/Tasks/%s" % (self.host_uri, job_id)
-            response = await self.get_request(uri)
-            raw = await response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            response = await self.get_request(uri, max_age=0)
+            data = response.json()
 
         # Save the exported configuration
         if "SystemConfiguration" in data:
@@ -2512,6 +2823,7 @@ class Badfish:
             self.logger.error("Export job completed but SystemConfiguration not found in response.")
             return False
 
+    @needs("manager")
     async def import_scp(self, file_path, targets="ALL"):
         try:
             open_file = open(file_path, "r")
@@ -2545,9 +2857,8 @@ class Badfish:
         while True:
             ct = get_now() - start_time
             uri = "%s/redfish/v1/TaskService/Tasks/%s" % (self.host_uri, job_id)
-            response = await self.get_request(uri)
-            raw = await response.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            response = await self.get_request(uri, max_age=0)
+            data = response.json()
             if response.status in [200, 202]:
                 await asyncio.sleep(1)
             else:
@@ -2587,6 +2898,7 @@ class Badfish:
                 continue
         return True
 
+    @needs("system")
     async def get_nic_fqdds(self):
         uri = "%s%s/NetworkAdapters" % (self.host_uri, self.system_resource)
         resp = await self.get_request(uri)
@@ -2595,15 +2907,13 @@ class Badfish:
             return False
 
         try:
-            raw = await resp.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = resp.json()
             nic_list = [[nic[1].split("/")[-1] for nic in member.items()][0] for member in data.get("Members")]
             self.logger.debug("Detected NIC FQDDs for existing network adapters.")
             for nic in nic_list:
                 uri = "%s%s/NetworkAdapters/%s/NetworkDeviceFunctions" % (self.host_uri, self.system_resource, nic)
                 resp = await self.get_request(uri)
-                raw = await resp.text("utf-8", "ignore")
-                data = json.loads(raw.strip())
+                data = resp.json()
                 nic_fqqds = [[fqdd[1].split("/")[-1] for fqdd in member.items()][0] for member in data.get("Members")]
                 self.logger.info(f"{nic}:")
                 for i, fqdd in enumerate(nic_fqqds, start=1):
@@ -2613,6 +2923,7 @@ class Badfish:
             return False
         return True
 
+    @needs("system")
     async def get_nic_attribute(self, fqdd, log=True):
         uri = "%s/Chassis/%s/NetworkAdapters/%s/NetworkDeviceFunctions/%s/Oem/Dell/DellNetworkAttributes/%s" % (
             self.root_uri,
@@ -2621,14 +2932,13 @@ class Badfish:
             fqdd,
             fqdd,
         )
-        resp = await self.get_request(uri)
+        resp = await self.get_request(uri, max_age=0)
         if resp.status == 404 or self.vendor == "Supermicro":
             self.logger.error("Operation not supported by vendor.")
             return False
 
         try:
-            raw = await resp.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = resp.json()
             attributes_list = [(key, value) for key, value in data.get("Attributes").items()]
             if not log:
                 return attributes_list
@@ -2641,6 +2951,7 @@ class Badfish:
             return False
         return True
 
+    @needs("manager")
     async def get_idrac_fw_version(self):
         idrac_fw_version = 0
         try:
@@ -2649,8 +2960,7 @@ class Badfish:
             if resp.status == 404 or self.vendor == "Supermicro":
                 self.logger.error("Operation not supported by vendor.")
                 return 0
-            raw = await resp.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = resp.json()
             idrac_fw_version = int(data["FirmwareVersion"].replace(".", ""))
         except (AttributeError, ValueError, StopIteration):
             self.logger.error("Was unable to get iDRAC Firmware Version.")
@@ -2673,8 +2983,7 @@ class Badfish:
             if resp.status == 404:
                 self.logger.error("Was unable to get network attribute registry.")
                 return []
-            raw = await resp.text("utf-8", "ignore")
-            data = json.loads(raw.strip())
+            data = resp.json()
             registry = [attr for attr in data.get("RegistryEntries").get("Attributes")]
         except (AttributeError, KeyError, TypeError, ValueError):
             self.logger.error("Was unable to get network attribute registry.")
@@ -2690,13 +2999,14 @@ class Badfish:
             self.logger.error("Was unable to get network attribute info.")
             return False
         try:
-            registry = [attr_dict for attr_dict in registry if attr_dict.get("AttributeName") == attribute][0]
+            entry = [attr_dict for attr_dict in registry if attr_dict.get("AttributeName") == attribute][0]
             current_value = await self.get_nic_attribute(fqdd, False)
             current_value = [tup[1] for tup in current_value if tup[0] == attribute][0]
-            registry.update({"CurrentValue": current_value})
+            # The registry is shared with the response cache, so the entry is copied before adding to it
+            entry = dict(entry, CurrentValue=current_value)
             if not log:
-                return registry
-            for key, value in registry.items():
+                return entry
+            for key, value in entry.items():
                 self.logger.info(f"{key}: {value}")
         except (AttributeError, IndexError, KeyError, TypeError):
             self.logger.error("Was unable to get network attribute info.")
@@ -2805,6 +3115,7 @@ class Badfish:
         }
         first_reset = False
         job_id = None
+        retry_policy = self.http_client.retry_policy
 
         try:
             for i in range(self.retries):
@@ -2827,7 +3138,7 @@ class Badfish:
                         "Patch command to set network attribute values and create next reboot job FAILED, error code is: %s."
                         % status_code
                     )
-                    if status_code == 503 and i - 1 != self.retries:
+                    if retry_policy.retryable(status_code) and await retry_policy.wait(i, response):
                         self.logger.info("Retrying to send the patch command.")
                         continue
                     elif status_code == 400:
@@ -2871,7 +3182,8 @@ class Badfish:
             return True
 
 
-async def execute_badfish(_host, _args, logger, format_handler=None, console=None, progress_disabled=False):
+def get_credentials(_args, logger):
+    """Username and password from the arguments or the environment, None when missing."""
     _username = _args.get("u") or os.environ.get("BADFISH_USERNAME")
     _password = _args.get("p") or os.environ.get("BADFISH_PASSWORD")
 
@@ -2883,7 +3195,55 @@ async def execute_badfish(_host, _args, logger, format_handler=None, console=Non
 
     if not _username or not _password:
         logger.error("Missing credentials. Please provide credentials via CLI arguments or environment variables.")
+        return None
+    return _username, _password
+
+
+def get_discovery_cache(_args):
+    """The discovery cache asked for with --discovery-cache, None without it."""
+    directory = _args.get("discovery_cache")
+    return DiscoveryCache(directory) if directory else None
+
+
+def get_token_store(_args):
+    """The session token store asked for with --token-store, None without it."""
+    path = _args.get("token_store")
+    return TokenStore(path) if path else None
+
+
+def get_session_slots(_args):
+    """The per-host session cap asked for with --max-sessions, None without it."""
+    limit = _args.get("max_sessions") or 0
+    if limit <= 0:
+        return None
+    return SessionSlots(_args.get("session_lock_dir") or SESSION_LOCK_DIR, limit)
+
+
+def forget_discovery(badfish):
+    """Drop the cached discovery ``badfish`` was set up from, after it failed, so the next run discovers again."""
+    if badfish and badfish.discovered_from_cache:
+        badfish.discovery_cache.invalidate(badfish.host)
+
+
+async def close_badfish(badfish, _host, logger):
+    """Delete the session of ``badfish`` if it opened one and release its connections."""
+    if badfish.session_id:
+        try:
+            await badfish.delete_session()
+            logger.debug(f"Session closed for host: {_host}")
+        except BadfishException as ex:
+            logger.warning(f"Failed to close session for {_host}: {ex}")
+    else:
+        await badfish.http_client.close()
+
+
+async def execute_badfish(
+    _host, _args, logger, format_handler=None, console=None, progress_disabled=False, connector=None
+):
+    credentials = get_credentials(_args, logger)
+    if not credentials:
         return _host, False
+    _username, _password = credentials
 
     host_type = _args["t"]
     interfaces_path = _args["i"]
@@ -2913,6 +3273,8 @@ async def execute_badfish(_host, _args, logger, format_handler=None, console=Non
     list_processors = _args["ls_processors"]
     list_memory = _args["ls_memory"]
     list_serial = _args["ls_serial"]
+    inventory = _args.get("inventory", False)
+    inventory_db = _args.get("inventory_db")
     check_virtual_media = _args["check_virtual_media"]
     unmount_virtual_media = _args["unmount_virtual_media"]
     mount_virtual_media = _args["mount_virtual_media"]
@@ -2943,6 +3305,7 @@ async def execute_badfish(_host, _args, logger, format_handler=None, console=Non
     get_nic_attribute = _args["get_nic_attribute"]
     set_nic_attribute = _args["set_nic_attribute"]
     insecure = _args.get("insecure", False)
+    ca_bundle = _args.get("ca_bundle")
     result = True
     badfish = None
 
@@ -2956,6 +3319,13 @@ async def execute_badfish(_host, _args, logger, format_handler=None, console=Non
             _insecure=insecure,
             _console=console,
             _progress_disabled=progress_disabled,
+            _connector=connector,
+            _ca_bundle=ca_bundle,
+            _fetch_concurrency=_args.get("fetch_concurrency", FETCH_CONCURRENCY),
+            _discovery_cache=get_discovery_cache(_args),
+            _token_store=get_token_store(_args),
+            _session_slots=get_session_slots(_args),
+            _resources=command_resources(_args),
         )
 
         if _args["host_list"] and not _args["output"]:
@@ -3011,6 +3381,15 @@ async def execute_badfish(_host, _args, logger, format_handler=None, console=Non
             await badfish.list_memory()
         elif list_serial:
             await badfish.list_serial()
+        elif inventory:
+            if inventory_db:
+                with InventoryStore(inventory_db) as store:
+                    badfish.load_members(store.members(_host))
+                    document = await badfish.list_inventory()
+                    store.save(_host, document)
+                    store.save_members(_host, badfish.member_etags)
+            else:
+                await badfish.list_inventory()
         elif check_virtual_media:
             await badfish.check_virtual_media()
         elif mount_virtual_media:
@@ -3071,17 +3450,15 @@ async def execute_badfish(_host, _args, logger, format_handler=None, console=Non
     except BadfishException as ex:
         logger.error(ex)
         result = False
+        forget_discovery(badfish)
     finally:
-        if badfish and badfish.session_id:
-            try:
-                await badfish.delete_session()
-                logger.debug(f"Session closed for host: {_host}")
-            except BadfishException as ex:
-                logger.warning(f"Failed to close session for {_host}: {ex}")
+        if badfish:
+            await close_badfish(badfish, _host, logger)
 
     if _args["host_list"]:
-        logger.info("*" * 48)
-        if output and result:
+        # Marks the end of the host's records so streamed output can write them out
+        logger.info("*" * 48, extra={"host_complete": _host, "host_result": result})
+        if output and result and not format_handler.stream_format:
             format_handler.host = _host
             format_handler.parse()
     else:
@@ -3091,6 +3468,193 @@ async def execute_badfish(_host, _args, logger, format_handler=None, console=Non
     return _host, result
 
 
+async def execute_host_list(
+    tasks, connection_limit=0, connection_limit_per_host=0, max_concurrency=0, groups=None, group_limit=0
+):
+    """Run every host task over one shared connector, returning their results in order.
+
+    All hosts share a single connection pool so the total number of open
+    sockets and per-BMC connections stays bounded regardless of the size of
+    the host list, and DNS lookups are cached across hosts. Tasks are started
+    from a work queue in list order, at most ``max_concurrency`` at a time and
+    at most ``group_limit`` of the same group, so large lists do not open every
+    session at once.
+    """
+    connector = create_connector(connection_limit, connection_limit_per_host)
+    try:
+        return await gather_bounded(
+            [functools.partial(task, connector=connector) for task in tasks], max_concurrency, groups, group_limit
+        )
+    finally:
+        await connector.close()
+
+
+def host_list_limits(_args):
+    """Connection and scheduling limits of a --host-list run, as keyword arguments of execute_host_list."""
+    return dict(
+        connection_limit=_args.get("connection_limit", CONNECTION_LIMIT),
+        connection_limit_per_host=_args.get("connection_limit_per_host", CONNECTION_LIMIT_PER_HOST),
+        max_concurrency=_args.get("max_concurrency", MAX_CONCURRENCY),
+        group_limit=_args.get("group_limit", 0),
+    )
+
+
+def read_host_list(path):
+    """``(host, group)`` of every non blank line of a host list, the group being an optional second column."""
+    with open(path, "r") as _file:
+        lines = _file.readlines()
+    hosts = []
+    for line in lines:
+        fields = line.split()
+        if fields:
+            hosts.append((fields[0], fields[1] if len(fields) > 1 else None))
+    return hosts
+
+
+async def run_badfish(_host, _args, logger, action, connector=None):
+    """Result of ``await action(badfish)`` over a session to ``_host``, None when it failed."""
+    credentials = get_credentials(_args, logger)
+    if not credentials:
+        return None
+    badfish = None
+    try:
+        badfish = await badfish_factory(
+            _host=_host,
+            _username=credentials[0],
+            _password=credentials[1],
+            _logger=logger,
+            _retries=int(_args["retries"]),
+            _insecure=_args.get("insecure", False),
+            _progress_disabled=True,
+            _connector=connector,
+            _ca_bundle=_args.get("ca_bundle"),
+            _fetch_concurrency=_args.get("fetch_concurrency", FETCH_CONCURRENCY),
+            _discovery_cache=get_discovery_cache(_args),
+            _token_store=get_token_store(_args),
+            _session_slots=get_session_slots(_args),
+        )
+        return await action(badfish)
+    except BadfishException as ex:
+        logger.error(ex)
+        forget_discovery(badfish)
+        return None
+    finally:
+        if badfish:
+            await close_badfish(badfish, _host, logger)
+
+
+async def execute_firmware_comparison(_args, logger, hosts, host_logger=None, host_groups=None):
+    """Compare the firmware of ``hosts`` with each other, or with ``--firmware-baseline`` when given.
+
+    ``host_groups`` maps hosts to their --host-list group for --group-limit.
+    """
+    baseline = load_baseline(_args["firmware_baseline"])["components"] if _args.get("firmware_baseline") else None
+    if not hosts:
+        raise BadfishException("Comparing firmware requires hosts given with -H, --delta or --host-list.")
+    tasks = [
+        functools.partial(
+            run_badfish, _host, _args, host_logger(_host) if host_logger else logger, Badfish.get_firmware_devices
+        )
+        for _host in hosts
+    ]
+    groups = [(host_groups or {}).get(_host) for _host in hosts]
+    results = await execute_host_list(tasks, groups=groups, **host_list_limits(_args))
+
+    inventories = {}
+    for _host, rows in zip(hosts, results):
+        if isinstance(rows, BaseException) or rows is None:
+            logger.warning(f"Could not get the firmware inventory of {_host}, leaving it out of the comparison.")
+        else:
+            inventories[_host] = rows
+    if not inventories:
+        raise BadfishException("Could not get the firmware inventory of any host.")
+
+    log_document(logger, compare_firmware(inventories, baseline))
+    return len(inventories) == len(hosts)
+
+
+async def execute_firmware_compliance(_args, logger, hosts, host_logger=None, host_groups=None):
+    """Check the firmware of ``hosts`` against ``--firmware-baseline``, reporting each host as it completes.
+
+    Returns whether every host is compliant.
+    """
+    if not _args.get("firmware_baseline"):
+        raise BadfishException("Checking firmware compliance requires --firmware-baseline.")
+    index = ComplianceIndex.compile(load_baseline(_args["firmware_baseline"]))
+    if not hosts:
+        raise BadfishException("Checking firmware compliance requires hosts given with -H or --host-list.")
+
+    async def firmware(badfish):
+        return await asyncio.gather(badfish.get_system_model(), badfish.get_firmware_devices())
+
+    limits = host_list_limits(_args)
+    connector = create_connector(limits["connection_limit"], limits["connection_limit_per_host"])
+    jobs = [
+        functools.partial(
+            run_badfish, _host, _args, host_logger(_host) if host_logger else logger, firmware, connector=connector
+        )
+        for _host in hosts
+    ]
+    compliant = True
+    try:
+        groups = [(host_groups or {}).get(_host) for _host in hosts]
+        async for position, collected in run_bounded(jobs, limits["max_concurrency"], groups, limits["group_limit"]):
+            _host = hosts[position]
+            if isinstance(collected, BaseException) or collected is None:
+                report = {"Compliant": False, "Error": "Could not get the firmware inventory."}
+            else:
+                model, rows = collected
+                report = index.check(rows, model)
+            compliant = compliant and report["Compliant"]
+            log_document(logger, {_host: report})
+            # Lets streamed output write the report out now rather than once every host is checked
+            logger.info(SEPARATOR, extra={"host_complete": _host, "host_result": True, "host_document": report})
+    finally:
+        await connector.close()
+    return compliant
+
+
+async def execute_query(_args, logger, hosts=None, host_logger=None, host_groups=None):
+    """Answer ``--query``/``--count-by`` from the inventory store.
+
+    With ``--max-age`` the inventory of stale hosts, the given ones or else
+    every stored one, is collected again before answering; the others are
+    never contacted.
+    """
+    inventory_db = _args.get("inventory_db")
+    if not inventory_db:
+        raise BadfishException("Querying the inventory requires --inventory-db.")
+    filters = [Filter.parse(expression) for expression in _args.get("query") or []]
+    max_age = _args.get("max_age")
+    count_by = _args.get("count_by")
+
+    with InventoryStore(inventory_db) as store:
+        if max_age is not None:
+            stale = store.stale(hosts or list(store.collected()), max_age)
+            if stale:
+                logger.debug(f"Refreshing inventory of {len(stale)} stale host(s).")
+                refresh_args = dict(_args, inventory=True, host_list=None, output=None)
+                tasks = [
+                    functools.partial(
+                        execute_badfish, _host, refresh_args, host_logger(_host) if host_logger else logger
+                    )
+                    for _host in stale
+                ]
+                groups = [(host_groups or {}).get(_host) for _host in stale]
+                results = await execute_host_list(tasks, groups=groups, **host_list_limits(_args))
+                for _host, res in zip(stale, results):
+                    if isinstance(res, BaseException) or not res[1]:
+                        logger.warning(f"Could not refresh the inventory of {_host}, using stored data.")
+
+        matched = store.query(filters)
+        if hosts:
+            matched = {_host: facts for _host, facts in matched.items() if _host in hosts}
+        result = store.count_by(count_by, list(matched)) if count_by else matched
+
+    log_document(logger, result)
+    return True
+
+
 def main(argv=None):
     _args = parse_arguments(argv)
 
@@ -3098,20 +3662,21 @@ def main(argv=None):
     host = _args["host"]
 
     delta = _args["delta"]
-    if _args["firmware_inventory"] and delta:
-        tp = tempfile.NamedTemporaryFile()
-        tp.write(f"{host}\n{delta}".encode())
-        tp.flush()
-        _args["host_list"] = tp.name
-        if not _args["output"]:
-            _args["output"] = "json"
+    compare = bool(
+        _args.get("compare_firmware") or _args.get("firmware_baseline") or (_args["firmware_inventory"] and delta)
+    )
+    compliance = bool(_args.get("firmware_compliance"))
 
     host_list = _args["host_list"]
-    multi_host = True if host_list else False
+    query = _args.get("query") is not None or bool(_args.get("count_by"))
+    fleet = query or compare or compliance
+    multi_host = True if host_list and not fleet else False
+    # Compliance reports are always written as each host completes, unless they go to a log file
+    stream = (multi_host and _args.get("stream", False)) or (compliance and not _args["log"])
     result = True
     output = _args["output"]
     console = Console()
-    bfl = BadfishLogger(_args["verbose"], multi_host, _args["log"], output, console=console)
+    bfl = BadfishLogger(_args["verbose"], multi_host, _args["log"], output, console=console, stream=stream)
     progress_disabled = bool(output) or multi_host or bool(_args["log"]) or not console.is_terminal
 
     try:
@@ -3120,36 +3685,66 @@ def main(argv=None):
         loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
     tasks = []
+    groups = []
     host_order = {}
-    if host_list:
+    if fleet:
+        hosts = [_host for _host in (host, delta) if _host]
+        host_groups = {}
+        if host_list:
+            try:
+                for _host, group in read_host_list(host_list):
+                    hosts.append(_host)
+                    host_groups[_host] = group
+            except IOError as ex:
+                bfl.logger.debug(ex)
+                bfl.logger.error("There was something wrong reading from %s" % host_list)
+
+        def host_logger(_host):
+            logger = getLogger(_host.split(".")[0])
+            logger.addHandler(bfl.queue_handler)
+            logger.setLevel(WARNING)
+            return logger
+
+        if query:
+            execute = execute_query
+        elif compliance:
+            execute = execute_firmware_compliance
+        else:
+            execute = execute_firmware_comparison
         try:
-            with open(host_list, "r") as _file:
-                for i, _host in enumerate(_file.readlines()):
-                    if _host.isspace():
-                        continue
-
-                    host_name = _host.strip().split(".")[0]
-                    host_order.update({host_name: i})
-                    logger = getLogger(host_name)
-                    logger.addHandler(bfl.queue_handler)
-                    logger.setLevel(log_level)
-                    bfl.badfish_handler.host = _host if output else None
-                    fn = functools.partial(
-                        execute_badfish,
-                        _host.strip(),
-                        _args,
-                        logger,
-                        bfl.queue_listener.handlers[0] if output else None,
-                        console=console,
-                        progress_disabled=progress_disabled,
-                    )
-                    tasks.append(fn)
+            result = loop.run_until_complete(execute(_args, bfl.logger, hosts, host_logger, host_groups))
+        except KeyboardInterrupt:
+            bfl.logger.warning("Badfish terminated")
+            result = False
+        except BadfishException as ex:
+            bfl.logger.error(ex)
+            result = False
+    elif host_list:
+        try:
+            for i, (_host, group) in enumerate(read_host_list(host_list)):
+                host_name = _host.split(".")[0]
+                host_order.update({host_name: i})
+                logger = getLogger(host_name)
+                logger.addHandler(bfl.queue_handler)
+                logger.setLevel(log_level)
+                bfl.badfish_handler.host = _host if output else None
+                fn = functools.partial(
+                    execute_badfish,
+                    _host,
+                    _args,
+                    logger,
+                    bfl.queue_listener.handlers[0] if output else None,
+                    console=console,
+                    progress_disabled=progress_disabled,
+                )
+                tasks.append(fn)
+                groups.append(group)
         except IOError as ex:
             bfl.logger.debug(ex)
             bfl.logger.error("There was something wrong reading from %s" % host_list)
         results = []
         try:
-            results = loop.run_until_complete(asyncio.gather(*[task() for task in tasks], return_exceptions=True))
+            results = loop.run_until_complete(execute_host_list(tasks, groups=groups, **host_list_limits(_args)))
         except KeyboardInterrupt:
             bfl.logger.warning("Badfish terminated")
             result = False
@@ -3187,12 +3782,11 @@ def main(argv=None):
             bfl.logger.debug(ex)
             result = False
     bfl.queue_listener.stop()
+    if fleet and output and bfl.logger.name in bfl.badfish_handler.messages:
+        bfl.badfish_handler.parse()
 
-    if delta:
-        bfh_output = bfl.badfish_handler.diff()
-    else:
-        bfh_output = bfl.badfish_handler.output(output if output else "normal", host_order)
-    if _args["log"]:
+    bfh_output = bfl.badfish_handler.output(output if output else "normal", host_order)
+    if _args["log"] and not stream:
         og_stdout = sys.stdout
         with open(_args["log"], "w") as f:
             sys.stdout = f
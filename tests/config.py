@@ -5,6 +5,8 @@ MOCK_HOST = "f01-h01-000-r630.host.io"
 MOCK_USER = "mock_user"
 MOCK_PASS = "mock_pass"
 JOB_ID = "JID_498218641680"
+JOB_LOCATION_HEADERS = {"Location": f"/redfish/v1/Managers/iDRAC.Embedded.1/Jobs/{JOB_ID}"}
+SESSION_HEADERS = {"Location": "/redfish/v1/SessionService/Sessions/1", "X-Auth-Token": "token"}
 BAD_DEVICE_NAME = "BadIF.Slot.x-y-z"
 DEVICE_NIC_I = "NIC.Integrated.1"
 DEVICE_NIC_S = "NIC.Slot.1"
@@ -263,14 +265,24 @@ RESET_TYPE_NG_RESP = (
     '{"Actions":{"#ComputerSystem.Reset":{"ResetType@Redfish.AllowableValues":["RestartNow"],'
     '"target":"/redfish/v1/Managers/iDRAC.Embedded.1/Actions/Manager.Reset"}}} '
 )
-INIT_RESP = [ROOT_RESP, ROOT_RESP, SYS_RESP, ROOT_RESP, MAN_RESP]
+ROOT_RESP_EXPAND = (
+    '{"Managers":{"@odata.id":"/redfish/v1/Managers"},"Systems":{"@odata.id":"/redfish/v1/Systems"}, '
+    '"RedfishVersion": "1.0.2","Oem":{"Dell":{"ServiceTag": "T35T7A6"}}, '
+    '"ProtocolFeaturesSupported":{"ExpandQuery":{"ExpandAll":true,"Levels":true,"MaxLevels":1,"NoLinks":true}}}'
+)
+INIT_RESP = [ROOT_RESP, ROOT_RESP, ROOT_RESP, SYS_RESP, MAN_RESP]
+# Commands working on one resource only discover that one
+INIT_RESP_SYSTEM = [ROOT_RESP, ROOT_RESP, ROOT_RESP, SYS_RESP]
+INIT_RESP_MANAGER = [ROOT_RESP, ROOT_RESP, ROOT_RESP, MAN_RESP]
+INIT_RESP_EXPAND = [ROOT_RESP_EXPAND, ROOT_RESP_EXPAND, ROOT_RESP_EXPAND, SYS_RESP, MAN_RESP]
 INIT_RESP_SUPERMICRO = [
     ROOT_RESP_SUPERMICRO,
     ROOT_RESP_SUPERMICRO,
-    SYS_RESP,
     ROOT_RESP_SUPERMICRO,
+    SYS_RESP,
     MAN_RESP,
 ]
+INIT_RESP_SUPERMICRO_MANAGER = [ROOT_RESP_SUPERMICRO, ROOT_RESP_SUPERMICRO, ROOT_RESP_SUPERMICRO, MAN_RESP]
 
 RESPONSE_INIT_CREDENTIALS_UNAUTHORIZED = (
     f"- ERROR    - Failed to authenticate. Verify your credentials for {MOCK_HOST}\n"
@@ -386,7 +398,7 @@ RESPONSE_CHECK_JOB_ERROR = "- ERROR    - Command failed to check job status\n"
 DELLJOBSERVICE_UNSUPPORTED = "- WARNING  - iDRAC version installed does not support DellJobService\n"
 RESPONSE_CLEAR_JOBS_UNSUPPORTED = f"{RESPONSE_CLEAR_JOBS}"
 RESPONSE_CLEAR_JOBS_LIST = (
-    f"{RESPONSE_CLEAR_JOBS}- WARNING  - Unexpected status 200 when deleting session for {MOCK_HOST}.\n"
+    f"{RESPONSE_CLEAR_JOBS}- WARNING  - Unexpected status 500 when deleting session for {MOCK_HOST}.\n"
 )
 RESPONSE_CLEAR_JOBS_LIST_EXCEPTION = (
     f"{RESPONSE_CLEAR_JOBS}- WARNING  - Unexpected status 400 when deleting session for {MOCK_HOST}.\n"
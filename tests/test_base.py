@@ -1,3 +1,5 @@
+import json
+import logging
 import sys
 import os
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
@@ -6,7 +8,7 @@ import pytest
 from aiohttp import web
 from aiohttp.test_utils import AioHTTPTestCase
 
-from badfish.main import main
+from badfish.main import Badfish, main
 from badfish.helpers.exceptions import BadfishException
 from tests import config
 
@@ -19,25 +21,26 @@ class TestBase(AioHTTPTestCase):
         return web.Application()
 
     @staticmethod
-    def set_mock_response(mock, status, responses, post=False, headers=None):
+    def set_mock_response(mock, status, responses, headers=None):
         mock.return_value.__aenter__.return_value.name = responses
         status_mock = MagicMock()
         if isinstance(status, list):
-            if post:
-                dup_stats = [val for val in status for _ in range(2)]
-                type(status_mock).status = PropertyMock(side_effect=dup_stats)
-            else:
-                type(status_mock).status = PropertyMock(side_effect=status)
+            type(status_mock).status = PropertyMock(side_effect=status)
         else:
             type(status_mock).status = PropertyMock(return_value=status)
         mock.return_value.__aenter__.return_value = status_mock
-        mock.return_value.__aenter__.return_value.read = AsyncMock()
         if isinstance(responses, list):
-            mock.return_value.__aenter__.return_value.text = AsyncMock(side_effect=responses)
+            mock.return_value.__aenter__.return_value.read = AsyncMock(side_effect=[r.encode() for r in responses])
         else:
-            mock.return_value.__aenter__.return_value.text = AsyncMock(return_value=responses)
-        if headers is not None:
-            mock.return_value.__aenter__.return_value.headers = headers
+            mock.return_value.__aenter__.return_value.read = AsyncMock(return_value=responses.encode())
+        mock.return_value.__aenter__.return_value.headers = {} if headers is None else headers
+
+    @staticmethod
+    def badfish(**kwargs):
+        """Badfish instance for the mocked host, logging to a mock."""
+        return Badfish(
+            config.MOCK_HOST, config.MOCK_USER, config.MOCK_PASS, MagicMock(spec=logging.Logger), 1, **kwargs
+        )
 
     @pytest.fixture(autouse=True)
     def inject_capsys(self, capsys):
@@ -84,12 +87,16 @@ class TestBase(AioHTTPTestCase):
 
 
 class MockResponse:
-    def __init__(self, text: str, status: int):
-        self.txt = text
+    def __init__(self, text: str, status: int, headers=None):
+        self.body = text.encode()
         self.status = status
+        self.headers = headers or {}
+
+    def text(self):
+        return self.body.decode()
 
-    async def text(self, arg1, arg2):
-        return self.txt
+    def json(self):
+        return json.loads(self.body)
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
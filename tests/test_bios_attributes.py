@@ -1,4 +1,5 @@
-from unittest.mock import patch
+import json
+from unittest.mock import AsyncMock, patch
 
 from tests.config import (
     ATTR_VALUE_BAD,
@@ -40,7 +41,7 @@ class TestSetBiosAttribute(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, ["OK"])
-        self.set_mock_response(mock_post, 200, ["OK", JOB_OK_RESP])
+        self.set_mock_response(mock_post, 200, ["OK", JOB_OK_RESP, "OK"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [
             self.option_arg,
@@ -101,6 +102,31 @@ class TestSetBiosAttribute(TestBase):
         _, err = self.badfish_call()
         assert err == BIOS_SET_BAD_ATTR
 
+    @patch("aiohttp.ClientSession.get")
+    async def test_set_bios_attribute_reads_current_values_at_once(self, mock_get):
+        bf = self.badfish()
+        bf.system_resource = "/redfish/v1/Systems/System.Embedded.1"
+        bf.http_client.use_protocol_features({"SelectQuery": True})
+        registry = [
+            {"AttributeName": "BootMode", "Value": [{"ValueName": "Bios"}, {"ValueName": "Uefi"}]},
+            {"AttributeName": "SriovGlobalEnable", "Value": [{"ValueName": "Enabled"}, {"ValueName": "Disabled"}]},
+        ]
+        current = {"Attributes": {"BootMode": "Bios", "SriovGlobalEnable": "Enabled"}}
+        self.set_mock_response(
+            mock_get, 200, [json.dumps({"RegistryEntries": {"Attributes": registry}}), json.dumps(current)]
+        )
+        bf.patch_bios = AsyncMock()
+        bf.reboot_server = AsyncMock()
+
+        await bf.set_bios_attribute({"BootMode": "Uefi", "SriovGlobalEnable": "Enabled"})
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.args[0] == (
+            f"{bf.host_uri}{bf.system_resource}/Bios?$select=Attributes/BootMode,Attributes/SriovGlobalEnable"
+        )
+        bf.patch_bios.assert_awaited_once_with({"Attributes": {"BootMode": "Uefi"}}, insist=False)
+        await bf.http_client.close()
+
 
 class TestGetBiosAttribute(TestBase):
     option_arg = "--get-bios-attribute"
@@ -13,6 +13,7 @@ from tests.config import (
     CHECK_JOB_STATUS_FAIL_MSG,
     CHECK_JOB_STATUS_UNEXPECTED_MSG_CONTENT,
     INIT_RESP,
+    JOB_LOCATION_HEADERS,
     JOB_OK_RESP,
     RESET_TYPE_RESP,
     STATE_OFF_RESP,
@@ -35,7 +36,7 @@ class TestSetBiosPass(TestBase):
         ]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "--new-password", "new_pass"]
         _, err = self.badfish_call()
@@ -71,7 +72,7 @@ class TestRemoveBiosPass(TestBase):
         ]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "--old-password", "new_pass"]
         _, err = self.badfish_call()
@@ -102,7 +103,7 @@ class TestChangeBiosPass(TestBase):
     def test_set_bios_pass_not_supported(self, mock_get, mock_post, mock_delete):
         responses = INIT_RESP
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 404], ["OK", "Not Found"], True)
+        self.set_mock_response(mock_post, [200, 404], ["OK", "Not Found"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "--new-password", "new_pass"]
         _, err = self.badfish_call()
@@ -114,7 +115,7 @@ class TestChangeBiosPass(TestBase):
     def test_set_bios_pass_cmd_failed(self, mock_get, mock_post, mock_delete):
         responses = INIT_RESP
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "--new-password", "new_pass"]
         _, err = self.badfish_call()
@@ -134,7 +135,7 @@ class TestSetBiosPassCheckJobStatus(TestBase):
             "{}",
         ]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "--new-password", "new_pass"]
         _, err = self.badfish_call()
@@ -150,7 +151,7 @@ class TestSetBiosPassCheckJobStatus(TestBase):
             CHECK_JOB_STATUS_FAIL_MSG,
         ]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "--new-password", "new_pass"]
         _, err = self.badfish_call()
@@ -167,7 +168,7 @@ class TestSetBiosPassCheckJobStatus(TestBase):
             TASK_OK_RESP,
         ]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "--new-password", "new_pass"]
         _, err = self.badfish_call()
@@ -9,6 +9,7 @@ from tests.config import (
     DEVICE_NIC_2,
     ERROR_DEV_NO_MATCH,
     INIT_RESP,
+    JOB_LOCATION_HEADERS,
     JOB_OK_RESP,
     RESET_TYPE_RESP,
     RESPONSE_BOOT_TO,
@@ -38,7 +39,7 @@ class TestBootTo(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, ["OK"])
-        self.set_mock_response(mock_post, 200, ["OK", JOB_OK_RESP])
+        self.set_mock_response(mock_post, 200, ["OK", JOB_OK_RESP], headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, DEVICE_NIC_2["name"]]
         _, err = self.badfish_call()
@@ -60,7 +61,7 @@ class TestBootTo(TestBase):
         post_responses = ["OK"] + [JOB_OK_RESP]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, [503, 200], ["Service Unavailable", "OK"])
-        self.set_mock_response(mock_post, 200, post_responses)
+        self.set_mock_response(mock_post, 200, post_responses, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, DEVICE_NIC_2["name"]]
         _, err = self.badfish_call()
@@ -85,7 +86,7 @@ class TestBootTo(TestBase):
         post_responses = ["OK"] + [JOB_OK_RESP, JOB_OK_RESP, JOB_OK_RESP, JOB_OK_RESP]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, [400, 200], ["Bad Request", "OK"])
-        self.set_mock_response(mock_post, [200, 204, 400], post_responses, True)
+        self.set_mock_response(mock_post, [200, 204, 400], post_responses)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, DEVICE_NIC_2["name"]]
         _, err = self.badfish_call()
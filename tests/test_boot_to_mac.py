@@ -9,6 +9,7 @@ from tests.config import (
     INIT_RESP,
     INTERFACES_PATH,
     INTERFACES_RESP,
+    JOB_LOCATION_HEADERS,
     JOB_OK_RESP,
     MAC_ADDRESS,
     RESPONSE_BOOT_TO,
@@ -37,7 +38,7 @@ class TestBootToMac(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, ["OK"])
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = ["-i", INTERFACES_PATH, self.option_arg, MAC_ADDRESS]
         _, err = self.badfish_call()
@@ -0,0 +1,118 @@
+from unittest.mock import patch
+
+from badfish.helpers.cache import ResponseCache
+
+ROOT = "https://host/redfish/v1"
+
+
+def test_get_miss_then_hit():
+    cache = ResponseCache()
+    assert cache.get(ROOT) == (False, None)
+    cache.set(ROOT, "root")
+    assert cache.get(ROOT) == (True, "root")
+
+
+def test_variants_are_cached_side_by_side():
+    cache = ResponseCache()
+    cache.set(ROOT, "response", variant="response")
+    cache.set(ROOT, {"json": True}, variant="json")
+    assert cache.get(ROOT, "response") == (True, "response")
+    assert cache.get(ROOT, "json") == (True, {"json": True})
+    assert len(cache) == 2
+
+
+@patch("badfish.helpers.cache.time.monotonic")
+def test_entry_expires_after_ttl(mock_time):
+    cache = ResponseCache(default_ttl=60)
+    mock_time.return_value = 100.0
+    cache.set(ROOT, "root")
+    cache.set(f"{ROOT}/Systems", "systems", ttl=5)
+    mock_time.return_value = 106.0
+    assert cache.get(ROOT) == (True, "root")
+    assert cache.get(f"{ROOT}/Systems") == (False, None)
+    mock_time.return_value = 160.0
+    assert cache.get(ROOT) == (False, None)
+    assert len(cache) == 0
+
+
+@patch("badfish.helpers.cache.time.monotonic")
+def test_max_age_bounds_accepted_entries(mock_time):
+    cache = ResponseCache()
+    mock_time.return_value = 100.0
+    cache.set(ROOT, "root")
+    mock_time.return_value = 110.0
+    assert cache.get(ROOT, max_age=30) == (True, "root")
+    assert cache.get(ROOT, max_age=5) == (False, None)
+    assert cache.get(ROOT, max_age=0) == (False, None)
+    assert cache.get(ROOT) == (True, "root")
+
+
+def test_invalidate_by_uri_and_prefix():
+    cache = ResponseCache()
+    jobs = f"{ROOT}/Managers/iDRAC.Embedded.1/Jobs"
+    cache.set(ROOT, "root")
+    cache.set(jobs, "jobs", variant="response")
+    cache.set(jobs, {}, variant="json")
+    cache.set(f"{jobs}/JID_1", "job")
+    assert cache.invalidate(uri=ROOT) == 1
+    assert cache.get(ROOT) == (False, None)
+    assert cache.invalidate(prefix=jobs) == 3
+    assert len(cache) == 0
+
+
+def test_clear():
+    cache = ResponseCache()
+    cache.set(ROOT, "root")
+    cache.clear()
+    assert len(cache) == 0
+
+
+def test_lru_eviction_by_entries():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", "1")
+    cache.set("b", "2")
+    cache.get("a")
+    cache.set("c", "3")
+    assert cache.get("b") == (False, None)
+    assert cache.get("a") == (True, "1")
+    assert cache.get("c") == (True, "3")
+    assert cache.evictions == 1
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=10)
+    cache.set("a", "x" * 4)
+    cache.set("b", {"parsed": True}, size=4)
+    assert cache.size == 8
+    cache.set("c", "y" * 4)
+    assert cache.get("a") == (False, None)
+    assert cache.size == 8
+    cache.set("b", {"parsed": False}, size=2)
+    assert cache.size == 6
+
+
+def test_value_larger_than_cache_is_not_stored():
+    cache = ResponseCache(max_bytes=10)
+    cache.set("a", "small")
+    cache.set("big", "z" * 11)
+    assert cache.get("big") == (False, None)
+    assert cache.get("a") == (True, "small")
+
+
+def test_hit_and_miss_counters():
+    cache = ResponseCache()
+    assert cache.hit_rate == 0.0
+    cache.get(ROOT)
+    cache.set(ROOT, "root")
+    cache.get(ROOT)
+    cache.get(ROOT)
+    cache.get(ROOT, max_age=0)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert cache.stats() == {
+        "entries": 1,
+        "bytes": 4,
+        "hits": 2,
+        "misses": 2,
+        "evictions": 0,
+        "hit_rate": 0.5,
+    }
@@ -14,6 +14,7 @@ from tests.config import (
     DEVICE_NIC_2,
     INIT_RESP,
     INTERFACES_PATH,
+    JOB_LOCATION_HEADERS,
     JOB_OK_RESP,
     PXE_DEV_RESP,
     RESET_TYPE_RESP,
@@ -57,7 +58,7 @@ class TestChangeBoot(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, ["OK"])
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = ["-i", INTERFACES_PATH, self.option_arg, "foreman"]
         _, err = self.badfish_call()
@@ -118,7 +119,7 @@ class TestChangeBoot(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, "OK")
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = ["-i", INTERFACES_PATH, self.option_arg, "foreman"]
         _, err = self.badfish_call()
@@ -142,7 +143,7 @@ class TestChangeBoot(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, "OK")
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = ["-i", INTERFACES_PATH, self.option_arg, "foreman", "--pxe"]
         _, err = self.badfish_call()
@@ -166,7 +167,7 @@ class TestChangeBoot(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, ["OK"])
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = ["-i", INTERFACES_PATH, self.option_arg, "director"]
         _, err = self.badfish_call()
@@ -218,7 +219,7 @@ class TestChangeBoot(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, ["OK"])
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = ["-i", INTERFACES_PATH, self.option_arg, "director"]
         _, err = self.badfish_call()
@@ -312,7 +313,7 @@ class TestToggleDevice(TestBase):
         responses = INIT_RESP + get_resp
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_patch, 200, ["OK"])
-        self.set_mock_response(mock_post, 200, JOB_OK_RESP)
+        self.set_mock_response(mock_post, 200, JOB_OK_RESP, headers=JOB_LOCATION_HEADERS)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, DEVICE_NIC_2["name"]]
         _, err = self.badfish_call()
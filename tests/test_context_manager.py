@@ -647,6 +647,7 @@ class TestExecuteBadfishSessionCleanup:
             # Mock badfish instance with no session_id
             mock_badfish = MagicMock()
             mock_badfish.session_id = None
+            mock_badfish.http_client.close = AsyncMock()
             mock_factory.return_value = mock_badfish
 
             # Mock delete_session
@@ -657,6 +658,8 @@ class TestExecuteBadfishSessionCleanup:
                 assert result is True
                 # delete_session should not be called when session_id is None
                 mock_delete.assert_not_called()
+                # but the pooled HTTP session must still be released
+                mock_badfish.http_client.close.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_execute_badfish_no_badfish_instance(self):
@@ -0,0 +1,101 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+from badfish.helpers.discovery import DiscoveryCache
+from badfish.helpers.exceptions import BadfishException
+from tests.config import INIT_RESP, MOCK_HOST, RESPONSE_POWER_STATE_ON, STATE_ON_RESP
+from tests.test_base import TestBase
+
+DISCOVERED = {
+    "protocol_features": {},
+    "session_uri": "/redfish/v1/Sessions",
+    "system_resource": "/redfish/v1/Systems/System.Embedded.1",
+    "manager_resource": "/redfish/v1/Managers/iDRAC.Embedded.1",
+    "vendor": "Dell",
+    "redfish_version": "1.0.2",
+}
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiscoveryCache(str(tmp_path / "discovery"), max_age=100)
+
+
+def test_save_and_load(cache):
+    assert cache.load("host-a") is None
+    cache.save("host-a", dict(DISCOVERED, token="secret"), now=1000.0)
+    with open(cache._path("host-a")) as _file:
+        assert "token" not in _file.read()
+    assert cache.load("host-a", now=1050.0) == DISCOVERED
+    assert os.listdir(cache.directory) == ["host-a.json"]
+
+
+def test_expired_and_invalid_entries_are_ignored(cache):
+    cache.save("host-a", DISCOVERED, now=1000.0)
+    assert cache.load("host-a", now=1200.0) is None
+    cache.save("host-b", dict(DISCOVERED, manager_resource=None))
+    assert cache.load("host-b") is None
+    with open(cache._path("host-c"), "w") as _file:
+        _file.write("{not json")
+    assert cache.load("host-c") is None
+
+
+def test_invalidate(cache):
+    cache.save("host-a", DISCOVERED)
+    cache.invalidate("host-a")
+    cache.invalidate("host-a")
+    assert cache.load("host-a") is None
+
+
+async def stale_session(badfish):
+    if badfish.session_uri == "/redfish/v1/Gone":
+        raise BadfishException("Failed to communicate with host")
+
+
+class TestDiscoveryCache(TestBase):
+    @pytest.fixture(autouse=True)
+    def cache_dir(self, tmp_path):
+        self.cache = DiscoveryCache(str(tmp_path / "discovery"))
+        self.args = ["--power-state", "--discovery-cache", self.cache.directory]
+
+    def call(self, mock_get, mock_post, mock_delete, responses, post_status=200):
+        self.set_mock_response(mock_get, 200, responses)
+        self.set_mock_response(mock_post, post_status, "OK")
+        self.set_mock_response(mock_delete, 200, "OK")
+        return self.badfish_call()
+
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_discovery_is_cached_then_reused(self, mock_get, mock_post, mock_delete):
+        _, err = self.call(mock_get, mock_post, mock_delete, INIT_RESP + [STATE_ON_RESP])
+        assert err == RESPONSE_POWER_STATE_ON
+        assert self.cache.load(MOCK_HOST) == DISCOVERED
+
+        mock_get.reset_mock()
+        _, err = self.call(mock_get, mock_post, mock_delete, [STATE_ON_RESP])
+        assert err == RESPONSE_POWER_STATE_ON
+        assert mock_get.call_count == 1
+
+    @patch("badfish.main.Badfish.validate_credentials", autospec=True, side_effect=stale_session)
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_stale_entry_is_discovered_again(self, mock_get, mock_post, mock_delete, mock_validate):
+        self.cache.save(MOCK_HOST, dict(DISCOVERED, session_uri="/redfish/v1/Gone"))
+        _, err = self.call(mock_get, mock_post, mock_delete, INIT_RESP + [STATE_ON_RESP])
+        assert err == RESPONSE_POWER_STATE_ON
+        assert mock_validate.call_count == 2
+        assert self.cache.load(MOCK_HOST) == DISCOVERED
+
+    @patch("badfish.main.Badfish.get_power_state", side_effect=BadfishException("gone"))
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_failure_drops_cached_entry(self, mock_get, mock_post, mock_delete, _):
+        self.cache.save(MOCK_HOST, DISCOVERED)
+        _, err = self.call(mock_get, mock_post, mock_delete, [])
+        assert err == "- ERROR    - gone\n"
+        assert self.cache.load(MOCK_HOST) is None
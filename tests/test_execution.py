@@ -1,6 +1,9 @@
+import json
 import os
 from unittest.mock import patch
 
+import pytest
+
 from badfish.helpers.exceptions import BadfishException
 from tests.config import (
     HOST_LIST_EXTRAS,
@@ -18,6 +21,7 @@ from tests.config import (
     WRONG_BADFISH_EXECUTION_HOST_LIST,
     MANAGER_INSTANCE_RESP,
     JOBS_RESP,
+    INIT_RESP_SYSTEM,
 )
 from tests.test_base import TestBase
 
@@ -79,13 +83,8 @@ class TestHostListExecution(TestBase):
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call(mock_host=None)
-        # When Members array is empty, init() catches the exception and logs as WARNING
-        assert (
-            err.count(
-                "- WARNING  - Could not find system resource: ComputerSystem's Members array is either empty or missing"
-            )
-            == 3
-        )
+        # --ls-jobs only discovers the manager, whose empty Members array fails every host
+        assert err.count("- ERROR    - Manager's Members array is either empty or missing") == 3
         assert err.count("- INFO     - ************************************************") == 3
         assert "[badfish.helpers.logger] - INFO     - RESULTS:" in err
         assert err.count("f01-h01-000-r630.host.io: FAILED") == 3
@@ -141,6 +140,8 @@ class TestInitialization(TestBase):
         # Additional responses needed if code continues after authentication
         responses = [ROOT_RESP, ROOT_RESP, ROOT_RESP, ROOT_RESP, MAN_RESP, '{"Members":[]}', ROOT_RESP]
         # Put 401 on a different position - the key is finding where Systems is actually called
+        # Without a command both resources are discovered
+        self.args = []
         self.set_mock_response(mock_get, [200, 200, 200, 401, 200, 200, 200], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -154,6 +155,8 @@ class TestInitialization(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_find_systems_resource_not_found(self, mock_get, mock_post, mock_delete):
         responses = [ROOT_RESP, ROOT_RESP, "{}", "{}", MAN_RESP, '{"Members":[]}', ROOT_RESP]
+        # Without a command both resources are discovered
+        self.args = []
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -161,3 +164,116 @@ class TestInitialization(TestBase):
         # When Members array is empty or missing, init() catches the exception and logs as WARNING
         assert "- WARNING  - Could not find system resource:" in err
         assert "Systems resource not found" in err or "ComputerSystem's Members array" in err
+
+
+class TestSharedConnector(TestBase):
+    args = [
+        "--host-list",
+        f"{os.path.dirname(__file__)}/fixtures/hosts_good.txt",
+        "--ls-jobs",
+        "--connection-limit",
+        "12",
+        "--connection-limit-per-host",
+        "3",
+    ]
+
+    @patch("badfish.main.execute_badfish")
+    def test_host_list_shares_one_connector(self, mock_execute):
+        mock_execute.return_value = ("host", True)
+        self.badfish_call(mock_host=None)
+        connectors = {call.kwargs["connector"] for call in mock_execute.await_args_list}
+        assert len(mock_execute.await_args_list) == 3
+        assert len(connectors) == 1
+        connector = connectors.pop()
+        assert connector.limit == 12
+        assert connector.limit_per_host == 3
+        assert connector.closed
+
+
+class TestBoundedHostList(TestBase):
+    @pytest.fixture(autouse=True)
+    def host_list(self, tmp_path):
+        path = tmp_path / "hosts"
+        path.write_text("host-a.example.com rack-1\n\nhost-b.example.com rack-1\nhost-c.example.com\n")
+        self.tmp_path = tmp_path
+        self.args = ["--host-list", str(path), "--ls-jobs", "--max-concurrency", "2", "--group-limit", "1"]
+
+    @patch("badfish.main.gather_bounded")
+    def test_host_list_is_scheduled_with_limits(self, mock_gather):
+        mock_gather.return_value = [("host-a", True), ("host-b", True), ("host-c", False)]
+        _, err = self.badfish_call(mock_host=None)
+        jobs, max_concurrency, groups, group_limit = mock_gather.await_args.args
+        assert [job.args[0] for job in jobs] == ["host-a.example.com", "host-b.example.com", "host-c.example.com"]
+        assert (max_concurrency, groups, group_limit) == (2, ["rack-1", "rack-1", None], 1)
+        assert "- INFO     - host-b: SUCCESSFUL\n" in err
+        assert "- INFO     - host-c: FAILED\n" in err
+
+    @patch("badfish.main.gather_bounded")
+    def test_firmware_comparison_keeps_groups(self, mock_gather):
+        mock_gather.return_value = [[{"SoftwareId": "159", "Name": "BIOS", "Version": "2.19.1"}]] * 3
+        self.args = self.args[:2] + ["--compare-firmware", "--max-concurrency", "2", "--group-limit", "1"]
+        self.badfish_call(mock_host=None)
+        _, max_concurrency, groups, group_limit = mock_gather.await_args.args
+        assert (max_concurrency, groups, group_limit) == (2, ["rack-1", "rack-1", None], 1)
+
+    def test_firmware_compliance_keeps_groups(self):
+        baseline = self.tmp_path / "baseline.yaml"
+        baseline.write_text("BIOS: 2.19.1\n")
+        self.args = self.args[:2] + ["--firmware-compliance", "--firmware-baseline", str(baseline)]
+        self.args += ["--max-concurrency", "2", "--group-limit", "1"]
+        scheduled = []
+
+        async def bounded(jobs, *limits):
+            scheduled.append(limits)
+            for index in range(len(jobs)):
+                yield index, ("PowerEdge R650", [{"SoftwareId": "159", "Name": "BIOS", "Version": "2.19.1"}])
+
+        with patch("badfish.main.run_bounded", new=bounded):
+            self.badfish_call(mock_host=None)
+        assert scheduled == [(2, ["rack-1", "rack-1", None], 1)]
+
+
+class TestStreamedHostList(TestBase):
+    @pytest.fixture(autouse=True)
+    def host_list(self, tmp_path):
+        path = tmp_path / "hosts"
+        path.write_text("host-a.example.com\nhost-b.example.com\n")
+        self.args = ["--host-list", str(path), "--power-state", "--max-concurrency", "1", "--stream"]
+
+    def call(self, mock_get, mock_post, mock_delete):
+        self.set_mock_response(mock_get, 200, INIT_RESP_SYSTEM * 2)
+        self.set_mock_response(mock_post, 200, "OK")
+        self.set_mock_response(mock_delete, 200, "OK")
+        return self.badfish_call(mock_host=None)
+
+    @patch("badfish.main.Badfish.get_power_state", return_value="On")
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_host_blocks_are_written_whole(self, mock_get, mock_post, mock_delete, _):
+        _, err = self.call(mock_get, mock_post, mock_delete)
+        assert err == (
+            "[host-a] - INFO     - Executing actions on host: host-a.example.com\n"
+            "[host-a] - INFO     - Power state:\n"
+            "[host-a] - INFO     -     host-a.example.com: 'On'\n"
+            "[host-a] - INFO     - ************************************************\n"
+            "[host-b] - INFO     - Executing actions on host: host-b.example.com\n"
+            "[host-b] - INFO     - Power state:\n"
+            "[host-b] - INFO     -     host-b.example.com: 'On'\n"
+            "[host-b] - INFO     - ************************************************\n"
+            "[badfish.helpers.logger] - INFO     - RESULTS:\n"
+            "[badfish.helpers.logger] - INFO     - host-a.example.com: SUCCESSFUL\n"
+            "[badfish.helpers.logger] - INFO     - host-b.example.com: SUCCESSFUL\n"
+        )
+
+    @patch("badfish.main.Badfish.get_power_state", return_value="On")
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_json_lines(self, mock_get, mock_post, mock_delete, _):
+        self.args += ["--output", "json"]
+        _, err = self.call(mock_get, mock_post, mock_delete)
+        assert [json.loads(line) for line in err.splitlines()] == [
+            {"host-a.example.com": {"Power state": {"host-a.example.com": "On"}}},
+            {"host-b.example.com": {"Power state": {"host-b.example.com": "On"}}},
+        ]
@@ -0,0 +1,263 @@
+import asyncio
+import json
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.firmware import (
+    ComplianceIndex,
+    Requirement,
+    compare_firmware,
+    component_key,
+    load_baseline,
+    parse_version,
+)
+from badfish.helpers.logger import BadfishHandler
+from tests.config import INIT_RESP
+from tests.test_base import TestBase
+
+BIOS = {"Id": "Installed-159-2.19.1__BIOS.Setup.1-1", "Name": "BIOS", "SoftwareId": "159", "Version": "2.19.1"}
+IDRAC = {"Id": "Installed-25227-6.10.30.00", "Name": "Integrated Dell Remote Access Controller", "SoftwareId": "25227"}
+NIC = {
+    "Id": "Installed-0-19.5.12",
+    "Name": "Intel(R) Ethernet Network Adapter",
+    "SoftwareId": "0",
+    "Version": "19.5.12",
+}
+
+
+def test_parse_version_orders_dell_versions():
+    assert parse_version("2.10.0") > parse_version("2.9.1")
+    assert parse_version("A10") > parse_version("A9")
+    assert parse_version("22.5.7-0") > parse_version("22.5.7")
+    assert parse_version("1.0.4 (A00)") < parse_version("1.0.4 (A01)")
+    assert parse_version("2.19") < parse_version("2.19.1")
+
+
+def test_component_key_falls_back_to_name():
+    assert component_key(BIOS) == "159"
+    assert component_key(NIC) == "Intel(R) Ethernet Network Adapter"
+
+
+def test_compare_firmware_majority_and_outliers():
+    inventories = {
+        "host-a": [BIOS, dict(IDRAC, Version="6.10.30.00"), NIC],
+        "host-b": [BIOS, dict(IDRAC, Version="6.10.30.00")],
+        "host-c": [dict(BIOS, Version="2.18.1"), dict(IDRAC, Version="7.00.00.00"), NIC],
+    }
+    comparison = compare_firmware(inventories)
+    assert list(comparison) == ["159", "25227", NIC["Name"]]
+    assert comparison["159"] == {
+        "Name": "BIOS",
+        "Expected": "2.19.1",
+        "Versions": {"2.19.1": 2, "2.18.1": 1},
+        "Outliers": {"host-c": "2.18.1"},
+    }
+    assert comparison["25227"]["Outliers"] == {"host-c": "7.00.00.00"}
+    assert comparison[NIC["Name"]] == {
+        "Name": NIC["Name"],
+        "Expected": "19.5.12",
+        "Versions": {"19.5.12": 2},
+        "Missing": ["host-b"],
+    }
+
+
+def test_compare_firmware_checks_every_device_of_a_component():
+    disk = {"Name": "PERC H740P Disk", "SoftwareId": "104542"}
+    inventories = {
+        "a": [dict(disk, Id="Disk.0", Version="A1"), dict(disk, Id="Disk.1", Version="A2")],
+        "b": [dict(disk, Id="Disk.0", Version="A2"), dict(disk, Id="Disk.1", Version="A2")],
+        "c": [dict(disk, Id="Disk.0", Version="A2")],
+    }
+    comparison = compare_firmware(inventories)
+    assert comparison["104542"]["Expected"] == "A2"
+    assert comparison["104542"]["Versions"] == {"A2": 3, "A1": 1}
+    assert comparison["104542"]["Outliers"] == {"a": "A1"}
+    comparison = compare_firmware(inventories, {"104542": ">=A2"})
+    assert comparison["104542"]["Outliers"] == {"a": "A1"}
+
+
+def test_compare_firmware_tie_prefers_newest():
+    inventories = {"host-a": [BIOS], "host-b": [dict(BIOS, Version="2.18.1")]}
+    comparison = compare_firmware(inventories)
+    assert comparison["159"]["Expected"] == "2.19.1"
+    assert comparison["159"]["Outliers"] == {"host-b": "2.18.1"}
+
+
+def test_compare_firmware_against_baseline():
+    inventories = {"host-a": [BIOS, NIC], "host-b": [BIOS]}
+    baseline = {"BIOS": "2.20.0", NIC["Name"]: "19.5.12", "999": "1.0"}
+    comparison = compare_firmware(inventories, baseline)
+    assert comparison["159"]["Expected"] == "2.20.0"
+    assert comparison["159"]["Outliers"] == {"host-a": "2.19.1", "host-b": "2.19.1"}
+    assert "Outliers" not in comparison[NIC["Name"]]
+    assert comparison["999"] == {"Name": "999", "Expected": "1.0", "Versions": {}, "Missing": ["host-a", "host-b"]}
+
+
+def test_load_baseline(tmp_path):
+    path = tmp_path / "baseline.yaml"
+    path.write_text("159: 2.19.1\nBIOS: 2.19.1\n")
+    assert load_baseline(str(path)) == {"components": {"159": "2.19.1", "BIOS": "2.19.1"}, "models": {}}
+    path.write_text("models:\n  PowerEdge R650:\n    BIOS: '>=2.19'\n")
+    assert load_baseline(str(path)) == {"components": {}, "models": {"PowerEdge R650": {"BIOS": ">=2.19"}}}
+    for invalid in ("- not a mapping\n", "components: [BIOS]\n", "models: [R650]\n"):
+        path.write_text(invalid)
+        with pytest.raises(BadfishException):
+            load_baseline(str(path))
+    with pytest.raises(BadfishException):
+        load_baseline(str(tmp_path / "missing.yaml"))
+
+
+class TestCompareFirmware(TestBase):
+    def call(self, mock_get, mock_post, mock_delete):
+        self.set_mock_response(mock_get, 200, INIT_RESP * 2)
+        self.set_mock_response(mock_post, 200, "OK")
+        self.set_mock_response(mock_delete, 200, "OK")
+        return self.badfish_call()
+
+    @patch(
+        "badfish.main.Badfish.get_firmware_devices",
+        autospec=True,
+        side_effect=lambda badfish: [dict(BIOS, Version="2.18.1")] if badfish.host.startswith("other") else [BIOS],
+    )
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_delta_compares_both_hosts(self, mock_get, mock_post, mock_delete, _):
+        self.args = ["--firmware-inventory", "--delta", "other-host.example.com", "--output", "json"]
+        # Hosts share the mocked responses, so discover them one at a time
+        self.args += ["--max-concurrency", "1"]
+        _, err = self.call(mock_get, mock_post, mock_delete)
+        comparison = json.loads(err)
+        assert comparison["159"]["Versions"] == {"2.19.1": 1, "2.18.1": 1}
+        assert comparison["159"]["Outliers"] == {"other-host.example.com": "2.18.1"}
+
+    @patch("badfish.main.Badfish.get_firmware_devices", return_value=[BIOS])
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_compare_against_baseline_file(self, mock_get, mock_post, mock_delete, _):
+        with open(self.baseline, "w") as _file:
+            _file.write("BIOS: 2.19.1\n")
+        self.args = ["--compare-firmware", "--firmware-baseline", self.baseline]
+        _, err = self.call(mock_get, mock_post, mock_delete)
+        assert "- INFO     -   Expected: 2.19.1\n" in err
+        assert "Outliers" not in err
+
+    @pytest.fixture(autouse=True)
+    def baseline_path(self, tmp_path):
+        self.baseline = str(tmp_path / "baseline.yaml")
+
+
+def test_requirement_parse_and_satisfied_by():
+    assert str(Requirement.parse(">= 2.19.1")) == ">=2.19.1"
+    assert str(Requirement.parse("2.19.1")) == "2.19.1"
+    assert Requirement.parse(">=2.19.1").satisfied_by("2.20.0")
+    assert not Requirement.parse(">=2.19.1").satisfied_by("2.9.9")
+    assert Requirement.parse("=A09").satisfied_by("A09")
+    assert Requirement.parse("<7").satisfied_by("6.10.30.00")
+    assert Requirement.parse("!=1.0").satisfied_by("1.1")
+
+
+def test_compliance_index_per_model_overrides():
+    index = ComplianceIndex.compile(
+        {
+            "components": {"BIOS": ">=2.18.0", "25227": ">=6.10"},
+            "models": {"PowerEdge R650": {"159": "2.19.1"}},
+        }
+    )
+    rows = [BIOS, dict(IDRAC, Version="6.00.30.00")]
+    assert index.check(rows) == {
+        "Compliant": False,
+        "Drift": {"25227": {"Required": ">=6.10", "Installed": "6.00.30.00"}},
+    }
+    assert index.check([dict(BIOS, Version="2.18.1"), dict(IDRAC, Version="6.10.30.00")], "PowerEdge R650") == {
+        "Compliant": False,
+        "Model": "PowerEdge R650",
+        "Drift": {"159": {"Required": "2.19.1", "Installed": "2.18.1"}},
+    }
+    assert index.check([BIOS], "PowerEdge R650") == {
+        "Compliant": False,
+        "Model": "PowerEdge R650",
+        "Missing": ["25227"],
+    }
+    assert index.table("PowerEdge R650") is index.table("PowerEdge R650")
+
+
+def test_compliance_index_shares_the_comparison_baseline(tmp_path):
+    path = tmp_path / "baseline.yaml"
+    path.write_text("BIOS: '>=2.19'\n")
+    baseline = load_baseline(str(path))
+    assert ComplianceIndex.compile(baseline).check([BIOS]) == {"Compliant": True}
+    comparison = compare_firmware({"host-a": [BIOS], "host-b": [dict(BIOS, Version="2.18.1")]}, baseline["components"])
+    assert comparison["159"]["Expected"] == ">=2.19"
+    assert comparison["159"]["Outliers"] == {"host-b": "2.18.1"}
+
+
+class TestFirmwareCompliance(TestBase):
+    @pytest.fixture(autouse=True)
+    def files(self, tmp_path):
+        self.baseline = tmp_path / "baseline.yaml"
+        self.baseline.write_text("models:\n  PowerEdge R650:\n    BIOS: '>=2.19.1'\n")
+        self.host_list = tmp_path / "hosts"
+        self.host_list.write_text("host-a.example.com\nhost-b.example.com\n")
+
+    def call(self, mock_get, mock_post, mock_delete):
+        self.set_mock_response(mock_get, 200, INIT_RESP * 2)
+        self.set_mock_response(mock_post, 200, "OK")
+        self.set_mock_response(mock_delete, 200, "OK")
+        self.args = ["--host-list", str(self.host_list), "--firmware-compliance", "-o", "json"]
+        self.args += ["--firmware-baseline", str(self.baseline)]
+        self.args += ["--max-concurrency", "1"]
+        _, err = self.badfish_call(mock_host=None)
+        return [json.loads(line) for line in err.splitlines()]
+
+    @patch("badfish.main.Badfish.get_system_model", return_value="PowerEdge R650")
+    @patch(
+        "badfish.main.Badfish.get_firmware_devices",
+        autospec=True,
+        side_effect=lambda badfish: [BIOS] if badfish.host.startswith("host-a") else [dict(BIOS, Version="2.18.1")],
+    )
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_firmware_compliance_reports_each_host(self, mock_get, mock_post, mock_delete, *_):
+        assert self.call(mock_get, mock_post, mock_delete) == [
+            {"host-a.example.com": {"Compliant": True, "Model": "PowerEdge R650"}},
+            {
+                "host-b.example.com": {
+                    "Compliant": False,
+                    "Model": "PowerEdge R650",
+                    "Drift": {"BIOS": {"Required": ">=2.19.1", "Installed": "2.18.1"}},
+                }
+            },
+        ]
+
+    @patch("badfish.main.Badfish.get_system_model", return_value="PowerEdge R650")
+    @patch("badfish.main.Badfish.get_firmware_devices", autospec=True)
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_report_is_written_before_slower_hosts_finish(self, mock_get, mock_post, mock_delete, mock_devices, _):
+        written = threading.Event()
+        seen_by_slow_host = []
+        flush_host = BadfishHandler.flush_host
+
+        def flush_and_signal(handler, record, host, result):
+            flush_host(handler, record, host, result)
+            written.set()
+
+        async def devices(badfish):
+            if badfish.host.startswith("host-b"):
+                # Output is written by the logging thread, wait for it there
+                wait = asyncio.get_running_loop().run_in_executor(None, written.wait, 5)
+                seen_by_slow_host.append(await wait)
+            return [BIOS]
+
+        mock_devices.side_effect = devices
+        with patch.object(BadfishHandler, "flush_host", autospec=True, side_effect=flush_and_signal):
+            reports = self.call(mock_get, mock_post, mock_delete)
+        assert seen_by_slow_host == [True]
+        assert [list(report) for report in reports] == [["host-a.example.com"], ["host-b.example.com"]]
@@ -1,4 +1,6 @@
-from unittest.mock import PropertyMock, patch
+import asyncio
+import json
+from unittest.mock import AsyncMock, PropertyMock, patch
 
 from tests.config import (
     FIRMWARE_INVENTORY_1_RESP,
@@ -9,6 +11,7 @@ from tests.config import (
     RESPONSE_FIRMWARE_INVENTORY,
     RESPONSE_FIRMWARE_INVENTORY_NONE_RESPONSE,
     RESPONSE_FIRMWARE_INVENTORY_NOT_ABLE_TO_ACCESS,
+    ROOT_RESP_EXPAND,
 )
 from tests.test_base import MockResponse, TestBase
 
@@ -94,3 +97,80 @@ class TestFirmwareInventory(TestBase):
         self.args = [self.option_arg]
         _, err = self.badfish_call()
         assert err == RESPONSE_FIRMWARE_INVENTORY_NONE_RESPONSE
+
+
+class TestCollectionMembers(TestBase):
+    async def test_members_fetched_concurrently_in_order(self):
+        """Members are fetched concurrently up to the limit, in order, skipping failures."""
+        bf = self.badfish(_fetch_concurrency=2)
+        in_flight = []
+        peak = []
+
+        async def get_request(uri, _continue=False):
+            in_flight.append(uri)
+            peak.append(len(in_flight))
+            future = asyncio.get_running_loop().create_future()
+            asyncio.get_running_loop().call_later(0.001 * (5 - int(uri[-1])), future.set_result, None)
+            await future
+            in_flight.remove(uri)
+            if uri.endswith("3"):
+                return None
+            return MockResponse('{"Id": "%s"}' % uri[-1], 200)
+
+        bf.get_request = get_request
+        data = {"Members": [{"@odata.id": f"/redfish/v1/Fw/Installed-{i}"} for i in range(5)] + [{"@odata.id": "/x/9"}]}
+        members = await bf.get_collection_members(data, lambda uri: "Installed" in uri, _continue=True)
+
+        assert [member["Id"] for member in members] == ["0", "1", "2", "4"]
+        assert max(peak) == 2
+
+    async def test_unchanged_member_is_not_fetched(self):
+        bf = self.badfish()
+        uri = f"{bf.host_uri}/redfish/v1/Systems/System.Embedded.1/Memory/DIMM.A1"
+        bf.load_members({uri: ('W/"1"', '{"Id": "DIMM.A1", "CapacityMiB": 16384}')})
+        bf.get_request = AsyncMock(
+            return_value=MockResponse('{"Id": "DIMM.A1", "CapacityMiB": 32768}', 200, {"ETag": 'W/"2"'})
+        )
+
+        member = {"@odata.id": "/redfish/v1/Systems/System.Embedded.1/Memory/DIMM.A1", "@odata.etag": 'W/"1"'}
+        assert await bf.get_collection_member(member) == {"Id": "DIMM.A1", "CapacityMiB": 16384}
+        bf.get_request.assert_not_awaited()
+
+        member["@odata.etag"] = 'W/"2"'
+        assert await bf.get_collection_member(member) == {"Id": "DIMM.A1", "CapacityMiB": 32768}
+        bf.get_request.assert_awaited_once()
+        assert bf.member_etags == {uri: ('W/"2"', '{"Id": "DIMM.A1", "CapacityMiB": 32768}')}
+
+    @patch("aiohttp.ClientSession.get")
+    async def test_incremental_refresh_with_expand_query(self, mock_get):
+        collection = "/redfish/v1/Systems/System.Embedded.1/Memory"
+        dimms = [{"@odata.id": f"{collection}/DIMM.A{i}", "@odata.etag": f'W/"{i}"', "Id": i} for i in range(2)]
+        features = json.loads(ROOT_RESP_EXPAND)["ProtocolFeaturesSupported"]
+
+        # Without stored members the collection is expanded and the inline members are recorded
+        first = self.badfish()
+        first.http_client.use_protocol_features(features)
+        self.set_mock_response(mock_get, 200, json.dumps({"Members": dimms}))
+        listing = await first.get_collection(first.host_uri + collection)
+        assert await first.get_collection_members(listing.json()) == dimms
+        assert [call.args[0] for call in mock_get.call_args_list] == [
+            f"{first.host_uri}{collection}?$expand=.($levels=1)"
+        ]
+        assert set(first.member_etags) == {first.host_uri + dimm["@odata.id"] for dimm in dimms}
+        await first.http_client.close()
+
+        # With them only the listing and the changed member are fetched
+        changed = dict(dimms[1], **{"@odata.etag": 'W/"9"', "Id": 9})
+        second = self.badfish()
+        second.http_client.use_protocol_features(features)
+        second.load_members(first.member_etags)
+        mock_get.reset_mock()
+        members = [{key: dimm[key] for key in ("@odata.id", "@odata.etag")} for dimm in (dimms[0], changed)]
+        self.set_mock_response(mock_get, 200, [json.dumps({"Members": members}), json.dumps(changed)])
+        listing = await second.get_collection(second.host_uri + collection)
+        assert await second.get_collection_members(listing.json()) == [dimms[0], changed]
+        assert [call.args[0] for call in mock_get.call_args_list] == [
+            second.host_uri + collection,
+            second.host_uri + changed["@odata.id"],
+        ]
+        await second.http_client.close()
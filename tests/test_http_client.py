@@ -1,13 +1,21 @@
+import asyncio
 import json
 import ssl
-from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import aiohttp
 import pytest
 
-from badfish.helpers.http_client import HTTPClient
+from badfish.config import CONNECTION_LIMIT_PER_HOST
+from badfish.helpers.http_client import (
+    HTTPClient,
+    Response,
+    create_connector,
+    select_fields,
+    session_limit_reached,
+)
 from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.slots import SessionSlots
 
 
 class DummyLogger:
@@ -23,23 +31,18 @@ class DummyLogger:
         self.warn_msgs.append(str(msg))
 
 
-def set_mock_response(mock, status, responses, post=False, headers=None):
+def set_mock_response(mock, status, responses, headers=None):
     mock.return_value.__aenter__.return_value.name = responses
     status_mock = MagicMock()
     if isinstance(status, list):
-        if post:
-            dup_stats = [val for val in status for _ in range(2)]
-            type(status_mock).status = PropertyMock(side_effect=dup_stats)
-        else:
-            type(status_mock).status = PropertyMock(side_effect=status)
+        type(status_mock).status = PropertyMock(side_effect=status)
     else:
         type(status_mock).status = PropertyMock(return_value=status)
     mock.return_value.__aenter__.return_value = status_mock
-    mock.return_value.__aenter__.return_value.read = AsyncMock(return_value=b"")
     if isinstance(responses, list):
-        mock.return_value.__aenter__.return_value.text = AsyncMock(side_effect=responses)
+        mock.return_value.__aenter__.return_value.read = AsyncMock(side_effect=[r.encode() for r in responses])
     else:
-        mock.return_value.__aenter__.return_value.text = AsyncMock(return_value=responses)
+        mock.return_value.__aenter__.return_value.read = AsyncMock(return_value=responses.encode())
     mock.return_value.__aenter__.return_value.headers = headers or {}
 
 
@@ -47,7 +50,7 @@ def set_mock_response(mock, status, responses, post=False, headers=None):
 async def test_error_handler_valueerror_raises():
     logger = DummyLogger()
     client = HTTPClient("host", "u", "p", logger, insecure=False)
-    resp = SimpleNamespace(text=AsyncMock(return_value="not-json"))
+    resp = Response(500, {}, b"not-json")
     with pytest.raises(BadfishException, match="Error reading response from host."):
         await client.error_handler(resp)
 
@@ -57,7 +60,7 @@ async def test_error_handler_extended_info_with_custom_message():
     logger = DummyLogger()
     client = HTTPClient("host", "u", "p", logger, insecure=False)
     payload = {"error": {"@Message.ExtendedInfo": [{"Message": "detail", "Resolution": "fix it"}]}}
-    resp = SimpleNamespace(text=AsyncMock(return_value=json.dumps(payload)))
+    resp = Response(400, {}, json.dumps(payload).encode())
     with pytest.raises(BadfishException, match="custom"):
         await client.error_handler(resp, message="custom")
     assert any("fix it" in m for m in logger.debug_msgs)
@@ -122,19 +125,11 @@ async def test_get_json_success_and_invalid():
     logger = DummyLogger()
     client = HTTPClient("host", "u", "p", logger, insecure=False)
 
-    class FakeResp:
-        def __init__(self, text):
-            self.status = 200
-            self._text = text
-
-        async def text(self, *args, **kwargs):
-            return self._text
-
-    client.get_raw = AsyncMock(return_value=FakeResp('{"a":1}'))
+    client.get_raw = AsyncMock(return_value=Response(200, {}, b'{"a":1}'))
     data = await client.get_json("https://x1")
     assert data == {"a": 1}
 
-    client.get_raw = AsyncMock(return_value=FakeResp("not json"))
+    client.get_raw = AsyncMock(return_value=Response(200, {}, b"not json"))
     data = await client.get_json("https://x2")
     assert data is None
 
@@ -151,12 +146,12 @@ async def test_post_request_with_and_without_204(mock_post):
     client.token = "TT"
 
     # Non-204 => reads body, returns response
-    set_mock_response(mock_post, 200, "OK", post=True)
+    set_mock_response(mock_post, 200, "OK")
     resp = await client.post_request("https://x", {"k": "v"}, {"h": "v"})
     assert resp.status == 200
 
     # 204 => returns without read
-    set_mock_response(mock_post, 204, "", post=True)
+    set_mock_response(mock_post, 204, "")
     resp2 = await client.post_request("https://x", {"k": "v"}, {"h": "v"})
     assert resp2.status == 204
 
@@ -219,15 +214,15 @@ async def test_find_session_uri_paths_and_404_switch():
 
     # First call: root with Redfish 1.60 -> SessionService/Sessions
     # Second call: check session URI returns 200 => keep
-    resp1 = SimpleNamespace(status=200, text=AsyncMock(return_value=json.dumps({"RedfishVersion": "1.60"})))
-    resp2 = SimpleNamespace(status=200, text=AsyncMock(return_value="{}"))
+    resp1 = Response(200, {}, json.dumps({"RedfishVersion": "1.60"}).encode())
+    resp2 = Response(200, {}, b"{}")
     client.get_request = AsyncMock(side_effect=[resp1, resp2])
     out = await client.find_session_uri()
     assert out == "/redfish/v1/SessionService/Sessions"
 
     # If check returns 404, switch to SessionService/Sessions anyway
-    resp1b = SimpleNamespace(status=200, text=AsyncMock(return_value=json.dumps({"RedfishVersion": "1.50"})))
-    resp2b = SimpleNamespace(status=404, text=AsyncMock(return_value="{}"))
+    resp1b = Response(200, {}, json.dumps({"RedfishVersion": "1.50"}).encode())
+    resp2b = Response(404, {}, b"{}")
     client.get_request = AsyncMock(side_effect=[resp1b, resp2b])
     out2 = await client.find_session_uri()
     assert out2 == "/redfish/v1/SessionService/Sessions"
@@ -238,13 +233,13 @@ async def test_find_session_uri_auth_or_comm_errors():
     logger = DummyLogger()
     client = HTTPClient("host", "u", "p", logger, insecure=False)
     # Unauthorized
-    resp401 = SimpleNamespace(status=401, text=AsyncMock(return_value="{}"))
+    resp401 = Response(401, {}, b"{}")
     client.get_request = AsyncMock(return_value=resp401)
     with pytest.raises(BadfishException, match="Failed to authenticate"):
         await client.find_session_uri()
 
     # Non-200/201
-    resp500 = SimpleNamespace(status=500, text=AsyncMock(return_value="{}"))
+    resp500 = Response(500, {}, b"{}")
     client.get_request = AsyncMock(return_value=resp500)
     with pytest.raises(BadfishException, match="Failed to communicate"):
         await client.find_session_uri()
@@ -257,20 +252,20 @@ async def test_validate_credentials_success_and_errors():
     client.find_session_uri = AsyncMock(return_value="/redfish/v1/Sessions")
 
     headers = {"Location": "/redfish/v1/SessionService/Sessions/1", "X-Auth-Token": "TK"}
-    resp_ok = SimpleNamespace(status=200, text=AsyncMock(return_value="OK"), headers=headers)
+    resp_ok = Response(200, headers, b"OK")
     client.post_request = AsyncMock(return_value=resp_ok)
     token = await client.validate_credentials()
     assert token == "TK"
     assert client.session_id == headers["Location"]
 
     # 401
-    resp_unauth = SimpleNamespace(status=401, text=AsyncMock(return_value=""), headers={})
+    resp_unauth = Response(401, {}, b"")
     client.post_request = AsyncMock(return_value=resp_unauth)
     with pytest.raises(BadfishException, match="Failed to authenticate"):
         await client.validate_credentials()
 
     # 500
-    resp_err = SimpleNamespace(status=500, text=AsyncMock(return_value=""), headers={})
+    resp_err = Response(500, {}, b"")
     client.post_request = AsyncMock(return_value=resp_err)
     with pytest.raises(BadfishException, match="Failed to communicate"):
         await client.validate_credentials()
@@ -289,7 +284,7 @@ async def test_delete_session_paths_and_cleanup():
     # 200/201 => debug, then cleanup
     client.session_id = "/redfish/v1/SessionService/Sessions/1"
     client.token = "TK"
-    resp_ok = SimpleNamespace(status=200, read=AsyncMock(return_value=b""))
+    resp_ok = Response(200)
     client.delete_request = AsyncMock(return_value=resp_ok)
     await client.delete_session()
     assert any("successfully deleted" in m for m in logger.debug_msgs)
@@ -298,7 +293,7 @@ async def test_delete_session_paths_and_cleanup():
     # 404 => debug not found
     client.session_id = "/redfish/v1/SessionService/Sessions/2"
     client.token = "TK"
-    resp_404 = SimpleNamespace(status=404, read=AsyncMock(return_value=b""))
+    resp_404 = Response(404)
     client.delete_request = AsyncMock(return_value=resp_404)
     await client.delete_session()
     assert any("not found" in m for m in logger.debug_msgs)
@@ -306,7 +301,7 @@ async def test_delete_session_paths_and_cleanup():
     # Other status => warning
     client.session_id = "/redfish/v1/SessionService/Sessions/3"
     client.token = "TK"
-    resp_418 = SimpleNamespace(status=418, read=AsyncMock(return_value=b""))
+    resp_418 = Response(418)
     client.delete_request = AsyncMock(return_value=resp_418)
     await client.delete_session()
     assert any("Unexpected status" in m for m in logger.warn_msgs)
@@ -435,35 +430,509 @@ async def test_delete_request_client_connector_certificate_error_raises(mock_del
 
 @pytest.mark.asyncio
 @patch("aiohttp.ClientSession.get")
-async def test_insecure_flag_sets_ssl_false(mock_get):
-    """Test that insecure=True properly disables SSL verification"""
+async def test_insecure_flag_disables_verification(mock_get):
+    """Test that insecure=True passes a context that skips SSL verification"""
     logger = DummyLogger()
     client = HTTPClient("host", "u", "p", logger, insecure=True)
     set_mock_response(mock_get, 200, "{}")
     await client.get_raw("https://x")
 
-    # Check that ssl=False was passed
-    called_with_ssl_false = False
-    for args, kwargs in mock_get.call_args_list:
-        if kwargs.get("ssl") is False:
-            called_with_ssl_false = True
-            break
-    assert called_with_ssl_false, "insecure=True should set ssl=False"
+    _, kwargs = mock_get.call_args
+    context = kwargs.get("ssl")
+    assert isinstance(context, ssl.SSLContext)
+    assert context.verify_mode == ssl.CERT_NONE
+    assert context.check_hostname is False
 
 
 @pytest.mark.asyncio
 @patch("aiohttp.ClientSession.get")
-async def test_secure_flag_sets_ssl_true(mock_get):
-    """Test that insecure=False properly enables SSL verification"""
+async def test_secure_flag_enables_verification(mock_get):
+    """Test that insecure=False passes a context that verifies certificates"""
     logger = DummyLogger()
     client = HTTPClient("host", "u", "p", logger, insecure=False)
     set_mock_response(mock_get, 200, "{}")
     await client.get_raw("https://x")
 
-    # Check that ssl=True was passed
-    called_with_ssl_true = False
-    for args, kwargs in mock_get.call_args_list:
-        if kwargs.get("ssl") is True:
-            called_with_ssl_true = True
-            break
-    assert called_with_ssl_true, "insecure=False should set ssl=True"
+    _, kwargs = mock_get.call_args
+    context = kwargs.get("ssl")
+    assert isinstance(context, ssl.SSLContext)
+    assert context.verify_mode == ssl.CERT_REQUIRED
+    assert context.check_hostname is True
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.post")
+@patch("aiohttp.ClientSession.get")
+async def test_ssl_context_is_shared_across_requests_and_clients(mock_get, mock_post):
+    first = HTTPClient("host1", "u", "p", DummyLogger(), insecure=False)
+    second = HTTPClient("host2", "u", "p", DummyLogger(), insecure=False)
+    set_mock_response(mock_get, 200, "{}")
+    set_mock_response(mock_post, 200, "{}")
+    await first.get_raw("https://host1")
+    await first.post_request("https://host1", {}, {})
+    await second.get_raw("https://host2")
+
+    contexts = {id(kwargs["ssl"]) for _, kwargs in mock_get.call_args_list + mock_post.call_args_list}
+    assert contexts == {id(first.ssl_context)}
+    assert first.ssl_context is second.ssl_context
+
+
+def test_ssl_context_invalid_ca_bundle_raises():
+    with pytest.raises(BadfishException, match="Couldn't load CA bundle"):
+        HTTPClient("host", "u", "p", DummyLogger(), ca_bundle="/non/existent/ca.pem")
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_session_is_pooled_across_requests(mock_get):
+    logger = DummyLogger()
+    client = HTTPClient("host", "u", "p", logger, insecure=False)
+    set_mock_response(mock_get, 200, "{}")
+    await client.get_raw("https://x1")
+    session = client._session
+    await client.get_raw("https://x2")
+    assert session is not None
+    assert client._session is session
+    await client.close()
+    assert client._session is None
+    assert session.closed
+
+
+@pytest.mark.asyncio
+async def test_delete_session_closes_pooled_session():
+    logger = DummyLogger()
+    client = HTTPClient("host", "u", "p", logger, insecure=False)
+    session = client._get_session()
+    client.session_id = "/redfish/v1/SessionService/Sessions/1"
+    client.delete_request = AsyncMock(return_value=Response(200))
+    await client.delete_session()
+    assert session.closed
+    assert client._session is None
+
+
+@pytest.mark.asyncio
+async def test_create_connector_limits():
+    connector = create_connector(limit=20, limit_per_host=2)
+    try:
+        assert connector.limit == 20
+        assert connector.limit_per_host == 2
+        assert connector.use_dns_cache
+    finally:
+        await connector.close()
+
+
+@pytest.mark.asyncio
+async def test_limiter_capped_by_connection_pool():
+    assert HTTPClient("host", "u", "p", DummyLogger()).limiter.maximum == CONNECTION_LIMIT_PER_HOST
+    for limit, limit_per_host, maximum in ((20, 4, 4), (3, 0, 3), (0, 0, CONNECTION_LIMIT_PER_HOST)):
+        connector = create_connector(limit=limit, limit_per_host=limit_per_host)
+        try:
+            assert HTTPClient("host", "u", "p", DummyLogger(), connector=connector).limiter.maximum == maximum
+        finally:
+            await connector.close()
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_shared_connector_is_not_closed_by_client(mock_get):
+    connector = create_connector(limit=10, limit_per_host=2)
+    first = HTTPClient("host1", "u", "p", DummyLogger(), connector=connector)
+    second = HTTPClient("host2", "u", "p", DummyLogger(), connector=connector)
+    set_mock_response(mock_get, 200, "{}")
+    await first.get_raw("https://host1")
+    await second.get_raw("https://host2")
+    assert first._session.connector is connector
+    assert second._session.connector is connector
+    await first.close()
+    assert not connector.closed
+    await second.close()
+    assert not connector.closed
+    await connector.close()
+
+
+@pytest.mark.asyncio
+@patch("asyncio.sleep", new_callable=AsyncMock)
+@patch("aiohttp.ClientSession.get")
+async def test_get_raw_retries_transient_errors(mock_get, mock_sleep):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    set_mock_response(mock_get, 200, "{}")
+    ok = mock_get.return_value
+    mock_get.side_effect = [aiohttp.ServerDisconnectedError(), ok]
+    resp = await client.get_raw("https://x")
+    assert resp.status == 200
+    assert mock_get.call_count == 2
+    assert mock_sleep.await_count == 1
+
+
+@pytest.mark.asyncio
+@patch("asyncio.sleep", new_callable=AsyncMock)
+@patch("aiohttp.ClientSession.get")
+async def test_get_raw_honors_retry_after(mock_get, mock_sleep):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    set_mock_response(mock_get, [503, 200, 200], ["busy", "{}"], headers={"Retry-After": "4"})
+    resp = await client.get_raw("https://x")
+    assert resp.status == 200
+    assert mock_get.call_count == 2
+    mock_sleep.assert_awaited_once_with(4.0)
+
+
+@pytest.mark.asyncio
+@patch("asyncio.sleep", new_callable=AsyncMock)
+@patch("aiohttp.ClientSession.post")
+async def test_post_not_resent_after_disconnect(mock_post, mock_sleep):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    mock_post.side_effect = aiohttp.ServerDisconnectedError()
+    with pytest.raises(BadfishException):
+        await client.post_request("https://x", {}, {})
+    assert mock_post.call_count == 1
+    mock_sleep.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_get_raw_revalidates_with_etag(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    fresh = MagicMock(headers={"ETag": 'W/"bios-1"'})
+    type(fresh).status = PropertyMock(return_value=200)
+    fresh.read = AsyncMock(return_value=b"{}")
+    not_modified = MagicMock(headers={})
+    type(not_modified).status = PropertyMock(return_value=304)
+    mock_get.return_value.__aenter__.side_effect = [fresh, not_modified]
+
+    first = await client.get_raw("https://x/Bios")
+    second = await client.get_raw("https://x/Bios")
+
+    assert first.status == 200
+    assert second is first
+    assert "If-None-Match" not in mock_get.call_args_list[0].kwargs["headers"]
+    assert mock_get.call_args_list[1].kwargs["headers"]["If-None-Match"] == 'W/"bios-1"'
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_get_raw_without_etag_is_not_conditional(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    set_mock_response(mock_get, 200, "{}", headers={})
+    await client.get_raw("https://x/Systems")
+    await client.get_raw("https://x/Systems")
+    assert all("If-None-Match" not in call.kwargs["headers"] for call in mock_get.call_args_list)
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_get_request_cached_until_max_age(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    set_mock_response(mock_get, 200, "{}")
+    first = await client.get_request("https://x/Systems/1")
+    assert await client.get_request("https://x/Systems/1") is first
+    assert mock_get.call_count == 1
+    await client.get_request("https://x/Systems/1", max_age=0)
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_get_request_does_not_cache_errors(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    set_mock_response(mock_get, [404, 200], ["Not Found", "{}"])
+    assert (await client.get_request("https://x/Systems/1")).status == 404
+    assert (await client.get_request("https://x/Systems/1")).status == 200
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_unmatched_not_modified_is_fetched_again(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    not_modified = MagicMock(headers={})
+    type(not_modified).status = PropertyMock(return_value=304)
+    fresh = MagicMock(headers={})
+    type(fresh).status = PropertyMock(return_value=200)
+    fresh.read = AsyncMock(return_value=b'{"Id": "Bios"}')
+    mock_get.return_value.__aenter__.side_effect = [not_modified, fresh]
+    response = await client.get_request("https://x/Bios")
+    assert response.json() == {"Id": "Bios"}
+    assert mock_get.call_count == 2
+    assert "If-None-Match" not in mock_get.call_args.kwargs["headers"]
+    assert await client.get_request("https://x/Bios") is response
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_remembered_representation_is_revalidated(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.remember("https://x/Memory/DIMM.A1", 'W/"1"', '{"Id": "DIMM.A1"}')
+    set_mock_response(mock_get, 304, "", headers={"ETag": 'W/"1"'})
+    response = await client.get_request("https://x/Memory/DIMM.A1")
+    assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == 'W/"1"'
+    assert response.json() == {"Id": "DIMM.A1"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_requests_share_one_fetch():
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def get_raw(uri, _continue=False, _get_token=False):
+        started.set()
+        await release.wait()
+        return Response(200, {}, b"{}")
+
+    with patch.object(client, "get_raw", side_effect=get_raw) as mock_get_raw:
+        tasks = [asyncio.create_task(client.get_request("https://x/Systems/1")) for _ in range(3)]
+        await started.wait()
+        release.set()
+        responses = await asyncio.gather(*tasks)
+    assert mock_get_raw.call_count == 1
+    assert responses[0] is responses[1] is responses[2]
+    assert client._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_get_requests_share_failure():
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def get_raw(uri, _continue=False, _get_token=False):
+        started.set()
+        await release.wait()
+        raise BadfishException("boom")
+
+    with patch.object(client, "get_raw", side_effect=get_raw) as mock_get_raw:
+        tasks = [asyncio.create_task(client.get_request("https://x/Systems/1")) for _ in range(2)]
+        await started.wait()
+        release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert mock_get_raw.call_count == 1
+    assert all(isinstance(result, BadfishException) for result in results)
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.patch")
+@patch("aiohttp.ClientSession.get")
+async def test_patch_request_invalidates_cached_uri(mock_get, mock_patch):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    set_mock_response(mock_get, 200, ['{"a": 1}', '{"a": 2}'])
+    set_mock_response(mock_patch, 200, "OK")
+    assert await client.get_json("https://x/Bios/Settings") == {"a": 1}
+    await client.patch_request("https://x/Bios/Settings", {"a": 2}, {})
+    assert await client.get_json("https://x/Bios/Settings") == {"a": 2}
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.patch")
+async def test_writes_invalidate_every_variant_of_the_resource(mock_patch):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    set_mock_response(mock_patch, 200, "OK")
+    for uri in (
+        "https://x/Systems/1",
+        "https://x/Systems/1?$select=Boot",
+        "https://x/Systems/1?$expand=.($levels=1)",
+        "https://x/Systems/1/Bios",
+        "https://x/Systems/10",
+    ):
+        client.cache.set(uri, Response(200, {}, b"{}"))
+    client.remember("https://x/Systems/1?$select=Boot", 'W/"1"', "{}")
+    await client.patch_request("https://x/Systems/1", {}, {})
+    assert [key[0] for key in client.cache._entries] == ["https://x/Systems/10"]
+    assert not client._conditional_headers("https://x/Systems/1?$select=Boot")
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_response_cache_is_per_client(mock_get):
+    first = HTTPClient("host1", "u", "p", DummyLogger(), cache_max_entries=8)
+    second = HTTPClient("host2", "u", "p", DummyLogger())
+    set_mock_response(mock_get, 200, "{}")
+    await first.get_request("https://host1/redfish/v1")
+    await first.get_request("https://host1/redfish/v1")
+    assert first.cache is not second.cache
+    assert first.cache.max_entries == 8
+    assert (first.cache.hits, first.cache.misses) == (1, 1)
+    assert len(second.cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_response_record_reads_once_and_memoizes_json():
+    raw = MagicMock(headers={"Location": "/redfish/v1/Jobs/JID_1", "Content-Type": "application/json"})
+    type(raw).status = PropertyMock(return_value=202)
+    raw.read = AsyncMock(return_value=b' {"Id": "JID_1"} \xff')
+    response = await Response.read(raw)
+
+    assert response.status == 202
+    assert dict(response.headers) == {"Location": "/redfish/v1/Jobs/JID_1"}
+    assert response.json() is response.json()
+    assert response.json() == {"Id": "JID_1"}
+    assert response.body == b' {"Id": "JID_1"} \xff'
+    raw.read.assert_awaited_once()
+    with pytest.raises(AttributeError):
+        response.status = 200
+
+
+@pytest.mark.asyncio
+async def test_expand_uri_follows_service_root_features():
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    features = {"ProtocolFeaturesSupported": {"ExpandQuery": {"Levels": True, "NoLinks": True}}}
+    client.get_json = AsyncMock(return_value=features)
+    assert await client.expand_uri("https://x/Memory") == "https://x/Memory?$expand=.($levels=1)"
+    assert await client.expand_uri("https://x/Memory?a=1") == "https://x/Memory?a=1&$expand=.($levels=1)"
+    client.get_json.assert_awaited_once()
+
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.get_json = AsyncMock(return_value={"ProtocolFeaturesSupported": {"ExpandQuery": {"Links": True}}})
+    assert await client.expand_uri("https://x/Memory") == "https://x/Memory"
+
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.get_json = AsyncMock(return_value=None)
+    assert not await client.supports_expand()
+
+
+def test_select_fields_keeps_requested_paths_and_annotations():
+    data = {
+        "@odata.id": "/redfish/v1/Systems/System.Embedded.1/Bios",
+        "Id": "Bios",
+        "Attributes": {"BootMode": "Uefi", "SriovGlobalEnable": "Enabled"},
+    }
+    assert select_fields(data, ["Attributes/BootMode", "Missing/Key"]) == {
+        "@odata.id": "/redfish/v1/Systems/System.Embedded.1/Bios",
+        "Attributes": {"BootMode": "Uefi"},
+    }
+    assert select_fields(data, ["Id"]) == {"@odata.id": "/redfish/v1/Systems/System.Embedded.1/Bios", "Id": "Bios"}
+    assert select_fields("OK", ["Id"]) == "OK"
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_get_json_sends_select_when_supported(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client._features = {"SelectQuery": True}
+    set_mock_response(mock_get, 200, '{"PowerState": "On"}')
+    assert await client.get_json("https://x/Systems/1", fields=["PowerState"]) == {"PowerState": "On"}
+    assert mock_get.call_args.args[0] == "https://x/Systems/1?$select=PowerState"
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_get_json_trims_locally_without_select(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client._features = {}
+    set_mock_response(mock_get, 200, '{"PowerState": "On", "Oem": {"Dell": {}}}')
+    assert await client.get_json("https://x/Systems/1", fields=["PowerState"]) == {"PowerState": "On"}
+    assert mock_get.call_args.args[0] == "https://x/Systems/1"
+    assert await client.get_json("https://x/Systems/1") == {"PowerState": "On", "Oem": {"Dell": {}}}
+    assert mock_get.call_count == 1
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_rejected_token_authenticates_again_once(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.token = "OLD"
+
+    async def reauthenticate():
+        client.token = "NEW"
+        return True
+
+    client.reauthenticate = AsyncMock(side_effect=reauthenticate)
+    set_mock_response(mock_get, [401, 200], ["", "{}"])
+    resp = await client.get_raw("https://x/Systems/1")
+    assert resp.status == 200
+    assert client.reauthenticate.await_count == 1
+    tokens = [kwargs["headers"].get("X-Auth-Token") for _, kwargs in mock_get.call_args_list]
+    assert tokens == ["OLD", "NEW"]
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_rejected_token_is_not_renewed_twice(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.token = "OLD"
+    client.reauthenticate = AsyncMock(return_value=True)
+    set_mock_response(mock_get, 401, "")
+    resp = await client.get_raw("https://x/Systems/1")
+    assert resp.status == 401
+    assert mock_get.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.get")
+async def test_basic_auth_requests_are_not_authenticated_again(mock_get):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.token = "OLD"
+    client.reauthenticate = AsyncMock(return_value=True)
+    set_mock_response(mock_get, 401, "")
+    resp = await client.get_raw("https://x", _get_token=True)
+    assert resp.status == 401
+    client.reauthenticate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_rejections_share_one_renewal():
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.token = "OLD"
+    release = asyncio.Event()
+
+    async def reauthenticate():
+        await release.wait()
+        client.token = "NEW"
+        return True
+
+    client.reauthenticate = AsyncMock(side_effect=reauthenticate)
+    renewals = [asyncio.create_task(client._renew_token("OLD")) for _ in range(3)]
+    release.set()
+    assert await asyncio.gather(*renewals) == [True, True, True]
+    assert client.reauthenticate.await_count == 1
+
+
+SESSIONS_FULL_IDRAC = (
+    '{"error":{"@Message.ExtendedInfo":[{"MessageId":"IDRAC.2.8.RAC0218",'
+    '"Message":"The maximum number of user sessions is reached."}]}}'
+)
+SESSIONS_FULL_REDFISH = '{"error":{"@Message.ExtendedInfo":[{"MessageId":"Base.1.8.SessionLimitExceeded"}]}}'
+
+
+def test_session_limit_reached():
+    assert session_limit_reached(Response(400, {}, SESSIONS_FULL_IDRAC.encode()))
+    assert session_limit_reached(Response(503, {}, SESSIONS_FULL_REDFISH.encode()))
+    assert not session_limit_reached(Response(201, {}, SESSIONS_FULL_REDFISH.encode()))
+    assert not session_limit_reached(Response(400, {}, b'{"error":{"message":"Bad payload"}}'))
+    assert not session_limit_reached(Response(503, {}, b"Service Unavailable"))
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.post")
+async def test_create_session_waits_for_a_free_session(mock_post):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.session_policy.base_delay = 0
+    set_mock_response(mock_post, [400, 503, 201], [SESSIONS_FULL_IDRAC, SESSIONS_FULL_REDFISH, "{}"])
+    resp = await client.create_session("https://host/redfish/v1/Sessions", {}, {})
+    assert resp.status == 201
+    assert mock_post.call_count == 3
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.post")
+async def test_create_session_gives_up_when_sessions_stay_full(mock_post):
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.session_policy.base_delay = 0
+    set_mock_response(mock_post, 400, SESSIONS_FULL_IDRAC)
+    with pytest.raises(BadfishException, match="maximum number of sessions"):
+        await client.create_session("https://host/redfish/v1/Sessions", {}, {})
+    assert mock_post.call_count == client.session_policy.attempts
+
+
+@pytest.mark.asyncio
+@patch("aiohttp.ClientSession.post")
+async def test_create_session_holds_a_session_slot_until_closed(mock_post, tmp_path):
+    slots = SessionSlots(str(tmp_path), 1, wait=0)
+    client = HTTPClient("host", "u", "p", DummyLogger())
+    client.session_slots = slots
+    set_mock_response(mock_post, 201, "{}")
+    await client.create_session("https://host/redfish/v1/Sessions", {}, {})
+    await client.create_session("https://host/redfish/v1/Sessions", {}, {})
+    assert slots.try_acquire("host") is None
+    await client.close()
+    slot = slots.try_acquire("host")
+    assert slot is not None
+    slots.release(slot)
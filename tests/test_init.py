@@ -0,0 +1,73 @@
+import asyncio
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from badfish.helpers.exceptions import BadfishException
+from tests.test_base import MockResponse, TestBase
+
+
+class TestInit(TestBase):
+    async def test_init_walks_systems_and_managers_concurrently(self):
+        bf = self.badfish()
+        bf.find_session_uri = AsyncMock(return_value="/redfish/v1/Sessions")
+        bf.open_session = AsyncMock(return_value="TKN")
+        root = {"Systems": {"@odata.id": "/redfish/v1/Systems"}, "Managers": {"@odata.id": "/redfish/v1/Managers"}}
+        members = {
+            "/redfish/v1/Systems": {"Members": [{"@odata.id": "/redfish/v1/Systems/System.Embedded.1"}]},
+            "/redfish/v1/Managers": {"Members": [{"@odata.id": "/redfish/v1/Managers/iDRAC.Embedded.1"}]},
+        }
+        requested = []
+        both_requested = asyncio.Event()
+
+        async def get_request(uri, *args, **kwargs):
+            requested.append(uri)
+            if uri == bf.root_uri:
+                return MockResponse(json.dumps(root), 200)
+            if len(requested) == 3:
+                both_requested.set()
+            # Neither collection answers before the other one was asked for
+            await asyncio.wait_for(both_requested.wait(), timeout=5)
+            return MockResponse(json.dumps(members[uri[len(bf.host_uri) :]]), 200)
+
+        bf.http_client.get_request = get_request
+        await bf.init()
+
+        assert requested.count(bf.root_uri) == 1
+        assert bf.system_resource == "/redfish/v1/Systems/System.Embedded.1"
+        assert bf.bios_uri == "/Systems/System.Embedded.1/Bios/Settings"
+        assert bf.manager_resource == "/redfish/v1/Managers/iDRAC.Embedded.1"
+        assert bf.vendor == "Supermicro"
+
+    async def test_init_keeps_going_without_systems_but_not_without_managers(self):
+        bf = self.badfish()
+        bf.find_session_uri = AsyncMock(return_value="/redfish/v1/Sessions")
+        bf.open_session = AsyncMock(return_value="TKN")
+        bf.find_systems_resource = AsyncMock(side_effect=BadfishException("Systems resource not found"))
+        bf.find_managers_resource = AsyncMock(return_value="/redfish/v1/Managers/iDRAC.Embedded.1")
+        await bf.init()
+        assert bf.system_resource is None
+        bf.logger.warning.assert_called_once()
+
+        bf.manager_resource = None
+        bf.find_managers_resource = AsyncMock(side_effect=BadfishException("Managers resource not found"))
+        with pytest.raises(BadfishException, match="Managers resource not found"):
+            await bf.init()
+
+    async def test_operations_discover_the_resources_they_need_once(self):
+        bf = self.badfish()
+        bf.find_session_uri = AsyncMock(return_value="/redfish/v1/Sessions")
+        bf.open_session = AsyncMock(return_value="TKN")
+        bf.find_systems_resource = AsyncMock(return_value="/redfish/v1/Systems/System.Embedded.1")
+        bf.find_managers_resource = AsyncMock(return_value="/redfish/v1/Managers/iDRAC.Embedded.1")
+        await bf.init(("system",))
+        assert bf.bios_uri == "/Systems/System.Embedded.1/Bios/Settings"
+        bf.find_managers_resource.assert_not_awaited()
+
+        bf.get_request = AsyncMock(return_value=None)
+        await asyncio.gather(bf.get_reset_types(manager=True), bf.get_reset_types(manager=True))
+        await bf.get_reset_types()
+        bf.find_systems_resource.assert_awaited_once()
+        bf.find_managers_resource.assert_awaited_once()
+        assert bf.get_request.call_args_list[0].args == (bf.host_uri + bf.manager_resource,)
@@ -0,0 +1,143 @@
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.store import InventoryStore
+from tests.config import INIT_RESP, MOCK_HOST
+from tests.test_base import TestBase
+
+PROCESSOR_SUMMARY = {"Count": 2, "Model": "Intel(R) Xeon(R) Gold 6130 CPU @ 2.10GHz"}
+PROCESSOR_DETAILS = {"CPU.Socket.1": {"Name": "CPU 1", "TotalCores": 16}}
+MEMORY_SUMMARY = {"TotalSystemMemoryGiB": 384}
+MEMORY_DETAILS = {"DIMM A1": {"CapacityMiB": 32768}}
+GPU_RESPONSES = [{"Id": "Video.Slot.1-1", "Model": "A100", "Manufacturer": "NVIDIA"}]
+INTERFACES = {"NIC.Integrated.1-1": {"Id": "NIC.Integrated.1-1", "LinkStatus": "Up"}}
+FIRMWARE = [{"Id": "Installed-0-16.25.40.62", "Name": "Mellanox ConnectX-5", "Version": "16.25.40.62"}]
+
+
+def patch_sections(test):
+    sections = {
+        "get_serial_summary": {"ServiceTag": "ABC1234"},
+        "get_processor_summary": PROCESSOR_SUMMARY,
+        "get_processor_details": PROCESSOR_DETAILS,
+        "get_memory_summary": MEMORY_SUMMARY,
+        "get_memory_details": MEMORY_DETAILS,
+        "get_gpu_data": {"Members": []},
+        "get_gpu_responses": GPU_RESPONSES,
+        "get_interfaces": INTERFACES,
+        "get_firmware_devices": FIRMWARE,
+    }
+    for method, value in reversed(sections.items()):
+        test = patch(f"badfish.main.Badfish.{method}", return_value=value)(test)
+    return test
+
+
+class TestInventory(TestBase):
+    args = ["--inventory", "--output", "json"]
+
+    def call(self, mock_get, mock_post, mock_delete):
+        self.set_mock_response(mock_get, 200, INIT_RESP)
+        self.set_mock_response(mock_post, 200, "OK")
+        self.set_mock_response(mock_delete, 200, "OK")
+        return self.badfish_call()
+
+    @patch_sections
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_inventory_document(self, mock_get, mock_post, mock_delete, *_):
+        _, err = self.call(mock_get, mock_post, mock_delete)
+        assert json.loads(err) == {
+            "Serial": "ABC1234",
+            "Processors": {"Summary": PROCESSOR_SUMMARY, "Details": PROCESSOR_DETAILS},
+            "Memory": {"Summary": MEMORY_SUMMARY, "Details": MEMORY_DETAILS},
+            "GPU": {
+                "Summary": {"A100": 1},
+                "Details": {"Video.Slot.1-1": {"Model": "A100", "Manufacturer": "NVIDIA"}},
+            },
+            "Interfaces": INTERFACES,
+            "Firmware": {"Installed-0-16.25.40.62": FIRMWARE[0]},
+        }
+
+    @patch_sections
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_inventory_skips_unsupported_sections(self, mock_get, mock_post, mock_delete, *_):
+        unsupported = BadfishException("GPU endpoint not available on host.")
+        with patch("badfish.main.Badfish.get_gpu_data", side_effect=unsupported), patch(
+            "badfish.main.Badfish.get_interfaces", return_value=None
+        ):
+            _, err = self.call(mock_get, mock_post, mock_delete)
+        assert list(json.loads(err)) == ["Serial", "Processors", "Memory", "Firmware"]
+
+    @patch_sections
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_inventory_normal_output(self, mock_get, mock_post, mock_delete, *_):
+        self.args = ["--inventory"]
+        _, err = self.call(mock_get, mock_post, mock_delete)
+        assert "- INFO     - Serial: ABC1234\n" in err
+        assert "- INFO     -     TotalSystemMemoryGiB: 384\n" in err
+
+
+class TestInventoryStore(TestBase):
+    @pytest.fixture(autouse=True)
+    def inventory_db(self, tmp_path):
+        self.db = str(tmp_path / "inventory.db")
+
+    def call(self, mock_get, mock_post, mock_delete):
+        self.set_mock_response(mock_get, 200, INIT_RESP)
+        self.set_mock_response(mock_post, 200, "OK")
+        self.set_mock_response(mock_delete, 200, "OK")
+        return self.badfish_call()
+
+    @patch_sections
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_inventory_is_stored(self, mock_get, mock_post, mock_delete, *_):
+        self.args = ["--inventory", "--inventory-db", self.db]
+        self.call(mock_get, mock_post, mock_delete)
+        with InventoryStore(self.db) as store:
+            _, document = store.latest(MOCK_HOST)
+        assert document["Serial"] == "ABC1234"
+        assert document["Memory"]["Summary"] == MEMORY_SUMMARY
+
+    def test_query_answers_from_store(self):
+        with InventoryStore(self.db) as store:
+            store.save("host-a", {"Firmware": {"BIOS": {"Version": "2.18.1"}}})
+            store.save("host-b", {"Firmware": {"BIOS": {"Version": "2.19.1"}}})
+        self.args = ["--inventory-db", self.db, "--query", "Firmware/BIOS/Version<2.19", "--output", "json"]
+        _, err = self.badfish_call(mock_host=None)
+        assert json.loads(err) == {"host-a": {"Firmware/BIOS/Version": "2.18.1"}}
+
+    def test_count_by_answers_from_store(self):
+        with InventoryStore(self.db) as store:
+            store.save("host-a", {"Serial": "A", "Memory": {"Summary": {"TotalSystemMemoryGiB": 384}}})
+            store.save("host-b", {"Serial": "B", "Memory": {"Summary": {"TotalSystemMemoryGiB": 384}}})
+        self.args = ["--inventory-db", self.db, "--count-by", "Memory/Summary/TotalSystemMemoryGiB"]
+        _, err = self.badfish_call(mock_host=None)
+        assert err == "- INFO     - '384': 2\n"
+
+    def test_query_requires_inventory_db(self):
+        self.args = ["--query"]
+        _, err = self.badfish_call(mock_host=None)
+        assert err == "- ERROR    - Querying the inventory requires --inventory-db.\n"
+
+    @patch("badfish.main.Badfish.get_inventory", return_value={"Serial": "FRESH01"})
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_query_max_age_refreshes_stale_hosts(self, mock_get, mock_post, mock_delete, mock_get_inventory):
+        with InventoryStore(self.db) as store:
+            store.save(MOCK_HOST, {"Serial": "OLD0001"}, collected=time.time() - 3600)
+            store.save("fresh-host", {"Serial": "FRESH02"})
+        self.args = ["--inventory-db", self.db, "--query", "Serial~FRESH", "--max-age", "600", "--output", "json"]
+        _, err = self.call(mock_get, mock_post, mock_delete)
+        assert mock_get_inventory.call_count == 1
+        assert json.loads(err) == {MOCK_HOST: {"Serial": "FRESH01"}}
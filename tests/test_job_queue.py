@@ -3,7 +3,7 @@ from unittest.mock import patch
 from badfish.helpers.exceptions import BadfishException
 from tests.config import (
     BLANK_RESP,
-    INIT_RESP,
+    INIT_RESP_MANAGER,
     JOB_ID,
     JOB_OK_RESP,
     RESPONSE_CHECK_JOB,
@@ -17,6 +17,7 @@ from tests.config import (
     RESPONSE_DELETE_JOBS_UNSUPPORTED_EXCEPTION,
     RESPONSE_LS_JOBS,
     RESPONSE_LS_JOBS_EMPTY,
+    SESSION_HEADERS,
     TASK_OK_RESP,
 )
 from tests.test_base import TestBase
@@ -34,7 +35,7 @@ class TestJobQueue(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_ls_jobs(self, mock_get, mock_post, mock_delete):
         responses_add = [JOB_OK_RESP]
-        responses = INIT_RESP + responses_add
+        responses = INIT_RESP_MANAGER + responses_add
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -46,7 +47,7 @@ class TestJobQueue(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_ls_jobs_empty(self, mock_get, mock_post, mock_delete):
         responses_add = [BLANK_RESP]
-        responses = INIT_RESP + responses_add
+        responses = INIT_RESP_MANAGER + responses_add
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -65,7 +66,7 @@ class TestClearJobs(TestBase):
             JOB_OK_RESP,
             BLANK_RESP,
         ]
-        responses = INIT_RESP + responses_add
+        responses = INIT_RESP_MANAGER + responses_add
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -80,8 +81,8 @@ class TestClearJobs(TestBase):
             JOB_OK_RESP,
             BLANK_RESP,
         ]
-        responses = INIT_RESP + responses_add
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 400, 200], responses)
+        responses = INIT_RESP_MANAGER + responses_add
+        self.set_mock_response(mock_get, [200] * 12 + [400, 200], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
@@ -96,14 +97,10 @@ class TestClearJobs(TestBase):
             BLANK_RESP,
             BLANK_RESP,
         ]
-        responses = INIT_RESP + responses_add
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 400, 400, 400], responses)
-        self.set_mock_response(mock_post, 200, "OK")
-        self.set_mock_response(
-            mock_delete,
-            [400, 400, 200, 200],
-            ["Bad Request", "Bad Request", "OK", "OK"],
-        )
+        responses = INIT_RESP_MANAGER + responses_add
+        self.set_mock_response(mock_get, 200, responses)
+        self.set_mock_response(mock_post, 200, "OK", headers=SESSION_HEADERS)
+        self.set_mock_response(mock_delete, 500, "Internal Server Error")
         _, err = self.badfish_call()
         assert err == RESPONSE_CLEAR_JOBS_LIST
 
@@ -116,7 +113,7 @@ class TestClearJobs(TestBase):
             JOB_OK_RESP,
             BLANK_RESP,
         ]
-        responses = INIT_RESP + responses_add
+        responses = INIT_RESP_MANAGER + responses_add
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -132,10 +129,9 @@ class TestClearJobs(TestBase):
             JOB_OK_RESP,
             BLANK_RESP,
         ]
-        responses = INIT_RESP + responses_add
-        status_codes = [200, 200, 200, 200, 200, 400, 200]
-        self.set_mock_response(mock_get, status_codes, responses)
-        self.set_mock_response(mock_post, 200, "OK")
+        responses = INIT_RESP_MANAGER + responses_add
+        self.set_mock_response(mock_get, 200, responses)
+        self.set_mock_response(mock_post, 200, "OK", headers=SESSION_HEADERS)
         self.set_mock_response(mock_delete, 400, "Bad Request")
         _, err = self.badfish_call()
         assert err == RESPONSE_CLEAR_JOBS_LIST_EXCEPTION
@@ -148,10 +144,10 @@ class TestDeleteJob(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_delete_unsupported_exception(self, mock_get, mock_post):
-        responses_add = [JOB_OK_RESP]
-        responses = INIT_RESP + responses_add
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 400, 200], responses)
-        self.set_mock_response(mock_post, 200, "OK")
+        responses_add = [JOB_OK_RESP, BLANK_RESP]
+        responses = INIT_RESP_MANAGER + responses_add
+        self.set_mock_response(mock_get, 200, responses)
+        self.set_mock_response(mock_post, 200, "OK", headers=SESSION_HEADERS)
         _, err = self.badfish_call()
         assert err == RESPONSE_DELETE_JOBS_UNSUPPORTED_EXCEPTION
 
@@ -159,10 +155,10 @@ class TestDeleteJob(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_delete_supported_exception(self, mock_get, mock_post, mock_delete):
-        responses_add = [JOB_OK_RESP]
-        responses = INIT_RESP + responses_add
+        responses_add = [JOB_OK_RESP, BLANK_RESP]
+        responses = INIT_RESP_MANAGER + responses_add
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], ["Bad Request", "OK"], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
         assert err == RESPONSE_DELETE_JOBS_SUPPORTED_EXCEPTION
@@ -178,7 +174,7 @@ class TestCheckJob(TestBase):
         responses_add = [
             TASK_OK_RESP,
         ]
-        responses = INIT_RESP + responses_add
+        responses = INIT_RESP_MANAGER + responses_add
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -193,8 +189,8 @@ class TestCheckJob(TestBase):
         responses_add = [
             BLANK_RESP,
         ]
-        responses = INIT_RESP + responses_add
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 404], responses)
+        responses = INIT_RESP_MANAGER + responses_add
+        self.set_mock_response(mock_get, [200] * 11 + [404], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = self.args + ["JID_WHICHDOESNOTEXIST"]
@@ -209,7 +205,7 @@ class TestCheckJob(TestBase):
         # The check_schedule_job_status method only makes one call to get_request
         # which should return None to simulate the error condition
         mock_get_req_call.side_effect = [None]
-        self.set_mock_response(mock_get, 200, INIT_RESP)
+        self.set_mock_response(mock_get, 200, INIT_RESP_MANAGER)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = self.args + [JOB_ID]
@@ -0,0 +1,90 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from badfish.helpers.limiter import AdaptiveLimiter
+
+
+class DummyLogger:
+    def __init__(self):
+        self.debug_msgs = []
+
+    def debug(self, msg):
+        self.debug_msgs.append(str(msg))
+
+
+def test_limit_grows_while_latency_is_stable():
+    limiter = AdaptiveLimiter("bmc", DummyLogger(), initial=2, maximum=4)
+    for _ in range(20):
+        limiter._update(0.1, False)
+    assert limiter.limit == 4
+
+
+def test_latency_spike_halves_limit():
+    logger = DummyLogger()
+    limiter = AdaptiveLimiter("bmc", logger, initial=8)
+    limiter._update(0.1, False)
+    limiter._update(1.0, False)
+    assert limiter.limit == 4
+    assert "bmc: concurrency limit 8 -> 4 (latency spike" in logger.debug_msgs[-1]
+
+
+def test_decrease_happens_once_per_round_trip():
+    limiter = AdaptiveLimiter("bmc", DummyLogger(), initial=8)
+    limiter._update(10.0, False)
+    limiter._update(10.0, True)
+    limiter._update(10.0, True)
+    assert limiter.limit == 4
+
+
+def test_limit_never_drops_below_minimum():
+    limiter = AdaptiveLimiter("bmc", DummyLogger(), initial=2, minimum=1)
+    for _ in range(5):
+        limiter._last_decrease = float("-inf")
+        limiter._update(0.1, True)
+    assert limiter.limit == 1
+
+
+@pytest.mark.asyncio
+async def test_throttling_status_shrinks_limit():
+    logger = DummyLogger()
+    limiter = AdaptiveLimiter("bmc", logger, initial=8)
+    async with limiter.request() as sample:
+        sample.record(503)
+    assert limiter.limit == 4
+    assert logger.debug_msgs == ["bmc: concurrency limit 8 -> 4 (BMC overloaded)"]
+
+
+@pytest.mark.asyncio
+async def test_connection_error_shrinks_limit_and_propagates():
+    limiter = AdaptiveLimiter("bmc", DummyLogger(), initial=8)
+    with pytest.raises(aiohttp.ClientConnectionError):
+        async with limiter.request():
+            raise aiohttp.ClientConnectionError()
+    assert limiter.limit == 4
+    assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_in_flight_requests_bounded_by_limit():
+    limiter = AdaptiveLimiter("bmc", DummyLogger(), initial=2, maximum=2)
+    release = asyncio.Event()
+    full = asyncio.Event()
+    peak = 0
+
+    async def worker():
+        nonlocal peak
+        async with limiter.request():
+            peak = max(peak, limiter.in_flight)
+            if limiter.in_flight == limiter.limit:
+                full.set()
+            await release.wait()
+
+    tasks = [asyncio.create_task(worker()) for _ in range(6)]
+    await full.wait()
+    assert limiter.in_flight == 2
+    release.set()
+    await asyncio.gather(*tasks)
+    assert peak == 2
+    assert limiter.in_flight == 0
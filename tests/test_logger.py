@@ -1,3 +1,5 @@
+import io
+import json
 import os
 import tempfile
 from logging import INFO, ERROR, DEBUG, LogRecord
@@ -110,35 +112,6 @@ class TestBadfishHandler:
             handler.parse()
         assert handler.output_dict == {"unsupported_command": True}
 
-    def test_diff_returns_error_if_error_flag_set(self):
-        handler = BadfishHandler(format_flag=True)
-        handler.output_dict = {"error": True, "error_msg": "oops"}
-        assert handler.diff() == "ERROR - oops"
-
-    def test_diff_formats_version_differences(self):
-        handler = BadfishHandler(format_flag=True)
-        handler.output_dict = {
-            "hostA": {
-                "pkg1": {"SoftwareId": 1, "Version": "1.0", "Name": "Pkg One"},
-                "pkg2": {"SoftwareId": 2, "Version": "2.0", "Name": "Pkg Two"},
-            },
-            "hostB": {
-                "pkgA": {"SoftwareId": 1, "Version": "1.1", "Name": "Pkg One"},
-                "pkgB": {"SoftwareId": 2, "Version": "2.0", "Name": "Pkg Two"},
-            },
-        }
-        out = handler.diff()
-        assert "hostA:" in out and "hostB:" in out
-        assert "Pkg One" in out and "1.0" in out and "1.1" in out
-
-    def test_diff_returns_empty_when_no_differences(self):
-        handler = BadfishHandler(format_flag=True)
-        handler.output_dict = {
-            "h1": {"a": {"SoftwareId": 1, "Version": "1", "Name": "A"}},
-            "h2": {"b": {"SoftwareId": 1, "Version": "1", "Name": "A"}},
-        }
-        assert handler.diff() == "{}"
-
     def test_output_json_and_yaml(self):
         handler = BadfishHandler(format_flag=True)
         handler.output_dict = {"a": 1, "b": "x"}
@@ -190,6 +163,63 @@ class TestBadfishHandler:
         assert handler.formatted_msg == []
 
 
+class TestStreamingHandler:
+    def _record(self, name, msg, level=INFO, **extra):
+        record = LogRecord(name=name, level=level, pathname=__file__, lineno=1, msg=msg, args=(), exc_info=None)
+        record.__dict__.update(extra)
+        return record
+
+    def _handler(self, stream_format):
+        handler = BadfishHandler(format_flag=stream_format != "normal", stream_format=stream_format)
+        handler.setFormatter(BadfishFormatter("[%(name)s] - %(levelname)-8s - %(message)s", use_color=False))
+        handler.stream = io.StringIO()
+        return handler
+
+    def _complete(self, name, host, result=True):
+        return self._record(name, "*" * 48, host_complete=host, host_result=result)
+
+    def test_normal_writes_host_block_on_completion(self):
+        handler = self._handler("normal")
+        handler.emit(self._record("hostA", "a1"))
+        handler.emit(self._record("hostB", "b1"))
+        handler.emit(self._record("hostA", "a2"))
+        assert handler.stream.getvalue() == ""
+        handler.emit(self._complete("hostA", "hostA.example.com"))
+        assert handler.stream.getvalue() == (
+            "[hostA] - INFO     - a1\n[hostA] - INFO     - a2\n[hostA] - INFO     - " + "*" * 48 + "\n"
+        )
+        assert list(handler.blocks) == ["hostB"]
+        handler.emit(self._record("badfish.helpers.logger", "RESULTS:"))
+        assert handler.output("normal", {}) == "[hostB] - INFO     - b1\n[badfish.helpers.logger] - INFO     - RESULTS:"
+        assert handler.formatted_msg == []
+
+    def test_json_writes_one_line_per_host(self):
+        handler = self._handler("json")
+        handler.emit(self._record("hostA", "Power state:"))
+        handler.emit(self._record("hostA", "    hostA.example.com: 'On'"))
+        handler.emit(self._record("hostB", "Failed to communicate", level=ERROR))
+        handler.emit(self._complete("hostA", "hostA.example.com"))
+        handler.emit(self._complete("hostB", "hostB.example.com", result=False))
+        lines = handler.stream.getvalue().splitlines()
+        assert [json.loads(line) for line in lines] == [
+            {"hostA.example.com": {"Power state": {"hostA.example.com": "On"}}},
+            {"hostB.example.com": {"error": True, "error_msg": "Failed to communicate"}},
+        ]
+        assert handler.messages == {} and handler.errors == {}
+        assert handler.output("json") == ""
+
+    def test_yaml_writes_one_document_per_host(self):
+        handler = self._handler("yaml")
+        handler.emit(self._record("hostA", "Serial: ABC"))
+        handler.emit(self._complete("hostA", "hostA.example.com"))
+        assert list(yaml.safe_load_all(handler.stream.getvalue())) == [{"hostA.example.com": {"Serial": "ABC"}}]
+
+    def test_error_outside_hosts_is_left_for_output(self):
+        handler = self._handler("json")
+        handler.emit(self._record("badfish.helpers.logger", "There was something wrong", level=ERROR))
+        assert json.loads(handler.output("json")) == {"error": True, "error_msg": "There was something wrong"}
+
+
 class TestBadfishLogger:
     def test_logger_levels_and_multi_host_formatting(self):
         logger = BadfishLogger(verbose=False, multi_host=True)
@@ -11,6 +11,7 @@ from tests.config import (
     RESPONSE_LS_GPU,
     RESPONSE_LS_GPU_SUMMARY_DATA_ERROR,
     RESPONSE_LS_GPU_SUMMARY_VALUE_ERROR,
+    SESSION_HEADERS,
 )
 from tests.test_base import TestBase
 
@@ -53,8 +54,8 @@ class TestLsGpu(TestBase):
             GPU_SUMMARY_RESP_FAULTY,
         ]
         responses = INIT_RESP + responses_add
-        self.set_mock_response(mock_post, 200, "OK")
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 404], responses)
+        self.set_mock_response(mock_post, 200, "OK", headers=SESSION_HEADERS)
+        self.set_mock_response(mock_get, [200] * 11 + [404], responses)
         self.args = [self.option_arg]
         _, err = self.badfish_call()
         assert err == RESPONSE_LS_GPU_SUMMARY_DATA_ERROR
@@ -68,8 +69,8 @@ class TestLsGpu(TestBase):
             GPU_DATA_RESP_FAULTY,
         ]
         responses = INIT_RESP + responses_add
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 404, 200, 200], responses)
-        self.set_mock_response(mock_post, 200, "OK")
+        self.set_mock_response(mock_get, [200] * 13 + [404, 200, 200], responses)
+        self.set_mock_response(mock_post, 200, "OK", headers=SESSION_HEADERS)
         self.args = [self.option_arg]
         _, err = self.badfish_call()
         assert (
@@ -28,10 +28,10 @@ class TestLsInterfaces(TestBase):
             NETWORK_ADAPTERS_RESP,
             NETWORK_PORTS_ROOT_RESP % (DEVICE_NIC_I, DEVICE_NIC_I),
             NETWORK_DEV_FUNC_RESP % (DEVICE_NIC_I, DEVICE_NIC_I),
-            NETWORK_PORTS_RESP % DEVICE_NIC_I,
-            NETWORK_DEV_FUNC_DET_RESP,
             NETWORK_PORTS_ROOT_RESP % (DEVICE_NIC_S, DEVICE_NIC_S),
             NETWORK_DEV_FUNC_RESP % (DEVICE_NIC_S, DEVICE_NIC_S),
+            NETWORK_PORTS_RESP % DEVICE_NIC_I,
+            NETWORK_DEV_FUNC_DET_RESP,
             NETWORK_PORTS_RESP % DEVICE_NIC_S,
             NETWORK_DEV_FUNC_DET_RESP,
         ]
@@ -52,10 +52,10 @@ class TestLsInterfaces(TestBase):
             NETWORK_ADAPTERS_RESP,
             NETWORK_PORTS_ROOT_RESP % (DEVICE_NIC_I, DEVICE_NIC_I),
             NETWORK_DEV_FUNC_RESP % (DEVICE_NIC_I, DEVICE_NIC_I),
-            NETWORK_PORTS_RESP % DEVICE_NIC_I,
-            NETWORK_DEV_FUNC_DET_RESP,
             NETWORK_PORTS_ROOT_RESP % (DEVICE_NIC_S, DEVICE_NIC_S),
             NETWORK_DEV_FUNC_RESP % (DEVICE_NIC_S, DEVICE_NIC_S),
+            NETWORK_PORTS_RESP % DEVICE_NIC_I,
+            NETWORK_DEV_FUNC_DET_RESP,
             NETWORK_PORTS_RESP % DEVICE_NIC_S,
             NETWORK_DEV_FUNC_DET_RESP,
         ]
@@ -166,7 +166,7 @@ class TestLsInterfaces(TestBase):
             "",
         ]
         responses = INIT_RESP + responses_add
-        status_codes = [200, 200, 200, 200, 200, 404, 200, 200]
+        status_codes = [200] * 11 + [404, 200, 200]
         self.set_mock_response(mock_get, status_codes, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
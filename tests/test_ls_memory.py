@@ -1,7 +1,9 @@
+import json
 from unittest.mock import PropertyMock, patch
 
 from tests.config import (
     INIT_RESP,
+    INIT_RESP_EXPAND,
     MEMORY_A5_RESP,
     MEMORY_B2_RESP,
     MEMORY_MEMBERS_RESP,
@@ -37,6 +39,22 @@ class TestLsMemory(TestBase):
         _, err = self.badfish_call()
         assert err == RESPONSE_LS_MEMORY
 
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_ls_memory_expanded(self, mock_get, mock_post, mock_delete):
+        members = json.loads(MEMORY_MEMBERS_RESP)
+        members["Members"] = [json.loads(MEMORY_A5_RESP), json.loads(MEMORY_B2_RESP)]
+        responses = INIT_RESP_EXPAND + [MEMORY_SUMMARY_RESP, json.dumps(members)]
+        self.set_mock_response(mock_get, 200, responses)
+        self.set_mock_response(mock_post, 200, "OK")
+        self.set_mock_response(mock_delete, 200, "OK")
+        self.args = [self.option_arg]
+        _, err = self.badfish_call()
+        assert err == RESPONSE_LS_MEMORY
+        assert mock_get.call_count == len(responses)
+        assert mock_get.call_args_list[-1].args[0].endswith("/Memory?$expand=.($levels=1)")
+
     @patch("rich.console.Console.is_terminal", new_callable=PropertyMock, return_value=True)
     @patch("aiohttp.ClientSession.delete")
     @patch("aiohttp.ClientSession.post")
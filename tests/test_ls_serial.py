@@ -1,18 +1,30 @@
+import json
 from unittest.mock import patch
 
 from tests.config import (
     DELL_REDFISH_ROOT_OEM_RESP,
     EMPTY_OEM_RESP,
     INIT_RESP,
+    MAN_RESP,
+    ROOT_RESP,
     RESPONSE_LS_SERIAL_NUMBER,
     RESPONSE_LS_SERIAL_SERVICE_TAG,
     RESPONSE_LS_SERIAL_SOMETHING_WRONG,
     RESPONSE_LS_SERIAL_UNSUPPORTED,
+    SYS_RESP,
     SYSTEM_SERIAL_NUMBER_RESP,
 )
 from tests.test_base import TestBase
 
 
+def init_resp_with_oem(oem_resp):
+    # The service root is cached during init, so the Oem section the serial
+    # summary reads has to come with the root response itself.
+    root = json.loads(ROOT_RESP)
+    root["Oem"] = json.loads(oem_resp)["Oem"]
+    return [ROOT_RESP, ROOT_RESP, json.dumps(root), SYS_RESP, MAN_RESP]
+
+
 class TestLsSerial(TestBase):
     args = ["--ls-serial"]
 
@@ -20,7 +32,7 @@ class TestLsSerial(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_ls_serial_service_tag(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [DELL_REDFISH_ROOT_OEM_RESP]
+        responses = init_resp_with_oem(DELL_REDFISH_ROOT_OEM_RESP)
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -31,7 +43,7 @@ class TestLsSerial(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_ls_serial_serial_number(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [EMPTY_OEM_RESP, SYSTEM_SERIAL_NUMBER_RESP]
+        responses = init_resp_with_oem(EMPTY_OEM_RESP) + [SYSTEM_SERIAL_NUMBER_RESP]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -74,7 +86,7 @@ class TestLsSerial(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_ls_serial_no_number(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [EMPTY_OEM_RESP, "{}"]
+        responses = init_resp_with_oem(EMPTY_OEM_RESP) + ["{}"]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -85,7 +97,7 @@ class TestLsSerial(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_ls_serial_something_wrong(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [""]
+        responses = init_resp_with_oem('{"Oem": null}')
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -8,6 +8,7 @@ import json
 # Using 'src.badfish' here would cause isinstance checks to fail.
 from badfish.main import execute_badfish, Badfish
 from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.http_client import Response
 
 
 @pytest.fixture
@@ -40,9 +41,7 @@ async def test_init_401_unauthorized(mock_args):
     logger = MagicMock(spec=logging.Logger)
 
     # Mock response for HTTPClient.get_request
-    mock_response = MagicMock()
-    mock_response.status = 401
-    mock_response.text = AsyncMock(return_value='{"error": "Unauthorized"}')
+    mock_response = Response(401, {}, b'{"error": "Unauthorized"}')
 
     # Patch 'badfish' (not src.badfish) to match the import above
     with patch("badfish.main.HTTPClient.get_request", new_callable=AsyncMock) as mock_get:
@@ -68,10 +67,8 @@ async def test_init_key_error_missing_version(mock_args):
     logger = MagicMock(spec=logging.Logger)
 
     # Mock response for HTTPClient.get_request (Success 200 but bad payload)
-    mock_response = MagicMock()
-    mock_response.status = 200
     # Payload missing "RedfishVersion"
-    mock_response.text = AsyncMock(return_value='{"OtherKey": "Value"}')
+    mock_response = Response(200, {}, b'{"OtherKey": "Value"}')
 
     # Patch 'badfish' (not src.badfish) to match the import above
     with patch("badfish.main.HTTPClient.get_request", new_callable=AsyncMock) as mock_get:
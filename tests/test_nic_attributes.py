@@ -1,5 +1,8 @@
-from unittest.mock import patch
+import asyncio
+import logging
+from unittest.mock import AsyncMock, patch
 
+from badfish.main import Badfish
 from tests.config import (
     GET_FW_VERSION,
     GET_FW_VERSION_UNSUPPORTED,
@@ -22,6 +25,9 @@ from tests.config import (
     JOB_STATUS_RUNNING,
     JOB_STATUS_COMPLETED,
     JOB_STATUS_FAILED,
+    MOCK_HOST,
+    MOCK_PASS,
+    MOCK_USER,
     RESET_TYPE_RESP,
     RESPONSE_GET_NIC_ATTR_FW_BAD,
     RESPONSE_GET_NIC_ATTR_LIST_INVALID,
@@ -80,7 +86,7 @@ class TestNICFQDDs(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_get_nic_fqdds_supermicro(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP_SUPERMICRO
+        responses = INIT_RESP_SUPERMICRO + ["{}"]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -246,7 +252,7 @@ class TestGetNICAttribute(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_get_nic_attr_info_registry_fail(self, mock_get, mock_post, mock_delete):
         responses = INIT_RESP + [GET_FW_VERSION, "{}"]
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 200, 404], responses)
+        self.set_mock_response(mock_get, [200] * 13 + [404], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "NIC.Embedded.1-1-1", "--attribute", "WakeOnLan"]
@@ -281,6 +287,17 @@ class TestGetNICAttribute(TestBase):
         _, err = self.badfish_call()
         assert err == RESPONSE_GET_NIC_ATTR_SPECIFIC_LIST_FAIL
 
+    @patch("badfish.main.Badfish.get_nic_attribute", new_callable=AsyncMock)
+    @patch("badfish.main.Badfish.get_nic_attribute_registry", new_callable=AsyncMock)
+    def test_get_nic_attr_info_leaves_registry_untouched(self, mock_registry, mock_get_nic_attr):
+        registry = [{"AttributeName": "WakeOnLan", "Type": "Enumeration"}]
+        mock_registry.return_value = registry
+        mock_get_nic_attr.return_value = [("WakeOnLan", "Enabled")]
+        badfish = Badfish(MOCK_HOST, MOCK_USER, MOCK_PASS, logging.getLogger("test"), 1)
+        info = asyncio.run(badfish.get_nic_attribute_info("NIC.Embedded.1-1-1", "WakeOnLan", False))
+        assert info == {"AttributeName": "WakeOnLan", "Type": "Enumeration", "CurrentValue": "Enabled"}
+        assert registry == [{"AttributeName": "WakeOnLan", "Type": "Enumeration"}]
+
 
 class TestSetNICAttribute(TestBase):
     option_arg = "--set-nic-attribute"
@@ -558,8 +575,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,  # Post-reboot job monitoring
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY,
             GET_NIC_ATTR_LIST_UPDATED,  # Final verification
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -656,8 +671,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,  # Job says success
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY,
             GET_NIC_ATTR_LIST,  # But value is still old value (Enabled)
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -692,9 +705,7 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_FAILED,  # Job reports failure
-            GET_FW_VERSION,  # But verification shows value DID change
-            GET_NIC_ATTR_REGISTRY,
-            GET_NIC_ATTR_LIST_UPDATED,
+            GET_NIC_ATTR_LIST_UPDATED,  # But verification shows value DID change
         ]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
@@ -728,8 +739,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY,
             GET_NIC_ATTR_LIST_INTEGER_UPDATED,  # BlnkLeds: 12
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -808,8 +817,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,  # Post-reboot job monitoring
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY_WITH_VF,
             GET_NIC_ATTR_LIST_XXV710_NPARSRIOV,  # Final verification (value still 64, not 128)
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -861,8 +868,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,  # Post-reboot job monitoring
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY_WITH_VF,
             GET_NIC_ATTR_LIST_VF_48,  # Final verification (changed to 48)
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -909,8 +914,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,  # Post-reboot job monitoring
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY_WITH_VF,
             GET_NIC_ATTR_LIST_SINGLE_FUNCTION,  # Final verification
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -967,8 +970,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,  # Post-reboot job monitoring
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY_WITH_VF,
             GET_NIC_ATTR_LIST_WITH_VF,  # Final verification
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -1036,8 +1037,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_FAILED,  # Post-reboot: job failed
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY,
             GET_NIC_ATTR_LIST,  # Post-reboot verification - value unchanged (still Enabled)
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -1076,8 +1075,6 @@ class TestSetNICAttribute(TestBase):
             RESET_TYPE_RESP,
             STATE_OFF_RESP,
             JOB_STATUS_COMPLETED,  # Post-reboot: job completed
-            GET_FW_VERSION,
-            GET_NIC_ATTR_REGISTRY,
             empty_or_invalid_response,  # get_nic_attribute call returns invalid data
         ]
         self.set_mock_response(mock_get, 200, responses)
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 from tests.config import (
     BOOT_SEQ_RESPONSE_DIRECTOR,
-    INIT_RESP,
+    INIT_RESP_SYSTEM,
     JOB_OK_RESP,
     RESPONSE_POWER_OFF_ALREADY,
     RESPONSE_POWER_OFF_MISS_STATE,
@@ -26,9 +26,9 @@ class TestPowerOn(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_on_ok(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [STATE_OFF_RESP]
+        responses = INIT_RESP_SYSTEM + [STATE_OFF_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         _, err = self.badfish_call()
@@ -38,9 +38,9 @@ class TestPowerOn(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_on_not_ok(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [STATE_OFF_RESP]
+        responses = INIT_RESP_SYSTEM + [STATE_OFF_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 409], ["OK", "Conflict"], True)
+        self.set_mock_response(mock_post, [200, 409], ["OK", "Conflict"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         _, err = self.badfish_call()
@@ -54,8 +54,8 @@ class TestPowerOff(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_off_no_state(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + ["{}"]
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 400], responses)
+        responses = INIT_RESP_SYSTEM + ["{}"]
+        self.set_mock_response(mock_get, [200] * 11 + [400], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
@@ -66,9 +66,9 @@ class TestPowerOff(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_off_already(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [STATE_OFF_RESP]
+        responses = INIT_RESP_SYSTEM + [STATE_OFF_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 409], ["OK", "Conflict"], True)
+        self.set_mock_response(mock_post, [200, 409], ["OK", "Conflict"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         _, err = self.badfish_call()
@@ -78,7 +78,7 @@ class TestPowerOff(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_miss_state(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [JOB_OK_RESP]
+        responses = INIT_RESP_SYSTEM + [JOB_OK_RESP]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -93,7 +93,7 @@ class TestPowerOff(TestBase):
     def test_power_off_none(self, mock_get_req_call, mock_get, mock_post, mock_delete):
         # The power off operation should return None when getting power state
         mock_get_req_call.side_effect = [None]
-        self.set_mock_response(mock_get, 200, INIT_RESP)
+        self.set_mock_response(mock_get, 200, INIT_RESP_SYSTEM)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
@@ -107,7 +107,7 @@ class TestPowerState(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_state(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [STATE_ON_RESP]
+        responses = INIT_RESP_SYSTEM + [STATE_ON_RESP]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -118,8 +118,8 @@ class TestPowerState(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_state_bad_request(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + ["Bad Request"]
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 400], responses)
+        responses = INIT_RESP_SYSTEM + ["Bad Request"]
+        self.set_mock_response(mock_get, [200] * 11 + [400], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
@@ -129,7 +129,7 @@ class TestPowerState(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_state_empty_data(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + ["{}"]
+        responses = INIT_RESP_SYSTEM + ["{}"]
         self.set_mock_response(mock_get, 200, responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
@@ -144,7 +144,7 @@ class TestPowerState(TestBase):
         # The power state check should return None (simulating communication failure)
         mock_get_req_call.side_effect = [None]
         # Add extra response for the power state call that should fail (404)
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 404], INIT_RESP + [""])
+        self.set_mock_response(mock_get, [200] * 4 + [404], INIT_RESP_SYSTEM + [""])
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
@@ -1,7 +1,7 @@
 from unittest.mock import patch
 
 from tests.config import (
-    INIT_RESP,
+    INIT_RESP_SYSTEM,
     NO_POWER,
     POWER_CONSUMED_RESP,
     RESPONSE_NO_POWER_CONSUMED,
@@ -19,9 +19,9 @@ class TestPowerConsumed(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_power_consumed(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [POWER_CONSUMED_RESP]
+        responses = INIT_RESP_SYSTEM + [POWER_CONSUMED_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, "OK", True)
+        self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
         assert err == RESPONSE_POWER_CONSUMED_OK
@@ -37,8 +37,8 @@ class TestPowerConsumed(TestBase):
             # Mock get_request to return 404 for power endpoint
             mock_get_request.return_value = MockResponse('{"error": "Not Found"}', 404)
 
-            self.set_mock_response(mock_get, 200, INIT_RESP)
-            self.set_mock_response(mock_post, 200, "OK", True)
+            self.set_mock_response(mock_get, 200, INIT_RESP_SYSTEM)
+            self.set_mock_response(mock_post, 200, "OK")
             self.set_mock_response(mock_delete, 200, "OK")
             _, err = self.badfish_call()
             assert err == f"{RESPONSE_VENDOR_UNSUPPORTED}\n"
@@ -47,9 +47,9 @@ class TestPowerConsumed(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_no_power(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [NO_POWER]
+        responses = INIT_RESP_SYSTEM + [NO_POWER]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, "OK", True)
+        self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
         assert err == RESPONSE_NO_POWER_CONSUMED
@@ -59,9 +59,9 @@ class TestPowerConsumed(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_power_consumed_value_error(self, mock_get, mock_post, mock_delete):
         responses_add = [""]
-        responses = INIT_RESP + responses_add
+        responses = INIT_RESP_SYSTEM + responses_add
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, 200, "OK", True)
+        self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         _, err = self.badfish_call()
         assert err == RESPONSE_POWER_CONSUMED_VAL_ERR
@@ -2,7 +2,7 @@ from unittest.mock import patch
 
 from tests.config import (
     BOOT_SEQ_RESPONSE_DIRECTOR,
-    INIT_RESP,
+    INIT_RESP_SYSTEM,
     RESET_TYPE_NG_RESP,
     RESET_TYPE_RESP,
     RESPONSE_REBOOT_ONLY_FAILED_SEND_RESET,
@@ -22,14 +22,14 @@ class TestRebootOnly(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reboot_only_success(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [
+        responses = INIT_RESP_SYSTEM + [
             RESET_TYPE_RESP,
             STATE_ON_RESP,
             STATE_OFF_RESP,
             STATE_ON_RESP,
         ]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -40,14 +40,14 @@ class TestRebootOnly(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reboot_only_success_with_polling_down(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [
+        responses = INIT_RESP_SYSTEM + [
             RESET_TYPE_RESP,
             STATE_ON_RESP,
             STATE_DOWN_RESP,
             STATE_ON_RESP,
         ]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -58,14 +58,14 @@ class TestRebootOnly(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reboot_only_failed_send_reset(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [
+        responses = INIT_RESP_SYSTEM + [
             RESET_TYPE_RESP,
             STATE_ON_RESP,
             STATE_DOWN_RESP,
             STATE_ON_RESP,
         ]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -76,14 +76,14 @@ class TestRebootOnly(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reboot_only_success_with_ng_rt(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [
+        responses = INIT_RESP_SYSTEM + [
             RESET_TYPE_NG_RESP,
             STATE_ON_RESP,
             STATE_DOWN_RESP,
             STATE_ON_RESP,
         ]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -95,13 +95,11 @@ class TestRebootOnly(TestBase):
     @patch("aiohttp.ClientSession.get")
     @patch("aiohttp.ClientSession.post")
     def test_reboot_only_failed_grace_and_force(self, mock_post, mock_get, mock_delete):
-        responses = INIT_RESP + [
-            RESET_TYPE_RESP,
-            STATE_ON_RESP,
-        ]
+        # Power state is read fresh on every poll, the host never leaves the On state
+        responses = INIT_RESP_SYSTEM + [RESET_TYPE_RESP] + [STATE_ON_RESP] * 32
         self.set_mock_response(mock_get, 200, responses)
         # Provide enough POST responses to handle the entire reboot sequence
-        self.set_mock_response(mock_post, [200] + [409] * 10, ["OK"] + ["Conflict"] * 10, True)
+        self.set_mock_response(mock_post, [200] + [409] * 10, ["OK"] + ["Conflict"] * 10)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -13,7 +13,7 @@ class TestResetBios(TestBase):
     def test_reset_bios(self, mock_get, mock_post, mock_delete):
         responses = INIT_RESP + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -26,7 +26,7 @@ class TestResetBios(TestBase):
     def test_reset_bios_fail(self, mock_get, mock_post, mock_delete):
         responses = INIT_RESP + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
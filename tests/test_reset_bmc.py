@@ -2,8 +2,8 @@ from unittest.mock import patch
 
 from tests.config import (
     BOOT_SEQ_RESPONSE_DIRECTOR,
-    INIT_RESP,
-    INIT_RESP_SUPERMICRO,
+    INIT_RESP_MANAGER,
+    INIT_RESP_SUPERMICRO_MANAGER,
     RESET_TYPE_RESP,
     RESET_TYPE_RESP_NO_ALLOWABLE_VALUES,
     RESPONSE_RESET,
@@ -20,9 +20,9 @@ class TestResetBMC(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_bmc(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP_SUPERMICRO + [RESET_TYPE_RESP]
+        responses = INIT_RESP_SUPERMICRO_MANAGER + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 200], "OK", True)
+        self.set_mock_response(mock_post, [200, 200], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -33,9 +33,9 @@ class TestResetBMC(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_bmc_no_allowable_values(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP_SUPERMICRO + [RESET_TYPE_RESP_NO_ALLOWABLE_VALUES]
+        responses = INIT_RESP_SUPERMICRO_MANAGER + [RESET_TYPE_RESP_NO_ALLOWABLE_VALUES]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 200], "OK", True)
+        self.set_mock_response(mock_post, [200, 200], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -46,9 +46,9 @@ class TestResetBMC(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_bmc_fail(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP_SUPERMICRO + [RESET_TYPE_RESP]
+        responses = INIT_RESP_SUPERMICRO_MANAGER + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -59,9 +59,9 @@ class TestResetBMC(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_bmc_wrong_vendor(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [RESET_TYPE_RESP]
+        responses = INIT_RESP_MANAGER + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
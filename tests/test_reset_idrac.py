@@ -2,8 +2,8 @@ from unittest.mock import patch, PropertyMock, AsyncMock
 
 from tests.config import (
     BOOT_SEQ_RESPONSE_DIRECTOR,
-    INIT_RESP,
-    INIT_RESP_SUPERMICRO,
+    INIT_RESP_MANAGER,
+    INIT_RESP_SUPERMICRO_MANAGER,
     RESET_TYPE_RESP,
     RESPONSE_RESET,
     RESPONSE_RESET_FAIL,
@@ -20,9 +20,9 @@ class TestResetIdrac(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_idrac(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [RESET_TYPE_RESP]
+        responses = INIT_RESP_MANAGER + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -33,9 +33,9 @@ class TestResetIdrac(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_idrac_fail(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [RESET_TYPE_RESP]
+        responses = INIT_RESP_MANAGER + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -46,9 +46,9 @@ class TestResetIdrac(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_idrac_wrong_vendor(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP_SUPERMICRO + [RESET_TYPE_RESP]
+        responses = INIT_RESP_SUPERMICRO_MANAGER + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg]
@@ -60,9 +60,9 @@ class TestResetIdrac(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_idrac_with_wait_timeout(self, mock_get, mock_post, mock_delete, mock_wait):
-        responses = INIT_RESP + [RESET_TYPE_RESP]
+        responses = INIT_RESP_MANAGER + [RESET_TYPE_RESP]
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         mock_wait.return_value = False
 
@@ -77,9 +77,9 @@ class TestResetIdrac(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_idrac_with_wait_success(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [RESET_TYPE_RESP] + [ROOT_RESP] * 15
+        responses = INIT_RESP_MANAGER + [RESET_TYPE_RESP] + [ROOT_RESP] * 15
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg, "--wait"]
@@ -94,10 +94,10 @@ class TestResetIdrac(TestBase):
     @patch("aiohttp.ClientSession.post")
     @patch("aiohttp.ClientSession.get")
     def test_reset_idrac_with_wait_delayed(self, mock_get, mock_post, mock_delete):
-        responses = INIT_RESP + [RESET_TYPE_RESP] + ["Not Found"] * 5 + [ROOT_RESP] * 10
+        responses = INIT_RESP_MANAGER + [RESET_TYPE_RESP] + ["Not Found"] * 5 + [ROOT_RESP] * 10
         status_list = [200] * 6 + [404] * 5 + [200] * 10
         self.set_mock_response(mock_get, status_list, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.boot_seq = BOOT_SEQ_RESPONSE_DIRECTOR
         self.args = [self.option_arg, "--wait"]
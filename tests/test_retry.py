@@ -0,0 +1,94 @@
+import ssl
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import aiohttp
+import pytest
+
+from badfish.helpers.retry import RetryBudget, RetryPolicy
+
+
+class DummyLogger:
+    def __init__(self):
+        self.debug_msgs = []
+
+    def debug(self, msg):
+        self.debug_msgs.append(str(msg))
+
+
+def test_budget_allows_minimum_then_ratio_of_requests():
+    budget = RetryBudget(ratio=0.5, minimum=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+    assert not budget.withdraw()
+
+
+def test_backoff_is_jittered_and_capped():
+    policy = RetryPolicy(DummyLogger(), base_delay=1.0, max_delay=5.0)
+    with patch("badfish.helpers.retry.random.uniform", side_effect=lambda low, high: high) as uniform:
+        assert policy.backoff(0) == 1.0
+        assert policy.backoff(2) == 4.0
+        assert policy.backoff(10) == 5.0
+    assert all(call.args[0] == 0 for call in uniform.call_args_list)
+
+
+def test_retry_after_seconds_overrides_backoff():
+    policy = RetryPolicy(DummyLogger(), max_retry_after=60)
+    response = SimpleNamespace(headers={"Retry-After": "7"})
+    assert policy.delay(0, response) == 7.0
+    response = SimpleNamespace(headers={"Retry-After": "600"})
+    assert policy.delay(0, response) == 60
+
+
+def test_retry_after_http_date():
+    policy = RetryPolicy(DummyLogger())
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    response = SimpleNamespace(headers={"Retry-After": format_datetime(when, usegmt=True)})
+    assert 25 <= policy.retry_after(response) <= 30
+
+
+def test_retry_after_ignores_missing_or_invalid_header():
+    policy = RetryPolicy(DummyLogger())
+    assert policy.retry_after(SimpleNamespace(headers={})) is None
+    assert policy.retry_after(SimpleNamespace(headers={"Retry-After": "soon"})) is None
+    assert policy.retry_after(SimpleNamespace()) is None
+
+
+def test_retryable_statuses_and_errors():
+    policy = RetryPolicy(DummyLogger())
+    assert policy.retryable(503)
+    assert policy.retryable(429)
+    assert not policy.retryable(400)
+    connection_key = SimpleNamespace(host="h", port=443, ssl=True)
+    refused = aiohttp.ClientConnectorError(connection_key, OSError("refused"))
+    assert policy.retryable_error(aiohttp.ServerDisconnectedError())
+    assert policy.retryable_error(refused, idempotent=False)
+    assert not policy.retryable_error(aiohttp.ServerDisconnectedError(), idempotent=False)
+    assert not policy.retryable_error(ssl.SSLError())
+    assert not policy.retryable_error(ValueError())
+
+
+@pytest.mark.asyncio
+async def test_wait_sleeps_until_attempts_exhausted():
+    policy = RetryPolicy(DummyLogger(), attempts=3)
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep, patch.object(policy, "backoff", return_value=2.0):
+        assert await policy.wait(0)
+        assert await policy.wait(1)
+        assert not await policy.wait(2)
+    assert [call.args[0] for call in sleep.await_args_list] == [2.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_wait_stops_when_budget_exhausted():
+    logger = DummyLogger()
+    policy = RetryPolicy(logger, attempts=10, budget=RetryBudget(ratio=0, minimum=1))
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        assert await policy.wait(0)
+        assert not await policy.wait(1)
+    assert sleep.await_count == 1
+    assert "Retry budget exhausted, not retrying." in logger.debug_msgs
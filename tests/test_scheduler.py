@@ -0,0 +1,113 @@
+import asyncio
+
+from badfish.helpers.scheduler import gather_bounded, run_bounded
+
+
+class Jobs:
+    """Jobs recording the order they start in and blocking until released."""
+
+    def __init__(self, count):
+        self.started = []
+        self.running = 0
+        self.peak = 0
+        self.release = [asyncio.Event() for _ in range(count)]
+
+    def job(self, index):
+        async def run():
+            self.started.append(index)
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+            try:
+                await self.release[index].wait()
+            finally:
+                self.running -= 1
+            if index == 1:
+                raise ValueError("boom")
+            return index
+
+        return run
+
+    def __iter__(self):
+        return iter(self.job(index) for index in range(len(self.release)))
+
+
+async def settle():
+    # asyncio.sleep is patched by other test modules, so yield to the loop through plain futures
+    loop = asyncio.get_running_loop()
+    for _ in range(20):
+        step = loop.create_future()
+        loop.call_soon(step.set_result, None)
+        await step
+
+
+def test_max_concurrency_starts_in_order():
+    async def scenario():
+        jobs = Jobs(5)
+        results = asyncio.ensure_future(gather_bounded(list(jobs), max_concurrency=2))
+        await settle()
+        assert jobs.started == [0, 1]
+        jobs.release[1].set()
+        await settle()
+        assert jobs.started == [0, 1, 2]
+        for event in jobs.release:
+            event.set()
+        results = await results
+        assert isinstance(results[1], ValueError)
+        assert results[:1] + results[2:] == [0, 2, 3, 4]
+        assert jobs.peak == 2
+
+    asyncio.run(scenario())
+
+
+def test_group_limit_lets_other_groups_through():
+    async def scenario():
+        jobs = Jobs(4)
+        groups = ["rack-a", "rack-a", "rack-a", "rack-b"]
+        results = asyncio.ensure_future(gather_bounded(list(jobs), max_concurrency=3, groups=groups, group_limit=1))
+        await settle()
+        assert jobs.started == [0, 3]
+        jobs.release[0].set()
+        await settle()
+        assert jobs.started == [0, 3, 1]
+        for event in jobs.release:
+            event.set()
+        await results
+        assert jobs.started == [0, 3, 1, 2]
+
+    asyncio.run(scenario())
+
+
+def test_run_bounded_yields_as_completed():
+    async def scenario():
+        jobs = Jobs(3)
+        completed = []
+
+        async def consume():
+            async for index, result in run_bounded(list(jobs)):
+                completed.append((index, result))
+
+        consumer = asyncio.ensure_future(consume())
+        await settle()
+        assert jobs.started == [0, 1, 2]
+        jobs.release[2].set()
+        await settle()
+        assert completed == [(2, 2)]
+        jobs.release[0].set()
+        jobs.release[1].set()
+        await consumer
+        assert [index for index, _ in completed] == [2, 0, 1]
+
+    asyncio.run(scenario())
+
+
+def test_cancelling_stops_running_jobs():
+    async def scenario():
+        jobs = Jobs(3)
+        results = asyncio.ensure_future(gather_bounded(list(jobs), max_concurrency=2))
+        await settle()
+        results.cancel()
+        await settle()
+        assert jobs.started == [0, 1]
+        assert jobs.running == 0
+
+    asyncio.run(scenario())
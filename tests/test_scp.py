@@ -130,7 +130,7 @@ class TestExportSCP(TestBase):
         responses = INIT_RESP + responses_get
         headers = {"Location": f"/{JOB_ID}"}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "./exports/"]
         _, err = self.badfish_call()
@@ -145,7 +145,7 @@ class TestExportSCP(TestBase):
         responses = INIT_RESP + [BLANK_RESP] * 10
         self.set_mock_response(mock_get, 200, responses)
         # First POST is session/auth (200), second POST is export command (400 = fail)
-        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"], post=True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "./exports/"]
         _, err = self.badfish_call()
@@ -159,7 +159,7 @@ class TestExportSCP(TestBase):
         responses = INIT_RESP
         headers = {}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "./exports/"]
         _, err = self.badfish_call()
@@ -181,7 +181,7 @@ class TestExportSCP(TestBase):
         responses = INIT_RESP + responses_get
         headers = {"Location": f"/{JOB_ID}"}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "./exports/"]
         _, err = self.badfish_call()
@@ -199,7 +199,7 @@ class TestExportSCP(TestBase):
         responses = INIT_RESP + responses_get
         headers = {"Location": f"/{JOB_ID}"}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "./exports/"]
         _, err = self.badfish_call()
@@ -232,7 +232,7 @@ class TestImportSCP(TestBase):
         responses = INIT_RESP + responses_get
         headers = {"Location": f"/{JOB_ID}"}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, self.example_path]
         _, err = self.badfish_call()
@@ -257,7 +257,7 @@ class TestImportSCP(TestBase):
         responses_get = [STATE_ON_RESP]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", "Bad Request"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, self.example_path]
         _, err = self.badfish_call()
@@ -272,7 +272,7 @@ class TestImportSCP(TestBase):
         responses = INIT_RESP + responses_get
         headers = {}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, self.example_path]
         _, err = self.badfish_call()
@@ -294,7 +294,7 @@ class TestImportSCP(TestBase):
         responses = INIT_RESP + responses_get
         headers = {"Location": f"/{JOB_ID}"}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, self.example_path]
         _, err = self.badfish_call()
@@ -315,7 +315,7 @@ class TestImportSCP(TestBase):
         responses = INIT_RESP + responses_get
         headers = {"Location": f"/{JOB_ID}"}
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers, post=True)
+        self.set_mock_response(mock_post, [200, 202], ["OK", "OK"], headers=headers)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, self.example_path]
         _, err = self.badfish_call()
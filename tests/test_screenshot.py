@@ -49,7 +49,7 @@ class TestScreenshotErrors(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_screenshot_not_supported(self, mock_get, mock_post, mock_delete):
         self.set_mock_response(mock_get, 200, INIT_RESP)
-        self.set_mock_response(mock_post, [200, 404], ["OK", "Not Found"], True)
+        self.set_mock_response(mock_post, [200, 404], ["OK", "Not Found"])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -60,7 +60,7 @@ class TestScreenshotErrors(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_screenshot_bad_request(self, mock_get, mock_post, mock_delete):
         self.set_mock_response(mock_get, 200, INIT_RESP)
-        self.set_mock_response(mock_post, [200, 400], ["OK", SCREENSHOT_RESP], True)
+        self.set_mock_response(mock_post, [200, 400], ["OK", SCREENSHOT_RESP])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -71,7 +71,7 @@ class TestScreenshotErrors(TestBase):
     @patch("aiohttp.ClientSession.get")
     def test_screenshot_false_ok(self, mock_get, mock_post, mock_delete):
         self.set_mock_response(mock_get, 200, INIT_RESP)
-        self.set_mock_response(mock_post, [200, 200], ["OK", ""], True)
+        self.set_mock_response(mock_post, [200, 200], ["OK", ""])
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.slots import SessionSlots
+
+
+@pytest.fixture
+def slots(tmp_path):
+    return SessionSlots(str(tmp_path / "locks"), 2, wait=0)
+
+
+def test_slots_are_capped_per_host(slots):
+    first = slots.try_acquire("host-a")
+    second = slots.try_acquire("host-a")
+    assert first is not None and second is not None
+    assert slots.try_acquire("host-a") is None
+    other = slots.try_acquire("host-b")
+    assert other is not None
+
+    slots.release(first)
+    third = slots.try_acquire("host-a")
+    assert third is not None
+    for slot in (second, third, other):
+        slots.release(slot)
+
+
+def test_acquire_waits_for_a_released_slot(slots):
+    held = [slots.try_acquire("host-a"), slots.try_acquire("host-a")]
+    slots.wait = slots.poll = 0.01
+
+    async def scenario():
+        with pytest.raises(BadfishException, match="Timed out waiting for a free session slot on host-a"):
+            await slots.acquire("host-a")
+        slots.wait = 60
+        waiting = asyncio.ensure_future(slots.acquire("host-a"))
+        slots.release(held.pop())
+        return await asyncio.wait_for(waiting, timeout=5)
+
+    slots.release(asyncio.run(scenario()))
+    slots.release(held.pop())
@@ -0,0 +1,88 @@
+import sqlite3
+
+import pytest
+
+from badfish.helpers.exceptions import BadfishException
+from badfish.helpers.store import Filter, InventoryStore, flatten
+
+HOST_A = {
+    "Serial": "ABC1234",
+    "Processors": {"Summary": {"Count": 2, "Model": "Intel Xeon Gold 6130"}},
+    "Interfaces": {"NIC.Slot.1-1": {"Id": "NIC.Slot.1-1", "LinkStatus": "Up", "Vendor": "Mellanox Technologies"}},
+    "Firmware": {"Installed-159-2.18.1__BIOS.Setup.1-1": {"Name": "BIOS", "Version": "2.18.1"}},
+}
+HOST_B = {
+    "Serial": "DEF5678",
+    "Processors": {"Summary": {"Count": 2, "Model": "Intel Xeon Gold 6130"}},
+    "Interfaces": {"NIC.Integrated.1-1": {"Vendor": "Broadcom"}},
+    "Firmware": {"Installed-159-2.19.1__BIOS.Setup.1-1": {"Name": "BIOS", "Version": "2.19.1"}},
+}
+
+
+@pytest.fixture
+def store(tmp_path):
+    with InventoryStore(str(tmp_path / "inventory.db")) as _store:
+        _store.save("host-a", HOST_A, collected=100.0)
+        _store.save("host-b", HOST_B, collected=200.0)
+        yield _store
+
+
+def test_flatten_joins_paths_like_select():
+    document = {"Summary": {"Count": 2, "Caps": [{"Speed": 1000}]}, "Up": True}
+    assert list(flatten(document)) == [("Summary/Count", "2"), ("Summary/Caps/0/Speed", "1000"), ("Up", "true")]
+
+
+def test_filter_parse_and_compare():
+    assert Filter.parse("Firmware/*BIOS*/Version < 2.19") == Filter("Firmware/*BIOS*/Version", "<", "2.19")
+    assert Filter.parse("Serial==ABC") == Filter("Serial", "=", "ABC")
+    assert Filter("p", "<", "2.19").matches("2.18.1")
+    assert not Filter("p", "<", "2.19").matches("2.19.1")
+    assert Filter("p", ">=", "10").matches("9.5") is False
+    assert Filter("p", "~", "xxv710").matches("Intel XXV710 Adapter")
+    assert Filter("p", "!=", "Down").matches("Up")
+    assert not Filter("p", "=", "x").matches(None)
+    with pytest.raises(BadfishException):
+        Filter.parse("no operator")
+
+
+def test_query_filters_latest_facts(store):
+    assert store.query([Filter.parse("Interfaces/*/Vendor~mellanox")]) == {
+        "host-a": {"Interfaces/NIC.Slot.1-1/Vendor": "Mellanox Technologies"}
+    }
+    assert list(store.query([Filter.parse("Firmware/*BIOS*/Version<2.19")])) == ["host-a"]
+    assert list(store.query([Filter.parse("Processors/Summary/Count=2"), Filter.parse("Serial=DEF5678")])) == ["host-b"]
+    assert store.query([Filter.parse("Serial=nope"), Filter.parse("Processors/Summary/Count=2")]) == {}
+    assert list(store.query()) == ["host-a", "host-b"]
+
+
+def test_save_replaces_facts_and_keeps_history(store):
+    store.save("host-a", dict(HOST_A, Serial="NEW0001"), collected=300.0)
+    assert store.query([Filter.parse("Serial=ABC1234")]) == {}
+    assert store.latest("host-a") == (300.0, dict(HOST_A, Serial="NEW0001"))
+    assert store._db.execute("SELECT COUNT(*) FROM inventory WHERE host = 'host-a'").fetchone() == (2,)
+
+
+def test_count_by(store):
+    assert store.count_by("Processors/Summary/Model") == {"Intel Xeon Gold 6130": 2}
+    assert store.count_by("Interfaces/*/Vendor", ["host-b"]) == {"Broadcom": 1}
+
+
+@pytest.mark.skipif(not hasattr(sqlite3.Connection, "setlimit"), reason="needs Python 3.11")
+def test_host_filter_ignores_the_bound_parameter_limit(store):
+    store._db.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 8)
+    hosts = [f"host-{i}" for i in range(16)] + ["host-a"]
+    assert store.count_by("Serial", hosts) == {"ABC1234": 1}
+
+
+def test_stale(store):
+    assert store.collected() == {"host-a": 100.0, "host-b": 200.0}
+    assert store.stale(["host-a", "host-b", "host-c"], max_age=150, now=300.0) == ["host-a", "host-c"]
+    assert store.latest("host-c") is None
+
+
+def test_members_roundtrip_and_replace(store):
+    assert store.members("host-a") == {}
+    store.save_members("host-a", {"https://a/Memory/DIMM.A1": ('W/"1"', '{"Id": "DIMM.A1"}')})
+    store.save_members("host-a", {"https://a/Memory/DIMM.A2": ('W/"2"', '{"Id": "DIMM.A2"}')})
+    assert store.members("host-a") == {"https://a/Memory/DIMM.A2": ('W/"2"', '{"Id": "DIMM.A2"}')}
+    assert store.members("host-b") == {}
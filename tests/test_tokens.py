@@ -0,0 +1,160 @@
+import fcntl
+import os
+import stat
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from badfish.helpers.parser import parse_arguments
+from badfish.helpers.tokens import TokenStore
+from tests.config import INIT_RESP_SYSTEM, MOCK_HOST, MOCK_USER, RESPONSE_POWER_STATE_ON, STATE_ON_RESP
+from tests.test_base import TestBase
+
+SESSION = "/redfish/v1/SessionService/Sessions/7"
+
+
+@pytest.fixture
+def store(tmp_path):
+    return TokenStore(str(tmp_path / "badfish" / "sessions.json"), max_age=100)
+
+
+def test_put_get_and_permissions(store):
+    assert store.get("host-a", "root") is None
+    store.put("host-a", "root", "TKN", SESSION, now=1000.0)
+    assert store.get("host-a", "root", now=1050.0) == {
+        "username": "root",
+        "token": "TKN",
+        "location": SESSION,
+        "saved": 1000.0,
+    }
+    assert stat.S_IMODE(os.stat(store.path).st_mode) == 0o600
+
+
+def test_other_user_expired_and_dropped_tokens_are_ignored(store):
+    store.put("host-a", "root", "TKN", SESSION, now=1000.0)
+    store.put("host-b", "root", "TKN-B", SESSION, now=1000.0)
+    assert store.get("host-a", "admin", now=1000.0) is None
+    assert store.get("host-a", "root", now=1200.0) is None
+    store.drop("host-a")
+    assert store.get("host-a", "root", now=1000.0) is None
+    assert store.get("host-b", "root", now=1000.0)["token"] == "TKN-B"
+
+
+def test_unreadable_store_is_empty(store):
+    os.makedirs(os.path.dirname(store.path))
+    with open(store.path, "w") as _file:
+        _file.write("not json")
+    assert store.get("host-a", "root") is None
+    store.put("host-a", "root", "TKN", SESSION)
+    assert store.get("host-a", "root")["token"] == "TKN"
+
+
+def test_put_waits_for_other_writers(store):
+    store.put("host-a", "root", "TKN", SESSION, now=1000.0)
+    fd = os.open(store.path + ".lock", os.O_RDWR)
+    fcntl.flock(fd, fcntl.LOCK_EX)
+    writer = threading.Thread(target=store.put, args=("host-b", "root", "TKN-B", SESSION, 1000.0))
+    writer.start()
+    writer.join(0.2)
+    assert writer.is_alive()
+    assert store.get("host-b", "root", now=1000.0) is None
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+    writer.join()
+    assert store.get("host-a", "root", now=1000.0)["token"] == "TKN"
+    assert store.get("host-b", "root", now=1000.0)["token"] == "TKN-B"
+
+
+def test_concurrent_puts_keep_every_host(store):
+    writers = [
+        threading.Thread(target=store.put, args=(f"host-{i}", "root", f"TKN-{i}", SESSION, 1000.0)) for i in range(16)
+    ]
+    for writer in writers:
+        writer.start()
+    for writer in writers:
+        writer.join()
+    assert all(store.get(f"host-{i}", "root", now=1000.0)["token"] == f"TKN-{i}" for i in range(16))
+
+
+def test_stale_and_touch(store):
+    store.put("host-a", "root", "TKN", SESSION, now=1000.0)
+    assert store.stale("host-a", "root", now=1050.0) is None
+    assert store.stale("host-a", "root", now=1200.0)["token"] == "TKN"
+    store.touch("host-a", "OTHER", now=1150.0)
+    assert store.get("host-a", "root", now=1150.0) is None
+    store.touch("host-a", "TKN", now=1150.0)
+    assert store.get("host-a", "root", now=1200.0)["saved"] == 1150.0
+
+
+def test_token_store_rejects_max_sessions(capsys):
+    with pytest.raises(SystemExit) as exc_info:
+        parse_arguments(["-H", "test_host", "--token-store", "--max-sessions", "2"])
+    assert exc_info.value.code == 2
+    assert "cannot be combined with --max-sessions" in capsys.readouterr().err
+    assert parse_arguments(["-H", "test_host", "--token-store", "--max-sessions", "0"])["token_store"]
+
+
+class TestTokenStore(TestBase):
+    @pytest.fixture(autouse=True)
+    def token_store(self, tmp_path):
+        self.store = TokenStore(str(tmp_path / "sessions.json"))
+        self.args = ["--power-state", "--token-store", self.store.path]
+
+    def call(self, mock_get, mock_post, mock_delete, responses, statuses=200):
+        self.set_mock_response(mock_get, statuses, responses)
+        self.set_mock_response(mock_post, 201, "OK", headers={"X-Auth-Token": "NEW", "Location": SESSION})
+        self.set_mock_response(mock_delete, 200, "OK")
+        return self.badfish_call()
+
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_session_is_stored_and_kept_open(self, mock_get, mock_post, mock_delete):
+        _, err = self.call(mock_get, mock_post, mock_delete, INIT_RESP_SYSTEM + [STATE_ON_RESP])
+        assert err == RESPONSE_POWER_STATE_ON
+        assert self.store.get(MOCK_HOST, MOCK_USER)["token"] == "NEW"
+        mock_delete.assert_not_called()
+
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_stored_token_is_reused(self, mock_get, mock_post, mock_delete):
+        self.store.put(MOCK_HOST, MOCK_USER, "STORED", SESSION)
+        _, err = self.call(mock_get, mock_post, mock_delete, INIT_RESP_SYSTEM + [STATE_ON_RESP])
+        assert err == RESPONSE_POWER_STATE_ON
+        mock_post.assert_not_called()
+        assert mock_get.call_args_list[-1].kwargs["headers"]["X-Auth-Token"] == "STORED"
+
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_expired_stored_token_is_renewed(self, mock_get, mock_post, mock_delete):
+        self.store.put(MOCK_HOST, MOCK_USER, "EXPIRED", SESSION)
+        responses = INIT_RESP_SYSTEM[:3] + ["Unauthorized"] + INIT_RESP_SYSTEM[3:] + [STATE_ON_RESP]
+        _, err = self.call(mock_get, mock_post, mock_delete, responses, [200] * 3 + [401] + [200] * 10)
+        assert err == RESPONSE_POWER_STATE_ON
+        assert mock_post.call_count == 1
+        assert self.store.get(MOCK_HOST, MOCK_USER)["token"] == "NEW"
+
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_reused_token_is_kept_fresh(self, mock_get, mock_post, mock_delete):
+        saved = time.time() - self.store.max_age + 60
+        self.store.put(MOCK_HOST, MOCK_USER, "STORED", SESSION, now=saved)
+        self.call(mock_get, mock_post, mock_delete, INIT_RESP_SYSTEM + [STATE_ON_RESP])
+        assert self.store.get(MOCK_HOST, MOCK_USER, now=saved + self.store.max_age + 1)["token"] == "STORED"
+
+    @patch("aiohttp.ClientSession.delete")
+    @patch("aiohttp.ClientSession.post")
+    @patch("aiohttp.ClientSession.get")
+    def test_stale_session_is_deleted_before_replacing_it(self, mock_get, mock_post, mock_delete):
+        self.store.put(MOCK_HOST, MOCK_USER, "OLD", SESSION, now=0.0)
+        _, err = self.call(mock_get, mock_post, mock_delete, INIT_RESP_SYSTEM + [STATE_ON_RESP])
+        assert err == RESPONSE_POWER_STATE_ON
+        mock_delete.assert_called_once()
+        assert mock_delete.call_args.args[0] == f"https://{MOCK_HOST}{SESSION}"
+        assert mock_delete.call_args.kwargs["headers"]["X-Auth-Token"] == "OLD"
+        assert self.store.get(MOCK_HOST, MOCK_USER)["token"] == "NEW"
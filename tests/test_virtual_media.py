@@ -167,7 +167,7 @@ class TestMountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "http://storage.example.com/linux.iso"]
         _, err = self.badfish_call()
@@ -180,7 +180,7 @@ class TestMountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 405], "OK", True)
+        self.set_mock_response(mock_post, [200, 405], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "http://storage.example.com/linux.iso"]
         _, err = self.badfish_call()
@@ -193,7 +193,7 @@ class TestMountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 500], "OK", True)
+        self.set_mock_response(mock_post, [200, 500], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "http://storage.example.com/linux.iso"]
         _, err = self.badfish_call()
@@ -206,7 +206,7 @@ class TestMountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], "OK", True)
+        self.set_mock_response(mock_post, [200, 400], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "http://storage.example.com/linux.iso"]
         _, err = self.badfish_call()
@@ -235,7 +235,7 @@ class TestMountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_SM]
         responses = INIT_RESP_SUPERMICRO + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], "OK", True)
+        self.set_mock_response(mock_post, [200, 400], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.set_mock_response(mock_patch, 200, "OK")
         self.args = [self.option_arg, "http://storage.example.com/linux.iso"]
@@ -253,7 +253,7 @@ class TestUnmountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 204], "OK", True)
+        self.set_mock_response(mock_post, [200, 204], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -266,7 +266,7 @@ class TestUnmountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 405], "OK", True)
+        self.set_mock_response(mock_post, [200, 405], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -279,7 +279,7 @@ class TestUnmountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 500], "OK", True)
+        self.set_mock_response(mock_post, [200, 500], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -292,7 +292,7 @@ class TestUnmountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_DELL]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], "OK", True)
+        self.set_mock_response(mock_post, [200, 400], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -321,7 +321,7 @@ class TestUnmountVirtualMedia(TestBase):
         responses_get = [VMEDIA_GET_VM_CONFIG_RESP_SM]
         responses = INIT_RESP_SUPERMICRO + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], "OK", True)
+        self.set_mock_response(mock_post, [200, 400], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.set_mock_response(mock_patch, 200, "OK")
         self.args = [self.option_arg]
@@ -441,7 +441,7 @@ class TestCheckRemoteImage(TestBase):
     def test_os_deployment_not_supported(self, mock_get, mock_post, mock_delete):
         responses_get = [BLANK_RESP]
         responses = INIT_RESP + responses_get
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 404], responses)
+        self.set_mock_response(mock_get, [200] * 11 + [404], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
@@ -468,7 +468,7 @@ class TestCheckRemoteImage(TestBase):
         responses_get = [BLANK_RESP]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], VMEDIA_REMOTE_CHECK_RESP, True)
+        self.set_mock_response(mock_post, [200, 400], VMEDIA_REMOTE_CHECK_RESP)
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()
@@ -497,7 +497,7 @@ class TestBootRemoteImage(TestBase):
     def test_boot_os_deployment_not_supported(self, mock_get, mock_post, mock_delete):
         responses_get = [BLANK_RESP]
         responses = INIT_RESP + responses_get
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 404], responses)
+        self.set_mock_response(mock_get, [200] * 11 + [404], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "nfs.example.com:/mnt/storage/user1/linux.iso"]
@@ -511,7 +511,7 @@ class TestBootRemoteImage(TestBase):
         responses_get = [BLANK_RESP, VMEDIA_REMOTE_BOOT_TASK_RESP]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], "OK", True)
+        self.set_mock_response(mock_post, [200, 202], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "nfs.example.com:/mnt/storage/user1/linux.iso"]
         _, err = self.badfish_call()
@@ -537,7 +537,7 @@ class TestBootRemoteImage(TestBase):
         responses_get = [BLANK_RESP]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], "OK", True)
+        self.set_mock_response(mock_post, [200, 400], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "nfs.example.com:/mnt/storage/user1/linux.iso"]
         _, err = self.badfish_call()
@@ -550,7 +550,7 @@ class TestBootRemoteImage(TestBase):
         responses_get = [BLANK_RESP, VMEDIA_REMOTE_BOOT_TASK_FAILED_RESP]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], "OK", True)
+        self.set_mock_response(mock_post, [200, 202], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "nfs.example.com:/mnt/storage/user1/linux.iso"]
         _, err = self.badfish_call()
@@ -563,7 +563,7 @@ class TestBootRemoteImage(TestBase):
         responses_get = [BLANK_RESP, BLANK_RESP]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 202], "OK", True)
+        self.set_mock_response(mock_post, [200, 202], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg, "nfs.example.com:/mnt/storage/user1/linux.iso"]
         _, err = self.badfish_call()
@@ -579,7 +579,7 @@ class TestDetachRemoteImage(TestBase):
     def test_detach_os_deployment_not_supported(self, mock_get, mock_post, mock_delete):
         responses_get = [BLANK_RESP]
         responses = INIT_RESP + responses_get
-        self.set_mock_response(mock_get, [200, 200, 200, 200, 200, 404], responses)
+        self.set_mock_response(mock_get, [200] * 11 + [404], responses)
         self.set_mock_response(mock_post, 200, "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
@@ -606,7 +606,7 @@ class TestDetachRemoteImage(TestBase):
         responses_get = [BLANK_RESP]
         responses = INIT_RESP + responses_get
         self.set_mock_response(mock_get, 200, responses)
-        self.set_mock_response(mock_post, [200, 400], "OK", True)
+        self.set_mock_response(mock_post, [200, 400], "OK")
         self.set_mock_response(mock_delete, 200, "OK")
         self.args = [self.option_arg]
         _, err = self.badfish_call()